@@ -0,0 +1,5 @@
+"""Startup benchmarks on synthetic taew project trees.
+
+Run with ``python -m benchmarks run`` and compare two recordings with
+``python -m benchmarks compare baseline.json current.json``.
+"""
@@ -0,0 +1,80 @@
+"""Command line entry point: python -m benchmarks {run,compare}."""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+from collections.abc import Sequence
+
+from .tree import TreeShape, generate
+from .suite import CASES, Result, run
+from .results import compare, dump, format_comparisons, load
+
+
+def _shape(value: str) -> TreeShape:
+    try:
+        packages, modules, classes = (int(part) for part in value.split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NxMxK, got {value!r}")
+    return TreeShape(packages, modules, classes)
+
+
+def _run(args: argparse.Namespace) -> int:
+    results: list[Result] = []
+    for shape in args.shape or [TreeShape(4, 4, 2), TreeShape(16, 8, 4)]:
+        with tempfile.TemporaryDirectory() as folder:
+            root_path = Path(folder).resolve()
+            generate(root_path, shape)
+            for result in run(root_path, shape, args.case or CASES, args.repeat):
+                print(
+                    f"{result.name:<16} {str(shape):<10}"
+                    f" best {result.best * 1e3:8.2f}ms"
+                    f" median {result.median * 1e3:8.2f}ms"
+                )
+                results.append(result)
+    if args.output is not None:
+        dump(results, args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    comparisons = compare(load(args.baseline), load(args.current))
+    print(format_comparisons(comparisons, args.threshold))
+    return 1 if any(c.is_regression(args.threshold) for c in comparisons) else 0
+
+
+def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument(
+        "--shape",
+        type=_shape,
+        action="append",
+        help="tree shape NxMxK: packages x modules x classes (repeatable)",
+    )
+    run_parser.add_argument(
+        "--case", choices=sorted(CASES), action="append", help="case to run"
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--output", type=Path, help="JSON file to record to")
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = commands.add_parser("compare", help="compare two recordings")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    compare_parser.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
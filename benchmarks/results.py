@@ -0,0 +1,101 @@
+"""JSON recording and comparison of benchmark results."""
+
+import json
+import platform
+from pathlib import Path
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional
+
+from .suite import Result
+from .tree import TreeShape
+
+_FORMAT_VERSION = 1
+
+
+class Comparison(NamedTuple):
+    """Best-sample timings of one case and shape in two recordings."""
+
+    name: str
+    shape: TreeShape
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current over baseline time; above 1.0 is slower."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1.0 + threshold
+
+
+def dumps(results: Iterable[Result]) -> str:
+    """Serialize results with the interpreter they were measured on."""
+    return json.dumps(
+        {
+            "version": _FORMAT_VERSION,
+            "python": platform.python_version(),
+            "results": [result._asdict() for result in results],
+        },
+        indent=2,
+    )
+
+
+def loads(data: str) -> list[Result]:
+    """Deserialize results recorded with dumps().
+
+    Raises:
+        ValueError: If the recording format is not supported
+    """
+    recording: dict[str, Any] = json.loads(data)
+    if recording.get("version") != _FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark results version: {recording.get('version')}"
+        )
+    return [
+        Result(
+            item["name"],
+            TreeShape(*item["shape"]),
+            item["best"],
+            item["median"],
+            tuple(item["samples"]),
+        )
+        for item in recording["results"]
+    ]
+
+
+def dump(results: Iterable[Result], path: Path) -> None:
+    path.write_text(dumps(results))
+
+
+def load(path: Path) -> list[Result]:
+    return loads(path.read_text())
+
+
+def compare(baseline: Iterable[Result], current: Iterable[Result]) -> list[Comparison]:
+    """Pair results recorded for the same case and shape.
+
+    Cases or shapes present in only one of the recordings are skipped.
+    """
+    previous = {(r.name, r.shape): r for r in baseline}
+    return [
+        Comparison(r.name, r.shape, found.best, r.best)
+        for r in current
+        if (found := previous.get((r.name, r.shape))) is not None
+    ]
+
+
+def format_comparisons(
+    comparisons: Iterable[Comparison], threshold: Optional[float] = None
+) -> str:
+    """Render comparisons as a plain text table, flagging regressions."""
+    lines = [
+        f"{'case':<16} {'shape':<10} {'baseline':>10} {'current':>10} {'ratio':>7}"
+    ]
+    for c in comparisons:
+        flag = " !" if threshold is not None and c.is_regression(threshold) else ""
+        lines.append(
+            f"{c.name:<16} {str(c.shape):<10} {c.baseline * 1e3:>8.2f}ms"
+            f" {c.current * 1e3:>8.2f}ms {c.ratio:>7.2f}{flag}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+"""Benchmark cases for code tree navigation, binding and CLI help rendering.
+
+Every case runs against a generated synthetic project (see tree.py) with
+the synthetic modules purged and the bind Root cache cleared before each
+sample, so that every sample measures a cold start.
+"""
+
+import io
+import sys
+import time
+import statistics
+import contextlib
+import importlib
+from pathlib import Path
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple, cast
+
+from .tree import TreeShape, purge_modules
+from taew.ports.for_starting_programs import Main
+from taew.adapters.launch_time.for_binding_interfaces.bind import bind
+from taew.adapters.launch_time.for_binding_interfaces._imp import (
+    clear_port_module_cache,
+    clear_root_cache,
+)
+from taew.adapters.launch_time.for_binding_interfaces.create_instance import (
+    create_instance,
+)
+from taew.ports.for_browsing_code_tree import (
+    Class,
+    Module,
+    Package,
+    Root,
+    is_module,
+    is_package,
+)
+
+Case = Callable[[Path, TreeShape], object]
+
+
+class Result(NamedTuple):
+    """Timings of one benchmark case on one tree shape, in seconds."""
+
+    name: str
+    shape: TreeShape
+    best: float
+    median: float
+    samples: tuple[float, ...]
+
+
+def _walk(node: Root | Package | Module) -> int:
+    count = 0
+    for _, item in node.items():
+        count += 1
+        if is_package(item) or is_module(item):
+            count += _walk(item)
+    return count
+
+
+def navigate(root_path: Path, shape: TreeShape) -> object:
+    """Walk every package, module and module item of the project."""
+    from taew.adapters.python.inspect.for_browsing_code_tree.root import (
+        Root as RootAdapter,
+    )
+
+    root = RootAdapter(root_path)
+    return _walk(root["ports"]) + _walk(root["adapters"])  # type: ignore[arg-type]
+
+
+def _adapters() -> Any:
+    return importlib.import_module("configuration").adapters
+
+
+def bind_deep(root_path: Path, shape: TreeShape) -> object:
+    """Bind a port 0 interface, resolving a chain of N adapters."""
+    service = importlib.import_module("ports.for_p0").Service0
+    return bind(service, _adapters())(0)
+
+
+def instantiate(root_path: Path, shape: TreeShape) -> object:
+    """create_instance() of a port 0 adapter class found through the Root."""
+    from taew.adapters.python.inspect.for_browsing_code_tree.root import (
+        Root as RootAdapter,
+    )
+
+    root = RootAdapter(root_path)
+    package = cast(Package, root["adapters"]["ram"]["for_p0"])  # type: ignore[index]
+    adapter = cast(Class, cast(Module, package["service0"])["Service0"])
+    return create_instance(adapter, _adapters())
+
+
+def cli_help(root_path: Path, shape: TreeShape) -> object:
+    """Bind Main and render the top-level --help."""
+    main = bind(Main, _adapters())
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.suppress(SystemExit):
+        main(["bench", "--help"])
+    return output.getvalue()
+
+
+CASES: dict[str, Case] = {
+    "navigate": navigate,
+    "bind_deep": bind_deep,
+    "create_instance": instantiate,
+    "cli_help": cli_help,
+}
+
+
+def _reset() -> None:
+    purge_modules()
+    clear_root_cache()
+    # Port modules are cached by name and are re-imported after a purge
+    clear_port_module_cache()
+
+
+def run_case(name: str, root_path: Path, shape: TreeShape, repeat: int = 5) -> Result:
+    """Run one case repeat times, each from a cold start.
+
+    Args:
+        name: Case name, a key of CASES
+        root_path: Root of a project generated with tree.generate()
+        shape: Shape the project was generated with
+        repeat: Number of samples
+
+    Returns:
+        Result with the best and median sample
+    """
+    case = CASES[name]
+    samples: list[float] = []
+    sys.path.insert(0, str(root_path))
+    try:
+        for _ in range(repeat):
+            _reset()
+            started = time.perf_counter()
+            case(root_path, shape)
+            samples.append(time.perf_counter() - started)
+    finally:
+        sys.path.remove(str(root_path))
+        _reset()
+    return Result(name, shape, min(samples), statistics.median(samples), tuple(samples))
+
+
+def run(
+    root_path: Path, shape: TreeShape, names: Iterable[str], repeat: int = 5
+) -> list[Result]:
+    """Run the named cases against one generated project."""
+    return [run_case(name, root_path, shape, repeat) for name in names]
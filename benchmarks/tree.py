@@ -0,0 +1,170 @@
+"""Synthetic project tree generator.
+
+A generated project follows the layout of a taew application::
+
+    ports/for_p{i}.py                         M Protocols per port
+    adapters/ram/for_p{i}/__init__.py
+    adapters/ram/for_p{i}/for_configuring_adapters.py
+    adapters/ram/for_p{i}/service{j}.py       adapter class + K-1 helpers
+    adapters/cli/__init__.py
+    adapters/cli/service{j}.py                CLI command per Protocol of port 0
+    configuration.py
+
+The adapter of Service{j} in port i takes the Service{j} of port i + 1 as
+its constructor argument, so binding a port 0 interface resolves a chain
+of N adapters.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+from typing import NamedTuple
+
+TOP_LEVEL_PACKAGES = ("ports", "adapters", "configuration")
+
+
+class TreeShape(NamedTuple):
+    """Size of a synthetic project tree."""
+
+    packages: int  # N port packages (and adapter chain depth)
+    modules: int  # M modules (Protocols) per package
+    classes: int  # K classes per module
+
+    def __str__(self) -> str:
+        return f"{self.packages}x{self.modules}x{self.classes}"
+
+
+def _write(root: Path, name: str, content: str) -> None:
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _port_source(i: int, shape: TreeShape) -> str:
+    protocols = "".join(
+        textwrap.dedent(f'''
+
+        class Service{j}(Protocol):
+            """Service {j} of port {i}."""
+
+            def __call__(self, x: int) -> int:
+                """Apply the service.
+
+                Args:
+                    x: Value to transform
+                """
+                ...
+        ''')
+        for j in range(shape.modules)
+    )
+    return f'"""Port {i}."""\n\nfrom typing import Protocol\n{protocols}'
+
+
+def _adapter_source(i: int, j: int, shape: TreeShape) -> str:
+    helpers = "".join(
+        textwrap.dedent(f'''
+
+        class Helper{k}:
+            """Helper {k}."""
+
+            def __call__(self, x: int) -> int:
+                return x + {k}
+        ''')
+        for k in range(1, shape.classes)
+    )
+    if i + 1 < shape.packages:
+        imports = f"from ports.for_p{i + 1} import Service{j} as Next\n"
+        body = textwrap.dedent(f'''
+        @dataclass(eq=False, frozen=True)
+        class Service{j}:
+            """Adapter {j} of port {i}."""
+
+            _next: Next
+
+            def __call__(self, x: int) -> int:
+                return self._next(x) + 1
+        ''')
+    else:
+        imports = ""
+        body = textwrap.dedent(f'''
+        @dataclass(eq=False, frozen=True)
+        class Service{j}:
+            """Adapter {j} of port {i}."""
+
+            def __call__(self, x: int) -> int:
+                return x
+        ''')
+    return (
+        f'"""Adapters {j} of port {i}."""\n\n'
+        f"from dataclasses import dataclass\n{imports}\n{body}{helpers}"
+    )
+
+
+_CONFIGURE_SOURCE = """
+    from dataclasses import dataclass
+    from taew.adapters.python.dataclass.for_configuring_adapters import (
+        Configure as ConfigureBase,
+    )
+
+
+    @dataclass(eq=False, frozen=True)
+    class Configure(ConfigureBase):
+        _root_marker: str = "/adapters"
+        _ports: str = "ports"
+
+        def __post_init__(self) -> None:
+            object.__setattr__(self, "_package", __package__)
+            object.__setattr__(self, "_file", __file__)
+"""
+
+
+def _configuration_source(root: Path, shape: TreeShape) -> str:
+    imports = "".join(
+        f"from adapters.ram.for_p{i}.for_configuring_adapters import "
+        f"Configure as P{i}\n"
+        for i in range(shape.packages)
+    )
+    configs = ", ".join(f"P{i}()" for i in range(shape.packages))
+    return (
+        "from pathlib import Path\n"
+        "from taew.utils.cli import configure\n"
+        f"{imports}\n"
+        f"adapters = configure({configs}, root_path=Path({str(root)!r}))\n"
+    )
+
+
+def generate(root: Path, shape: TreeShape) -> None:
+    """Write a synthetic project of the given shape under root."""
+    _write(root, "ports/__init__.py", "")
+    _write(root, "adapters/__init__.py", "")
+    _write(root, "adapters/ram/__init__.py", "")
+    for i in range(shape.packages):
+        _write(root, f"ports/for_p{i}.py", _port_source(i, shape))
+        package = f"adapters/ram/for_p{i}"
+        _write(root, f"{package}/__init__.py", "")
+        _write(
+            root,
+            f"{package}/for_configuring_adapters.py",
+            textwrap.dedent(_CONFIGURE_SOURCE).lstrip(),
+        )
+        for j in range(shape.modules):
+            _write(root, f"{package}/service{j}.py", _adapter_source(i, j, shape))
+    _write(
+        root,
+        "adapters/cli/__init__.py",
+        '"""Synthetic benchmark application."""\n\n__version__ = "0.1.0"\n',
+    )
+    for j in range(shape.modules):
+        _write(
+            root,
+            f"adapters/cli/service{j}.py",
+            f'from ports.for_p0 import Service{j}\n\n__all__ = ["Service{j}"]\n',
+        )
+    _write(root, "configuration.py", _configuration_source(root, shape))
+
+
+def purge_modules() -> None:
+    """Forget imported synthetic modules so the next run imports them again."""
+    for name in list(sys.modules):
+        if name.partition(".")[0] in TOP_LEVEL_PACKAGES:
+            del sys.modules[name]
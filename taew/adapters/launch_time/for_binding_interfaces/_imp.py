@@ -142,6 +142,11 @@ def _get_cached_port_module(module_name: str) -> Any:
     return sys.modules[module_name]
 
 
+def clear_port_module_cache() -> None:
+    """Clear the port module cache. Needed after port modules are re-imported."""
+    _get_cached_port_module.cache_clear()
+
+
 def _return_for_binding_interfaces_ref(interface: Type[Any]) -> Any:
     """Return a reference to bind or create_instance for self-injection.
 
@@ -0,0 +1,189 @@
+"""Structural Protocol implementer queries over the AST code tree index.
+
+Candidates are shortlisted from the public member names and arities that
+index_tree() records for every class, following base classes that are
+themselves indexed. Only the shortlisted candidates are imported and
+verified against the Protocol at runtime.
+"""
+
+from __future__ import annotations
+import sys
+import typing
+import inspect
+import importlib
+from functools import cache
+from typing import Any, Optional
+
+from .index import Index
+from .module import Arity
+
+# Bases that contribute no Protocol members to a class
+_NEUTRAL_BASES = {"object", "abc.ABC"}
+
+Members = dict[str, Optional[Arity]]
+
+
+def _signature_arity(func: Any, bound: bool) -> Optional[Arity]:
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    if bound and parameters:
+        parameters = parameters[1:]
+    positional = [
+        p for p in parameters if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    var_positional = any(p.kind == p.VAR_POSITIONAL for p in parameters)
+    return Arity(
+        sum(1 for p in positional if p.default is p.empty),
+        None if var_positional else len(positional),
+    )
+
+
+def _runtime_member(owner: type, name: str) -> tuple[bool, Optional[Arity]]:
+    """Return (present, arity) of a member looked up on a class at runtime.
+
+    Only the class MRO is searched, so members of the metaclass (such as
+    type.__call__) do not count as instance members.
+    """
+    for klass in owner.__mro__[:-1]:
+        if name in vars(klass):
+            static = vars(klass)[name]
+            break
+    else:
+        annotated = any(name in inspect.get_annotations(k) for k in owner.__mro__)
+        return annotated, None
+    if isinstance(static, staticmethod):
+        return True, _signature_arity(static.__func__, bound=False)
+    if isinstance(static, classmethod):
+        return True, _signature_arity(static.__func__, bound=True)
+    if inspect.isfunction(static):
+        return True, _signature_arity(static, bound=True)
+    return True, None
+
+
+def protocol_members(protocol: type) -> Members:
+    """Return the members of a Protocol with method arities excluding self."""
+    return {
+        name: _runtime_member(protocol, name)[1]
+        for name in sorted(typing.get_protocol_members(protocol))
+    }
+
+
+def _is_compatible(required: Members, provided: Members) -> bool:
+    for name, arity in required.items():
+        if name not in provided:
+            return False
+        if arity is not None and (found := provided[name]) is not None:
+            if not found.accepts(arity):
+                return False
+    return True
+
+
+@cache
+def _stdlib_class(dotted: str) -> Optional[type]:
+    """Import a standard library base class, None if it is not one."""
+    module_name, _, class_name = dotted.rpartition(".")
+    module_name = module_name or "builtins"
+    if module_name.partition(".")[0] not in sys.stdlib_module_names:
+        return None
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        return None
+    return cls if isinstance(cls, type) else None
+
+
+def _collect_members(
+    index: Index, name: str, required: Members, seen: set[str]
+) -> tuple[Members, bool]:
+    """Return the members of an indexed class and whether all bases are known.
+
+    Indexed bases are followed through the index; standard library bases are
+    inspected for the required member names only.
+    """
+    entry = index[name]
+    members: Members = {}
+    closed = True
+    for base in entry.bases:
+        if base in seen or base in _NEUTRAL_BASES or base.startswith("typing."):
+            continue
+        seen.add(base)
+        if (base_entry := index.get(base)) is not None and base_entry.kind == "class":
+            base_members, base_closed = _collect_members(index, base, required, seen)
+            members.update(base_members)
+            closed = closed and base_closed
+        elif (cls := _stdlib_class(base)) is not None:
+            for member in required:
+                present, arity = _runtime_member(cls, member)
+                if present:
+                    members[member] = arity
+        else:
+            closed = False
+    members.update(entry.members)
+    return members, closed
+
+
+def _is_protocol_class(index: Index, name: str) -> bool:
+    return any(
+        base in ("typing.Protocol", "typing_extensions.Protocol")
+        for base in index[name].bases
+    )
+
+
+def candidates(index: Index, protocol: type) -> list[str]:
+    """Shortlist classes that may structurally implement a Protocol.
+
+    A class is shortlisted when the members it defines, together with those
+    of its indexed and standard library bases, cover every Protocol member
+    with compatible arities, or when it has other unknown bases that might
+    supply the missing members.
+
+    Args:
+        index: Code tree index produced by index_tree()
+        protocol: Protocol type, typically from taew.ports
+
+    Returns:
+        Dotted names of candidate classes, sorted
+    """
+    required = protocol_members(protocol)
+    shortlisted: list[str] = []
+    for name, entry in index.items():
+        if entry.kind != "class" or _is_protocol_class(index, name):
+            continue
+        provided, closed = _collect_members(index, name, required, {name})
+        if _is_compatible(required, provided) or (
+            not closed and _is_compatible(required, required | provided)
+        ):
+            shortlisted.append(name)
+    return sorted(shortlisted)
+
+
+def _verify(dotted: str, required: Members) -> bool:
+    module_name, _, class_name = dotted.rpartition(".")
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except Exception:
+        return False
+    if not isinstance(cls, type) or typing.is_protocol(cls):
+        return False
+    provided: Members = {}
+    for name in required:
+        present, arity = _runtime_member(cls, name)
+        if present:
+            provided[name] = arity
+    return _is_compatible(required, provided)
+
+
+def find_implementers(index: Index, protocol: type) -> list[str]:
+    """Return classes implementing a Protocol, importing only candidates.
+
+    Args:
+        index: Code tree index produced by index_tree()
+        protocol: Protocol type, typically from taew.ports
+
+    Returns:
+        Dotted names of verified implementer classes, sorted
+    """
+    required = protocol_members(protocol)
+    return [name for name in candidates(index, protocol) if _verify(name, required)]
@@ -0,0 +1,153 @@
+"""Parallel whole-tree indexing over AST-parsed modules.
+
+Walks a source tree with the same package/module conventions as the path
+Folder, then parses modules and extracts their metadata in a process pool.
+Results are merged into a single index keyed by dotted name, e.g.
+``pkg``, ``pkg.mod``, ``pkg.mod.func`` and ``pkg.mod.Class``.
+"""
+
+from __future__ import annotations
+import os
+import time
+from pathlib import Path
+from collections.abc import Callable, Iterator
+from typing import Literal, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from .module import Arity, Module, Function
+
+EntryKind = Literal["package", "module", "class", "function"]
+
+
+class IndexEntry(NamedTuple):
+    """Metadata recorded for a single dotted name."""
+
+    kind: EntryKind
+    description: str
+    path: str
+    version: str = ""
+    arguments: tuple[str, ...] = ()
+    bases: tuple[str, ...] = ()
+    members: tuple[tuple[str, Optional[Arity]], ...] = ()
+
+
+class Progress(NamedTuple):
+    """Indexing progress reported after each parsed module."""
+
+    done: int
+    total: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Modules parsed per second so far."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+Index = dict[str, IndexEntry]
+ProgressCallback = Callable[[Progress], None]
+
+
+def _is_public(path: Path) -> bool:
+    return not path.name.startswith(("_", "."))
+
+
+def _collect(folder: Path, prefix: str, index: Index) -> Iterator[tuple[str, str]]:
+    """Yield (path, dotted name) of modules to parse, recording bare packages."""
+    for path in sorted(folder.iterdir()):
+        if path.is_dir() and _is_public(path):
+            dotted = f"{prefix}.{path.name}" if prefix else path.name
+            init_path = path / "__init__.py"
+            if init_path.exists():
+                yield str(init_path), dotted
+            else:
+                index[dotted] = IndexEntry("package", "", str(path))
+            yield from _collect(path, dotted, index)
+        elif path.suffix == ".py" and _is_public(path):
+            yield str(path), f"{prefix}.{path.stem}" if prefix else path.stem
+
+
+def _index_module(source: tuple[str, str]) -> list[tuple[str, IndexEntry]]:
+    """Parse one module and return its index entries (runs in worker processes)."""
+    path, dotted = source
+    module = Module.from_path(Path(path))
+    is_package = path.endswith("__init__.py")
+    entries = [
+        (
+            dotted,
+            IndexEntry(
+                "package" if is_package else "module",
+                module.description,
+                path,
+                module.version if is_package else "",
+            ),
+        )
+    ]
+    imports = module.imports(dotted if is_package else dotted.rpartition(".")[0])
+    items = list(module.items())
+    local = {name for name, _ in items}
+
+    def _qualify(base: str) -> str:
+        head, dot, rest = base.partition(".")
+        if head in imports:
+            return f"{imports[head]}{dot}{rest}"
+        return f"{dotted}.{base}" if head in local else base
+
+    for name, item in items:
+        if isinstance(item, Function):
+            entry = IndexEntry("function", item.description, path, "", item.arguments)
+        else:
+            entry = IndexEntry(
+                "class",
+                item.description,
+                path,
+                bases=tuple(_qualify(base) for base in item.bases),
+                members=item.members,
+            )
+        entries.append((f"{dotted}.{name}", entry))
+    return entries
+
+
+def index_tree(
+    root_path: Path,
+    *,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> Index:
+    """Index every public package, module, class and function under root_path.
+
+    Module parsing and metadata extraction are distributed across a
+    ProcessPoolExecutor; modules are submitted in chunks so that per-task
+    overhead stays small relative to parsing.
+
+    Args:
+        root_path: Root directory of the source tree
+        max_workers: Worker process count (default: os.process_cpu_count());
+                     1 parses in the calling process
+        progress: Optional callback receiving a Progress after each module
+
+    Returns:
+        Index mapping dotted names to IndexEntry
+
+    Raises:
+        SyntaxError: If a module cannot be parsed
+    """
+    index: Index = {}
+    sources = list(_collect(root_path, "", index))
+    workers = max_workers or os.process_cpu_count() or 1
+    started = time.perf_counter()
+
+    def _merge(results: Iterator[list[tuple[str, IndexEntry]]]) -> None:
+        for done, entries in enumerate(results, 1):
+            index.update(entries)
+            if progress is not None:
+                elapsed = time.perf_counter() - started
+                progress(Progress(done, len(sources), elapsed))
+
+    if workers == 1 or len(sources) < 2:
+        _merge(map(_index_module, sources))
+    else:
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _merge(executor.map(_index_module, sources, chunksize=chunksize))
+    return index
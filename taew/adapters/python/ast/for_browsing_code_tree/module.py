@@ -1,16 +1,84 @@
 from __future__ import annotations
+import re
 import ast
 from pathlib import Path
+from collections.abc import Iterable
+from typing import NamedTuple, Optional, Pattern
+
+_PRIVATE_MEMBER_PATTERN: Pattern[str] = re.compile(r"^_[^_].*|^__(?!.*__$).*")
+_ATTRIBUTE_DECORATORS = {"property", "cached_property"}
+
+
+class Arity(NamedTuple):
+    """Positional argument counts accepted by a callable."""
+
+    required: int
+    maximum: Optional[int]  # None when *args is accepted
+
+    def accepts(self, other: Arity) -> bool:
+        """Returns True if every call valid for other is also valid for self."""
+        return self.required <= other.required and (
+            self.maximum is None
+            or (other.maximum is not None and self.maximum >= other.maximum)
+        )
+
+
+def _decorator_name(node: ast.expr) -> str:
+    match node:
+        case ast.Name(id=name) | ast.Attribute(attr=name):
+            return name
+        case ast.Call(func=func):
+            return _decorator_name(func)
+        case _:
+            return ""
+
+
+def dotted_name(node: ast.expr) -> str:
+    """Return the dotted name of a (possibly subscripted) name expression."""
+    match node:
+        case ast.Name(id=name):
+            return name
+        case ast.Attribute(value=value, attr=attr):
+            prefix = dotted_name(value)
+            return f"{prefix}.{attr}" if prefix else ""
+        case ast.Subscript(value=value):
+            return dotted_name(value)
+        case _:
+            return ""
 
 
 class Function:
-    def __init__(self, node: ast.FunctionDef) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
         self._node = node
 
     @property
     def description(self) -> str:
         return ast.get_docstring(self._node) or ""
 
+    @property
+    def arguments(self) -> tuple[str, ...]:
+        args = self._node.args
+        names = [a.arg for a in (*args.posonlyargs, *args.args)]
+        if args.vararg is not None:
+            names.append(args.vararg.arg)
+        names.extend(a.arg for a in args.kwonlyargs)
+        if args.kwarg is not None:
+            names.append(args.kwarg.arg)
+        return tuple(names)
+
+    @property
+    def arity(self) -> Arity:
+        args = self._node.args
+        positional = len(args.posonlyargs) + len(args.args)
+        return Arity(
+            positional - len(args.defaults),
+            None if args.vararg is not None else positional,
+        )
+
+    @property
+    def decorators(self) -> tuple[str, ...]:
+        return tuple(_decorator_name(d) for d in self._node.decorator_list)
+
 
 class Class:
     def __init__(self, node: ast.ClassDef) -> None:
@@ -20,6 +88,48 @@ class Class:
     def description(self) -> str:
         return ast.get_docstring(self._node) or ""
 
+    @property
+    def bases(self) -> tuple[str, ...]:
+        """Dotted names of base classes as written in the source."""
+        return tuple(name for b in self._node.bases if (name := dotted_name(b)))
+
+    @property
+    def members(self) -> tuple[tuple[str, Optional[Arity]], ...]:
+        """Public members defined in the class body.
+
+        Methods are reported with their arity excluding self/cls;
+        attributes, properties and fields are reported with None.
+        """
+        members: dict[str, Optional[Arity]] = {}
+        for node in self._node.body:
+            match node:
+                case ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name):
+                    func = Function(node)
+                    decorators = set(func.decorators)
+                    if decorators & _ATTRIBUTE_DECORATORS:
+                        members[name] = None
+                    elif "staticmethod" in decorators:
+                        members[name] = func.arity
+                    else:
+                        required, maximum = func.arity
+                        members[name] = Arity(
+                            max(required - 1, 0),
+                            None if maximum is None else max(maximum - 1, 0),
+                        )
+                case ast.AnnAssign(target=ast.Name(id=name)):
+                    members[name] = None
+                case ast.Assign(targets=targets):
+                    for target in targets:
+                        if isinstance(target, ast.Name):
+                            members[target.id] = None
+                case _:
+                    continue
+        return tuple(
+            (name, arity)
+            for name, arity in members.items()
+            if not _PRIVATE_MEMBER_PATTERN.match(name)
+        )
+
 
 class Module:
     def __init__(self, tree: ast.Module) -> None:
@@ -34,6 +144,13 @@ class Module:
         except Exception as e:
             raise SyntaxError(f"Failed to parse module at {path}: {e}") from e
 
+    @staticmethod
+    def from_source(source: str | bytes, origin: str) -> Module:
+        try:
+            return Module(ast.parse(source))
+        except Exception as e:
+            raise SyntaxError(f"Failed to parse module at {origin}: {e}") from e
+
     @property
     def description(self) -> str:
         return ast.get_docstring(self._tree) or ""
@@ -54,7 +171,9 @@ class Module:
     def __getitem__(self, key: str) -> Function | Class:
         for node in self._tree.body:
             match node:
-                case ast.FunctionDef(name=name) if name == key:
+                case ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name) if (
+                    name == key
+                ):
                     return Function(node)
                 case ast.ClassDef(name=name) if name == key:
                     return Class(node)
@@ -62,12 +181,63 @@ class Module:
                     continue
         raise KeyError(key)
 
-    def __bool__(self) -> bool:
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def imports(self, package: str) -> dict[str, str]:
+        """Map names bound by top-level imports to their qualified dotted names.
+
+        Args:
+            package: Dotted name of the package containing this module,
+                     used to resolve relative imports
+        """
+        names: dict[str, str] = {}
         for node in self._tree.body:
             match node:
-                case ast.FunctionDef(name=name) | ast.ClassDef(name=name) if (
+                case ast.Import(names=aliases):
+                    for alias in aliases:
+                        if alias.asname is not None:
+                            names[alias.asname] = alias.name
+                        else:
+                            head = alias.name.partition(".")[0]
+                            names[head] = head
+                case ast.ImportFrom(module=module, names=aliases, level=level):
+                    if level:
+                        parts = package.split(".")
+                        base = ".".join(parts[: len(parts) - level + 1])
+                        source = f"{base}.{module}" if module else base
+                    else:
+                        source = module or ""
+                    for alias in aliases:
+                        names[alias.asname or alias.name] = f"{source}.{alias.name}"
+                case _:
+                    continue
+        return names
+
+    def items(self) -> Iterable[tuple[str, Function | Class]]:
+        for node in self._tree.body:
+            match node:
+                case ast.FunctionDef(name=name) | ast.AsyncFunctionDef(name=name) if (
                     not name.startswith("_")
                 ):
+                    yield name, Function(node)
+                case ast.ClassDef(name=name) if not name.startswith("_"):
+                    yield name, Class(node)
+                case _:
+                    continue
+
+    def __bool__(self) -> bool:
+        for node in self._tree.body:
+            match node:
+                case (
+                    ast.FunctionDef(name=name)
+                    | ast.AsyncFunctionDef(name=name)
+                    | ast.ClassDef(name=name)
+                ) if not name.startswith("_"):
                     return True
                 case ast.Assign(targets=[ast.Name(id="__all__")]):
                     return True
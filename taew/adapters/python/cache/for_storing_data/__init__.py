@@ -0,0 +1 @@
+# Empty __init__.py - adapters are imported directly from their modules
@@ -0,0 +1,81 @@
+"""Eviction policies of the caching repository adapters.
+
+A policy tracks the cached keys and picks the next one to evict. Recording
+a hit is O(1) for both policies.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Literal
+
+Eviction = Literal["lru", "lfu"]
+
+
+class LRU:
+    """Evicts the least recently used key."""
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[Hashable, None] = OrderedDict()
+
+    def add(self, key: Hashable) -> None:
+        self._order[key] = None
+
+    def touch(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        del self._order[key]
+
+    def victim(self) -> Hashable:
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LFU:
+    """Evicts the least frequently used key, the least recent among equals.
+
+    Keys are kept in per-frequency buckets ordered by last use.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[Hashable, int] = {}
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min = 0
+
+    def _unlink(self, key: Hashable, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def add(self, key: Hashable) -> None:
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min = 1
+
+    def touch(self, key: Hashable) -> None:
+        count = self._counts[key]
+        self._unlink(key, count)
+        if self._min == count and count not in self._buckets:
+            self._min = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        self._unlink(key, self._counts.pop(key))
+
+    def victim(self) -> Hashable:
+        if self._min not in self._buckets:
+            # Only after remove() emptied the lowest bucket
+            self._min = min(self._buckets)
+        return next(iter(self._buckets[self._min]))
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min = 0
+
+
+POLICIES: dict[Eviction, type[LRU] | type[LFU]] = {"lru": LRU, "lfu": LFU}
@@ -0,0 +1,188 @@
+"""Caching DataRepository implementation.
+
+Provides a read-through cache of deserialized values in front of any
+DataRepository adapter.
+"""
+
+import sys
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast
+
+from taew.domain.query import Where
+from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from ._policies import POLICIES, LFU, LRU, Eviction
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# (value, weight in bytes, backend version or None)
+Entry = tuple[object, int, Optional[tuple[int, int]]]
+
+
+@dataclass(eq=False, frozen=True)
+class DataRepository(DataRepositoryProtocol[K, V]):
+    """Read-through caching data repository.
+
+    __getitem__ serves values from an in-memory cache, reading and caching
+    them from the wrapped repository on a miss. The cache is bounded by
+    entry count and total weight, evicting by the _eviction policy. len(),
+    iteration, queries and membership of missing keys go to the wrapped
+    repository.
+
+    Repositories that provide version(key) -> (mtime_ns, size), as the dir
+    adapter does, are asked for it on every miss once _validate is set or
+    _max_bytes is bounded. With _validate, a hit is served only while the
+    version is unchanged, so changes by other writers are picked up at the
+    cost of one stat per hit instead of a read and deserialize. The stored
+    size is then the weight of the entry; otherwise it is sys.getsizeof of
+    the value, which does not count the objects the value refers to.
+
+    Attributes:
+        _repository: Wrapped repository
+        _max_entries: Maximum number of cached values, None for no bound
+        _max_bytes: Maximum total weight of cached values, None for no bound
+        _eviction: Eviction policy - "lru" or "lfu"
+        _validate: Check the version of the stored value on every hit
+    """
+
+    _repository: DataRepositoryProtocol[K, V]
+    _max_entries: Optional[int] = DEFAULT_MAX_ENTRIES
+    _max_bytes: Optional[int] = None
+    _eviction: Eviction = "lru"
+    _validate: bool = False
+    _entries: dict[Hashable, Entry] = field(init=False, default_factory=dict)
+    _policy: LRU | LFU = field(init=False)
+    _version: Optional[Callable[[Any], tuple[int, int]]] = field(init=False)
+    _bytes: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration.
+
+        Raises:
+            ValueError: If the eviction policy is unknown, or validation is
+                        requested for a repository without version()
+        """
+        if self._eviction not in POLICIES:
+            raise ValueError(f"Unknown eviction policy: '{self._eviction}'")
+        object.__setattr__(self, "_policy", POLICIES[self._eviction]())
+        version = getattr(self._repository, "version", None)
+        if self._validate and version is None:
+            raise ValueError(
+                f"{type(self._repository).__name__} does not provide version()"
+            )
+        if not self._validate and self._max_bytes is None:
+            version = None
+        object.__setattr__(self, "_version", version)
+
+    def __len__(self) -> int:
+        """Return number of items in the wrapped repository."""
+        return len(self._repository)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys of the wrapped repository."""
+        return iter(self._repository)
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key, from the cache when possible.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, _, cached_version = entry
+            if not self._validate or self._current_version(key) == cached_version:
+                self._policy.touch(key)
+                return cast(V, value)
+            self._discard(key)
+        # Taken before reading, so a concurrent write shows as a stale version
+        version = self._current_version(key) if self._version else None
+        value = self._repository[key]
+        if self._version is None:
+            self._store(key, value, sys.getsizeof(value), None)
+        elif version is not None:
+            self._store(key, value, version[1], version)
+        return value
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of the stored keys among keys.
+
+        Cached values are served from the cache. Without versions to take,
+        the missing ones are read with a single get_many of the wrapped
+        repository and cached; otherwise they are read one by one.
+        """
+        found: dict[K, V] = {}
+        misses: list[K] = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and not self._validate:
+                self._policy.touch(key)
+                found[key] = cast(V, entry[0])
+            else:
+                misses.append(key)
+        if self._version is None:
+            for key, value in self._repository.get_many(misses).items():
+                self._store(key, value, sys.getsizeof(value), None)
+                found[key] = value
+            return found
+        for key in misses:
+            try:
+                found[key] = self[key]
+            except KeyError:
+                continue
+        return found
+
+    def query(
+        self,
+        *,
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
+        sort_key: Optional[Callable[[V], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterable[V]:
+        """Query the wrapped repository, which may use its indexes."""
+        return self._repository.query(
+            filter_fn=filter_fn,
+            where=where,
+            sort_key=sort_key,
+            reverse=reverse,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _current_version(self, key: K) -> Optional[tuple[int, int]]:
+        try:
+            return self._version(key)  # type: ignore[misc]
+        except KeyError:
+            return None  # not stored (yet), never cached
+
+    def _store(
+        self, key: K, value: object, weight: int, version: Optional[tuple[int, int]]
+    ) -> None:
+        if self._max_bytes is not None and weight > self._max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (value, weight, version)
+        self._policy.add(key)
+        object.__setattr__(self, "_bytes", self._bytes + weight)
+        while (
+            self._max_entries is not None and len(self._entries) > self._max_entries
+        ) or (self._max_bytes is not None and self._bytes > self._max_bytes):
+            self._discard(self._policy.victim())
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._policy.remove(key)
+            object.__setattr__(self, "_bytes", self._bytes - entry[1])
+
+    def clear_cache(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
+        self._policy.clear()
+        object.__setattr__(self, "_bytes", 0)
@@ -0,0 +1,64 @@
+"""Configurator for caching storage adapters.
+
+Provides configuration support for both the caching DataRepository and
+MutableDataRepository implementations, wrapping the repository configured
+by a nested storage configurator.
+"""
+
+from typing import Optional
+from dataclasses import dataclass, field
+
+from taew.domain.configuration import PortsMapping
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+from .data_repository import DEFAULT_MAX_ENTRIES
+from ._policies import Eviction
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configurator for caching storage adapters.
+
+    Accepts the configurator of the wrapped repository (e.g. dir or mmap)
+    and provides its ports as nested ports, so caching is added to an
+    existing deployment by wrapping its storage configurator. Defers
+    _package and _file to application-level derived classes.
+
+    Attributes:
+        _repository: Configurator instance of the wrapped repository
+        _max_entries: Maximum number of cached values, None for no bound
+        _max_bytes: Maximum total weight of cached values, None for no bound
+        _eviction: Eviction policy - "lru" or "lfu"
+        _validate: Check the version of the stored value on every hit
+    """
+
+    _repository: ConfigureProtocol = field(kw_only=True)
+    _max_entries: Optional[int] = field(kw_only=True, default=DEFAULT_MAX_ENTRIES)
+    _max_bytes: Optional[int] = field(kw_only=True, default=None)
+    _eviction: Eviction = field(kw_only=True, default="lru")
+    _validate: bool = field(kw_only=True, default=False)
+    _ports: str = field(kw_only=True, default="ports")
+    _root_marker: str = field(kw_only=True, default="/adapters")
+
+    def _collect_kwargs(self) -> dict[str, object]:
+        """Collect kwargs for adapter instantiation.
+
+        Returns:
+            Dictionary of kwargs for caching adapters
+        """
+        return {
+            "_max_entries": self._max_entries,
+            "_max_bytes": self._max_bytes,
+            "_eviction": self._eviction,
+            "_validate": self._validate,
+        }
+
+    def _nested_ports(self) -> PortsMapping:
+        """Get nested ports from the wrapped repository configurator.
+
+        Returns:
+            PortsMapping containing the wrapped storage port configuration
+        """
+        return self._repository()
@@ -0,0 +1,80 @@
+"""Caching MutableDataRepository implementation.
+
+Provides a read-through cache of deserialized values in front of any
+MutableDataRepository adapter.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Optional, Self, TypeVar
+
+from taew.ports.for_storing_data import (
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from .data_repository import DataRepository
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(eq=False, frozen=True)
+class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[K, V]):
+    """Read-through caching mutable data repository.
+
+    Writes and deletes go to the wrapped repository and drop the cached
+    value of the key; the next read caches the value as stored. A with
+    block enters the wrapped repository's context, and the whole cache is
+    dropped if the block raises, since the wrapped repository may have
+    discarded changes that were read through the cache.
+
+    Attributes:
+        _repository: Wrapped mutable repository
+    """
+
+    _repository: MutableDataRepositoryProtocol[K, V]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Store value under key in the wrapped repository."""
+        self._discard(key)
+        self._repository[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        """Delete item by key from the wrapped repository.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        self._discard(key)
+        del self._repository[key]
+
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values with a single set_many of the wrapped repository."""
+        items = dict(items)
+        for key in items:
+            self._discard(key)
+        self._repository.set_many(items)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys with a single delete_many of the wrapped repository."""
+        keys = list(keys)
+        for key in keys:
+            self._discard(key)
+        self._repository.delete_many(keys)
+
+    def __enter__(self) -> Self:
+        """Enter the context of the wrapped repository."""
+        self._repository.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Exit the context of the wrapped repository."""
+        try:
+            self._repository.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            if exc_type is not None:
+                self.clear_cache()
@@ -0,0 +1 @@
+"""dbm adapter."""
@@ -0,0 +1,79 @@
+"""Database and value helpers shared by the dbm storage adapters.
+
+A new database is created, by the mutable adapter only, with the first
+available backend of BACKENDS or the configured one; an existing
+database is opened with the backend that created it. Keys are stored as
+UTF-8 encoded str(key), and values as marshaled by the configured
+serialization adapters, UTF-8 encoded for stringizing (text) adapters.
+"""
+
+import dbm
+import importlib
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from taew.adapters.python.dir.for_storing_data._common import (
+    Durability,
+    Marshal,
+    Mode,
+    Unmarshal,
+    detect_mode,
+    make_sort,
+)
+
+__all__ = [
+    "BACKENDS",
+    "Durability",
+    "Marshal",
+    "Mode",
+    "Unmarshal",
+    "decode",
+    "detect_mode",
+    "encode",
+    "make_sort",
+    "open_database",
+]
+
+# Backends for new databases, by preference
+BACKENDS = ("dbm.sqlite3", "dbm.gnu", "dbm.dumb")
+
+
+def open_database(
+    path: Path, flag: Literal["r", "w"], backend: Optional[str] = None
+) -> Any:
+    """Open the database at path, creating it if missing and writable.
+
+    Args:
+        path: Database path, without the suffixes some backends add
+        flag: "r" for read-only, "w" for read-write access
+        backend: Module of the backend for a new database, None for the
+                 first available of BACKENDS
+
+    Raises:
+        ValueError: If backend is not one of BACKENDS
+        FileNotFoundError: If flag is "r" and there is no database at path
+        ImportError: If no requested backend is available
+    """
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(f"Unknown dbm backend: '{backend}'")
+    if dbm.whichdb(str(path)):
+        return dbm.open(str(path), flag)
+    if flag == "r":
+        raise FileNotFoundError(f"No dbm database at '{path}'")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for name in (backend,) if backend is not None else BACKENDS:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        return module.open(str(path), "c")
+    raise ImportError(f"No dbm backend available among {backend or BACKENDS}")
+
+
+def encode(value: object, marshal: Marshal) -> bytes:
+    data = marshal(value)
+    return data if isinstance(data, bytes) else data.encode()
+
+
+def decode(data: bytes, mode: Mode, unmarshal: Unmarshal) -> object:
+    return unmarshal(data if mode == "b" else data.decode())  # type: ignore[arg-type]
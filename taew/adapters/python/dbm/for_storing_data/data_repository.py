@@ -0,0 +1,171 @@
+"""dbm-based DataRepository implementation.
+
+Provides read-only key-value storage backed by a dbm database file.
+"""
+
+from pathlib import Path
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Literal,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from taew.domain.query import Where
+from taew.utils.indexes import Indexes, select
+from taew.utils.external_sort import DEFAULT_THRESHOLD, ExternalSort
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from ._common import (
+    Mode,
+    Unmarshal,
+    decode,
+    detect_mode,
+    make_sort,
+    open_database,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(eq=False, frozen=True)
+class DataRepository(DataRepositoryProtocol[K, V]):
+    """dbm database read-only data repository.
+
+    Implements DataRepository protocol over a single dbm database mapping
+    str(key) to the serialized value, so millions of small values take
+    one file rather than one file each. Supports both binary (streaming)
+    and text (stringizing) serialization formats.
+
+    Attributes:
+        _folder: Directory path of the database
+        _deserialize: Tuple of (unmarshaler, type) for deserialization
+        _key_type: Function to convert string to key type
+        _name: Database file name, without the suffixes some backends add
+        _backend: Backend module for a new database ("dbm.sqlite3",
+                  "dbm.gnu" or "dbm.dumb"), None for the first available
+        _indexes: Value fields to keep secondary indexes on; they are built
+                  by reading every value on the first query naming them, and
+                  kept up to date by writes through this instance only
+        _sort_threshold: Number of values a query sorting without a limit
+                         sorts in memory before spilling sorted runs to
+                         temporary files; None always sorts in memory
+        _sort_folder: Directory for the spilled runs, None for the system
+                      temporary directory
+        _sort_serialization: Tuple of (serializer, deserializer) of the
+                             spilled runs; None for the serialization of
+                             the mutable adapter, or pickle. Keyword only,
+                             it is not set by Configure
+    """
+
+    _folder: Path
+    _deserialize: tuple[Unmarshal, type]
+    _key_type: Callable[[str], K]
+    _name: str = "repository"
+    _backend: Optional[str] = None
+    _indexes: tuple[str, ...] = ()
+    _sort_threshold: Optional[int] = DEFAULT_THRESHOLD
+    _sort_folder: Optional[Path] = None
+    _sort_serialization: Optional[tuple[SerializeProtocol, DeserializeProtocol]] = (
+        field(kw_only=True, default=None)
+    )
+    _unmarshal: Unmarshal = field(init=False)
+    _mode: Mode = field(init=False)
+    _sort: Optional[ExternalSort] = field(init=False)
+    _db: Any = field(init=False)
+    _secondary: Optional[Indexes] = field(init=False, default=None)
+    _flag: ClassVar[Literal["r", "w"]] = "r"
+
+    def __post_init__(self) -> None:
+        """Initialize configuration and open the database."""
+        unmarshal, type_ = self._deserialize
+        object.__setattr__(self, "_unmarshal", unmarshal)
+        object.__setattr__(self, "_mode", detect_mode(type_))
+        object.__setattr__(self, "_sort", self._make_sort())
+        object.__setattr__(
+            self,
+            "_db",
+            open_database(self._folder / self._name, self._flag, self._backend),
+        )
+
+    def _make_sort(self) -> Optional[ExternalSort]:
+        """Build the sort of queries sorting without a limit, see make_sort."""
+        return make_sort(
+            self._sort_threshold, self._sort_folder, self._sort_serialization
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def __len__(self) -> int:
+        """Return number of items in repository."""
+        return len(self._db)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over all keys."""
+        for name in self._db.keys():
+            yield self._key_type(name.decode())
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key is stored, without reading its value."""
+        return str(key).encode() in self._db
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        try:
+            data = self._db[str(key).encode()]
+        except KeyError:
+            raise KeyError(f"Item with key '{key}' not found")
+        return cast(V, decode(data, self._mode, self._unmarshal))
+
+    def _secondary_indexes(self) -> Indexes:
+        """Return the secondary indexes, building them on first use."""
+        if self._secondary is None:
+            indexes = Indexes(self._indexes)
+            # Stored values only, without changes pending in a subclass
+            for key in DataRepository.__iter__(self):
+                indexes.put(key, DataRepository.__getitem__(self, key))
+            object.__setattr__(self, "_secondary", indexes)
+        return cast(Indexes, self._secondary)
+
+    def _candidates(self, where: Where) -> Optional[Iterable[Any]]:
+        """Return keys that may satisfy where, or None to scan all keys."""
+        if not self._indexes or not any(name in where for name in self._indexes):
+            return None
+        return self._secondary_indexes().candidates(where)
+
+    def query(
+        self,
+        *,
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
+        sort_key: Optional[Callable[[V], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterable[V]:
+        """Query stored values, looking up indexed where fields."""
+        return select(
+            self,
+            self._candidates(where) if where else None,
+            filter_fn=filter_fn,
+            where=where,
+            sort_key=sort_key,
+            reverse=reverse,
+            limit=limit,
+            offset=offset,
+            sort=self._sort,
+        )
@@ -0,0 +1,76 @@
+"""Configurator for dbm-based storage adapters.
+
+Provides configuration support for the DataRepository implementations,
+supporting both binary (streaming) and text (stringizing) serialization
+formats. The configuration mirrors that of the dir adapters, so a
+repository moves between them by changing its Configure.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+
+from taew.domain.configuration import PortsMapping
+from taew.utils.external_sort import DEFAULT_THRESHOLD
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+from ._common import Durability
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configurator for dbm-based storage adapters.
+
+    Accepts a serialization configurator instance and provides nested ports
+    configuration. Defers _package and _file to application-level derived classes.
+
+    Attributes:
+        _folder: Directory path of the database
+        _serialization: Configurator instance for serialization (streaming or stringizing)
+        _key_type: Callable to convert string keys to the appropriate type
+        _name: Database file name, without the suffixes some backends add
+        _backend: Backend module for a new database, None for the first available
+        _durability: Flush policy of the mutable adapter - "none", "write" or "batch"
+        _indexes: Value fields to keep secondary indexes on
+        _sort_threshold: Values sorted in memory before spilling to disk, None for never
+        _sort_folder: Directory of spilled sort runs, None for the system default
+    """
+
+    _folder: Path = field(kw_only=True)
+    _serialization: ConfigureProtocol = field(kw_only=True)
+    _key_type: Callable[[str], Any] = field(kw_only=True, default=str)
+    _name: str = field(kw_only=True, default="repository")
+    _backend: Optional[str] = field(kw_only=True, default=None)
+    _durability: Durability = field(kw_only=True, default="none")
+    _indexes: tuple[str, ...] = field(kw_only=True, default=())
+    _sort_threshold: Optional[int] = field(kw_only=True, default=DEFAULT_THRESHOLD)
+    _sort_folder: Optional[Path] = field(kw_only=True, default=None)
+    _ports: str = field(kw_only=True, default="ports")
+    _root_marker: str = field(kw_only=True, default="/adapters")
+
+    def _collect_kwargs(self) -> dict[str, object]:
+        """Collect kwargs for adapter instantiation.
+
+        Returns:
+            Dictionary of kwargs for dbm-based adapters
+        """
+        return {
+            "_folder": self._folder,
+            "_key_type": self._key_type,
+            "_name": self._name,
+            "_backend": self._backend,
+            "_durability": self._durability,
+            "_indexes": self._indexes,
+            "_sort_threshold": self._sort_threshold,
+            "_sort_folder": self._sort_folder,
+        }
+
+    def _nested_ports(self) -> PortsMapping:
+        """Get nested ports from serialization configurator.
+
+        Returns:
+            PortsMapping containing serialization port configuration
+        """
+        return self._serialization()
@@ -0,0 +1,242 @@
+"""dbm-based MutableDataRepository implementation.
+
+Provides read-write key-value storage backed by a dbm database file.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Literal, Optional, Self, TypeVar, cast, get_args
+
+from taew.ports.for_storing_data import (
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from .data_repository import DataRepository
+from taew.domain.query import Where
+from taew.utils.external_sort import ExternalSort
+from ._common import Durability, Marshal, detect_mode, encode, make_sort
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Overlay marker of a key deleted in the transaction
+_DELETED = object()
+
+
+@dataclass(eq=False, frozen=True)
+class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[K, V]):
+    """dbm database mutable data repository.
+
+    Extends DataRepository with write operations. Supports both binary
+    (streaming) and text (stringizing) serialization formats.
+
+    _durability selects when the database is flushed to disk, for the
+    backends that buffer writes (dbm.gnu and dbm.dumb): "write" after
+    every write, "batch" on context exit, "none" when it is closed.
+
+    A with block is a transaction: writes and deletes are buffered in an
+    in-memory overlay seen by reads, and applied to the database on exit,
+    after all values are serialized. If the block raises, the overlay is
+    discarded and the database is left untouched. Nested blocks join the
+    outermost. set_many and delete_many apply their changes as one such
+    batch, or add them to the transaction in progress.
+
+    Attributes:
+        _serialize: Tuple of (marshaler, type) for serialization
+        _durability: Flush policy - "none", "write" or "batch"
+    """
+
+    _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _durability: Durability = "none"
+    _marshal: Marshal = field(init=False)
+    _pending: dict[str, object] = field(init=False, default_factory=dict)
+    _depth: int = field(init=False, default=0)
+    _flag: ClassVar[Literal["r", "w"]] = "w"
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration."""
+        if self._durability not in get_args(Durability):
+            raise ValueError(f"Unknown durability policy: '{self._durability}'")
+        super().__post_init__()
+        marshal, type_ = self._serialize
+        object.__setattr__(self, "_marshal", marshal)
+        # Verify that serialize and deserialize modes match
+        if detect_mode(type_) != self._mode:
+            raise ValueError("Serialize and deserialize protocol types must match")
+
+    def _make_sort(self) -> Optional[ExternalSort]:
+        """Spill sorted runs with the serialization of the values, by default."""
+        if self._sort_serialization is not None:
+            return super()._make_sort()
+        marshal, _ = self._serialize
+        return make_sort(
+            self._sort_threshold,
+            self._sort_folder,
+            (marshal, self._unmarshal),
+            self._mode,
+        )
+
+    def _sync(self) -> None:
+        sync = getattr(self._db, "sync", None)
+        if sync is not None:
+            sync()
+
+    def __len__(self) -> int:
+        """Return number of items in repository, including pending changes."""
+        count = super().__len__()
+        for name, value in list(self._pending.items()):
+            count += (value is not _DELETED) - (name.encode() in self._db)
+        return count
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over all keys, including pending changes."""
+        pending = dict(self._pending)
+        for key in super().__iter__():
+            if str(key) not in pending:
+                yield key
+        for name, value in pending.items():
+            if value is not _DELETED:
+                yield self._key_type(name)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key is stored, as changed in the transaction."""
+        name = str(key)
+        if name in self._pending:
+            return self._pending[name] is not _DELETED
+        return super().__contains__(key)
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key, as changed in the transaction.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        name = str(key)
+        if name not in self._pending:
+            return super().__getitem__(key)
+        value = self._pending[name]
+        if value is _DELETED:
+            raise KeyError(f"Item with key '{key}' not found")
+        return cast(V, value)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Store value under key.
+
+        Args:
+            key: The key to store under
+            value: The value to store
+        """
+        if self._depth:
+            self._pending[str(key)] = value
+            return
+        self._db[str(key).encode()] = encode(value, self._marshal)
+        if self._durability == "write":
+            self._sync()
+        if self._secondary is not None:
+            self._secondary.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        """Delete item by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        name = str(key)
+        if self._depth:
+            if name in self._pending:
+                found = self._pending[name] is not _DELETED
+            else:
+                found = name.encode() in self._db
+            if not found:
+                raise KeyError(f"Key '{key}' not found")
+            self._pending[name] = _DELETED
+            return
+        try:
+            del self._db[name.encode()]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found")
+        if self._durability == "write":
+            self._sync()
+        if self._secondary is not None:
+            self._secondary.discard(key)
+
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values as one batch, serialized before any is written.
+
+        Args:
+            items: Mapping or iterable of (key, value) pairs to store
+        """
+        pending: dict[str, object] = {
+            str(key): value for key, value in dict(items).items()
+        }
+        if self._depth:
+            self._pending.update(pending)
+        else:
+            self._apply(pending)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys as one batch, ignoring keys that are not stored.
+
+        Args:
+            keys: Keys to delete
+        """
+        pending = {str(key): _DELETED for key in keys}
+        if self._depth:
+            self._pending.update(pending)
+        else:
+            self._apply(pending)
+
+    def _apply(self, pending: dict[str, object]) -> None:
+        """Write out the changes of a committed transaction or batch."""
+        writes = {
+            name.encode(): encode(value, self._marshal)
+            for name, value in pending.items()
+            if value is not _DELETED
+        }
+        for encoded, data in writes.items():
+            self._db[encoded] = data
+        for name, value in pending.items():
+            if value is _DELETED:
+                try:
+                    del self._db[name.encode()]
+                except KeyError:
+                    pass
+        if self._durability != "none":
+            self._sync()
+        if self._secondary is not None:
+            for name, value in pending.items():
+                if value is _DELETED:
+                    self._secondary.discard(self._key_type(name))
+                else:
+                    self._secondary.put(self._key_type(name), value)
+
+    def _candidates(self, where: Where) -> Optional[Iterable[Any]]:
+        """Return keys that may satisfy where, including pending changes."""
+        keys = super()._candidates(where)
+        if keys is None or not self._pending:
+            return keys
+        return set(keys) | {self._key_type(name) for name in self._pending}
+
+    def __enter__(self) -> Self:
+        """Start a transaction, or join the one in progress."""
+        object.__setattr__(self, "_depth", self._depth + 1)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Commit the transaction, or discard it if the block raised.
+
+        Writes of a "batch" durability repository are flushed on return.
+        """
+        object.__setattr__(self, "_depth", self._depth - 1)
+        if self._depth:
+            return
+        pending = dict(self._pending)
+        self._pending.clear()
+        if exc_type is None:
+            self._apply(pending)
+        elif self._durability == "batch":
+            self._sync()
@@ -3,12 +3,30 @@
 This module provides shared functionality for reading and writing files
 in both binary and text modes, supporting both streaming and stringizing
 serialization strategies.
+
+Values are written to a temporary file next to the target and moved over
+it with os.replace, so readers see either the old or the new value, never
+a partly written one. Whether a crash can leave a truncated value depends
+on the durability policy, see Writer.
+
+Data files are stored directly in the repository folder, or spread over
+a tree of shard folders named by prefixes of a hash of the key, see
+make_path.
 """
 
+import os
 import re
+import hashlib
+import threading
 from pathlib import Path
-from typing import Final, Literal, Pattern
+from collections.abc import Iterator
+from typing import Final, Literal, Optional, Pattern, cast, get_args
 
+from taew.utils.external_sort import ExternalSort
+from taew.adapters.python.pickle.for_serializing_objects.serialize import Serialize
+from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+    Deserialize,
+)
 from taew.ports.for_stringizing_objects import Loads as LoadsProtocol
 from taew.ports.for_stringizing_objects import Dumps as DumpsProtocol
 from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
@@ -18,10 +36,16 @@ from taew.ports.for_serializing_objects import Deserialize as DeserializeProtoco
 Mode = Literal["b", "t"]
 Marshal = SerializeProtocol | DumpsProtocol
 Unmarshal = DeserializeProtocol | LoadsProtocol
+Durability = Literal["none", "write", "batch"]
 
 _EXTENSION_PATTERN: Final[Pattern[str]] = re.compile(r"^[a-zA-Z0-9_]+$")
 _KEY_PATTERN: Final[Pattern[str]] = re.compile(r"^[a-zA-Z0-9_\-]+$")
 
+# Hex digits of the key hash available to shard folder names, and the
+# most taken by one level (65536 folders)
+_SHARD_DIGITS: Final = 16
+_SHARD_LEVEL_DIGITS: Final = 4
+
 
 def detect_mode(type_: type) -> Mode:
     """Detect file mode based on protocol type.
@@ -70,13 +94,57 @@ def validate_key(name: str) -> None:
         raise ValueError(f"Invalid key format: '{name}'")
 
 
-def make_path(folder: Path, name: str, extension: str) -> Path:
+def validate_shards(shards: tuple[int, ...]) -> None:
+    """Validate shard fan-out levels.
+
+    Args:
+        shards: Hex digits of the key hash naming the shard folder of
+                each level
+
+    Raises:
+        ValueError: If a level is out of range or the levels take more
+                    digits than the hash has
+    """
+    if any(not 1 <= digits <= _SHARD_LEVEL_DIGITS for digits in shards):
+        raise ValueError(
+            f"Shard levels must take 1 to {_SHARD_LEVEL_DIGITS} digits: {shards}"
+        )
+    if sum(shards) > _SHARD_DIGITS:
+        raise ValueError(f"Shard levels take more than {_SHARD_DIGITS} digits")
+
+
+def shard_folders(name: str, shards: tuple[int, ...]) -> list[str]:
+    """Return the shard folder names of key name, outermost first.
+
+    Args:
+        name: Key name
+        shards: Hex digits of the key hash naming the folder of each level
+    """
+    digest = hashlib.blake2b(name.encode(), digest_size=8).hexdigest()
+    folders = []
+    start = 0
+    for digits in shards:
+        folders.append(digest[start : start + digits])
+        start += digits
+    return folders
+
+
+def make_path(
+    folder: Path, name: str, extension: str, shards: tuple[int, ...] = ()
+) -> Path:
     """Construct file path from folder, name, and extension.
 
+    With shards the file is placed in nested shard folders, one per level,
+    named by consecutive hex digits of a hash of name: shards=(2, 2) puts
+    key "a" in folder/40/f8/a.ext, spreading keys over 65536 folders. The
+    hash is stable across processes and Python versions.
+
     Args:
         folder: Directory containing the file
         name: File name (without extension)
         extension: File extension (without dot)
+        shards: Hex digits naming the shard folder of each level, () for
+                a flat layout
 
     Returns:
         Complete file path
@@ -86,7 +154,90 @@ def make_path(folder: Path, name: str, extension: str) -> Path:
     """
     validate_extension(extension)
     validate_key(name)
-    return folder / f"{name}.{extension}"
+    return folder.joinpath(*shard_folders(name, shards), f"{name}.{extension}")
+
+
+def scan_names(
+    folder: Path, extension: str, shards: tuple[int, ...] = ()
+) -> Iterator[str]:
+    """Yield the key names of the data files of a repository folder.
+
+    A sharded folder is walked shard by shard, in folder name order, so
+    that no directory listing holds more than one shard. Files left in
+    the folder itself by a flat layout not yet migrated (see migrate) are
+    yielded last, unless already present in their shard.
+
+    Args:
+        folder: Repository folder
+        extension: File extension of the data files
+        shards: Hex digits naming the shard folder of each level
+    """
+    if shards:
+        yield from _scan_shards(folder, f".{extension}", shards)
+    for file in folder.glob(f"*.{extension}"):
+        name = file.stem
+        if not shards:
+            yield name
+        elif _KEY_PATTERN.match(name):
+            if not make_path(folder, name, extension, shards).exists():
+                yield name
+
+
+def _scan_shards(folder: Path, suffix: str, shards: tuple[int, ...]) -> Iterator[str]:
+    try:
+        entries = sorted(os.scandir(folder), key=lambda entry: entry.name)
+    except FileNotFoundError:
+        return  # removed while scanning
+    for entry in entries:
+        name = entry.name
+        if not shards:
+            if name.endswith(suffix) and not name.startswith("."):
+                yield name[: -len(suffix)]
+        elif len(name) == shards[0] and entry.is_dir():
+            yield from _scan_shards(Path(entry.path), suffix, shards[1:])
+
+
+def make_sort(
+    threshold: Optional[int],
+    folder: Optional[Path],
+    serialization: Optional[tuple[Marshal, Unmarshal]] = None,
+    mode: Mode = "b",
+) -> Optional[ExternalSort]:
+    """Build the sort of queries sorting without a limit.
+
+    Args:
+        threshold: Number of values sorted in memory before sorted runs
+                   are spilled to temporary files, None to always sort in
+                   memory
+        folder: Directory for the run files, None for the system default
+        serialization: Tuple of (marshaler, unmarshaler) of the spilled
+                       values, None for pickle
+        mode: 'b' for a binary serialization, 't' for a text one, whose
+              values are spilled UTF-8 encoded
+
+    Returns:
+        External merge sort, or None for the in-memory sort
+
+    Raises:
+        ValueError: If threshold is not positive
+    """
+    if threshold is None:
+        return None
+    if serialization is None:
+        return ExternalSort(Serialize(), Deserialize(), threshold, folder)
+    marshal, unmarshal = serialization
+    if mode == "b":
+        serialize = cast(SerializeProtocol, marshal)
+        deserialize = cast(DeserializeProtocol, unmarshal)
+        return ExternalSort(serialize, deserialize, threshold, folder)
+    dumps = cast(DumpsProtocol, marshal)
+    loads = cast(LoadsProtocol, unmarshal)
+    return ExternalSort(
+        lambda value: dumps(value).encode(),
+        lambda buf: loads(buf.decode()),
+        threshold,
+        folder,
+    )
 
 
 def read_value(path: Path, mode: Mode, unmarshal: Unmarshal) -> object:
@@ -106,17 +257,120 @@ def read_value(path: Path, mode: Mode, unmarshal: Unmarshal) -> object:
         return unmarshal(data)  # type: ignore[operator]
 
 
-def write_value(path: Path, value: object, mode: Mode, marshal: Marshal) -> None:
-    """Serialize and write value to file.
+def _temporary_path(path: Path) -> Path:
+    """Return a hidden sibling of path unique to the calling thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def sync_path(path: Path) -> None:
+    """Flush a file or directory to disk.
+
+    Args:
+        path: File or directory to fsync
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_data(
+    path: Path, data: str | bytes, mode: Mode, *, sync: bool = False
+) -> None:
+    """Atomically write serialized data to file.
+
+    The data is written to a temporary file which then replaces path.
+    The parent folder is created only when the temporary file cannot be
+    opened, so writes into an existing folder pay no existence check.
+
+    Args:
+        path: Path to file to write
+        data: Serialized value, bytes for binary and str for text mode
+        mode: File mode - 'b' for binary, 't' for text
+        sync: Fsync the file before replacing path with it
+    """
+    temporary = _temporary_path(path)
+    open_mode = f"w{mode}"
+    try:
+        f = open(temporary, open_mode)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(temporary, open_mode)
+    try:
+        with f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def write_value(
+    path: Path, value: object, mode: Mode, marshal: Marshal, *, sync: bool = False
+) -> None:
+    """Serialize and atomically write value to file, see write_data.
 
     Args:
         path: Path to file to write
         value: Object to serialize and write
         mode: File mode - 'b' for binary, 't' for text
         marshal: Callable to serialize data (Write or Dumps protocol)
+        sync: Fsync the file before replacing path with it
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    open_mode = f"w{mode}"
-    with open(path, open_mode) as f:
-        data = marshal(value)  # type: ignore[operator]
-        f.write(data)  # type: ignore[arg-type]
+    data = marshal(value)  # type: ignore[operator]
+    write_data(path, data, mode, sync=sync)
+
+
+class Writer:
+    """Writes values atomically under a durability policy.
+
+    Policies:
+        none: Rely on the OS to write data back; a crash may lose recent
+              writes, and may leave an empty or truncated file in place of
+              a value, as the rename can reach the disk before the data
+        write: Fsync every file before it replaces the target, and its
+               folder after, before the write returns
+        batch: Fsync every file before it replaces the target, and each
+               changed folder once on sync(), called by the mutable
+               adapters once a change is written out: at the end of a
+               transaction, a bulk operation or a write outside both
+
+    With "write" and "batch" a crash leaves either the old or the new value.
+    With "batch" every value written since the last sync() is durable once
+    sync() returns, at the cost of one folder fsync per changed folder
+    rather than one per write.
+    """
+
+    def __init__(self, durability: Durability = "none") -> None:
+        if durability not in get_args(Durability):
+            raise ValueError(f"Unknown durability policy: '{durability}'")
+        self._durability = durability
+        self._folders: set[Path] = set()
+
+    def write(self, path: Path, data: str | bytes, mode: Mode) -> None:
+        """Atomically write serialized data to path, see write_data."""
+        write_data(path, data, mode, sync=self._durability != "none")
+        if self._durability == "write":
+            sync_path(path.parent)
+        elif self._durability == "batch":
+            self._folders.add(path.parent)
+
+    def changed(self, folder: Path) -> None:
+        """Record that entries of folder were removed or renamed."""
+        if self._durability == "write":
+            sync_path(folder)
+        elif self._durability == "batch":
+            self._folders.add(folder)
+
+    def sync(self) -> None:
+        """Fsync the folders changed since the last sync, once each."""
+        folders, self._folders = self._folders, set()
+        for folder in folders:
+            try:
+                sync_path(folder)
+            except FileNotFoundError:
+                pass  # removed since, nothing left to make durable
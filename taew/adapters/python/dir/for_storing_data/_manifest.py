@@ -0,0 +1,145 @@
+"""Key index (manifest) of a directory-based data repository.
+
+The manifest is an append-only log of "+key" and "-key" lines stored in
+the repository folder next to the data files, mirrored in memory. Its name
+starts with a dot, so it never matches a valid key. The mirror is trusted
+while neither the folder nor the manifest changed since it was loaded;
+if the folder changed after the manifest was last written (files added or
+removed by someone else), the manifest is rebuilt from a directory scan.
+
+Only the repository folder itself is watched, so the manifest serves flat
+layouts only; sharded repositories reject it.
+"""
+
+import os
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from ._common import scan_names, write_data
+
+# (folder mtime, manifest mtime) in nanoseconds, -1 for a missing manifest
+Stamp = tuple[int, int]
+
+_COMPACT_SLACK = 64
+
+
+@dataclass(eq=False)
+class Manifest:
+    """In-memory mirror of the key index file of a repository folder.
+
+    Attributes:
+        _folder: Directory holding the data files
+        _extension: File extension of the data files
+    """
+
+    _folder: Path
+    _extension: str
+    _keys: dict[str, None] = field(init=False, default_factory=dict)
+    _stamp: Optional[Stamp] = field(init=False, default=None)
+    _stale: bool = field(init=False, default=False)
+
+    @property
+    def path(self) -> Path:
+        return self._folder / f".manifest-{self._extension}"
+
+    def _current_stamp(self) -> Optional[Stamp]:
+        try:
+            folder_mtime = self._folder.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        try:
+            return folder_mtime, self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return folder_mtime, -1
+
+    def refresh(self) -> dict[str, None]:
+        """Return the keys, reloading or rebuilding the manifest if needed.
+
+        Call before changing the folder, so that the change itself is not
+        mistaken for an external one.
+
+        Returns:
+            Keys in insertion order, as a dict used as an ordered set
+        """
+        stamp = self._current_stamp()
+        if stamp is None:
+            self._keys, self._stamp, self._stale = {}, None, False
+        elif stamp != self._stamp or self._stale:
+            folder_mtime, manifest_mtime = stamp
+            if manifest_mtime >= folder_mtime and not self._stale:
+                self._load()
+            else:
+                self._rebuild()
+        return self._keys
+
+    def invalidate(self) -> None:
+        """Force a rebuild from a directory scan on the next refresh."""
+        self._stale = True
+
+    def add(self, key: str) -> None:
+        """Record a key whose file was just written."""
+        self.update((key,), ())
+
+    def remove(self, key: str) -> None:
+        """Record a key whose file was just deleted."""
+        self.update((), (key,))
+
+    def update(self, added: Iterable[str], removed: Iterable[str]) -> None:
+        """Record keys whose files were just written or deleted.
+
+        All changed keys are appended to the manifest in a single write.
+        """
+        lines = []
+        for key in added:
+            if key not in self._keys:
+                self._keys[key] = None
+                lines.append(f"+{key}\n")
+        for key in removed:
+            if key in self._keys:
+                del self._keys[key]
+                lines.append(f"-{key}\n")
+        if lines:
+            self._append("".join(lines))
+        self._sync()
+
+    def _load(self) -> None:
+        keys: dict[str, None] = {}
+        lines = 0
+        with open(self.path, "rt") as f:
+            for line in f:
+                lines += 1
+                key = line[1:].rstrip("\n")
+                if line.startswith("+"):
+                    keys[key] = None
+                else:
+                    keys.pop(key, None)
+        self._keys = keys
+        if lines > 2 * len(keys) + _COMPACT_SLACK:
+            self._write()
+        self._stamp = self._current_stamp()
+
+    def _rebuild(self) -> None:
+        self._keys = dict.fromkeys(scan_names(self._folder, self._extension))
+        self._write()
+        self._stale = False
+        self._stamp = self._current_stamp()
+
+    def _write(self) -> None:
+        # Replaced rather than rewritten, so that a crash cannot leave a
+        # truncated manifest; the replacement changes the folder mtime, so
+        # the manifest is touched afterwards not to look outdated
+        write_data(self.path, "".join(f"+{key}\n" for key in self._keys), "t")
+        os.utime(self.path)
+
+    def _append(self, line: str) -> None:
+        with open(self.path, "at") as f:
+            f.write(line)
+
+    def _sync(self) -> None:
+        stamp = self._current_stamp()
+        if stamp is not None and 0 <= stamp[1] < stamp[0]:
+            # Folder changed without a key change, e.g. a file replaced
+            os.utime(self.path)
+            stamp = self._current_stamp()
+        self._stamp = stamp
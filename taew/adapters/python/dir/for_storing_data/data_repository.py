@@ -5,22 +5,37 @@ Provides read-only key-value storage backed by directory structure.
 
 from pathlib import Path
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, TypeVar, cast
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast
 
+from taew.domain.query import Where
+from taew.utils.indexes import Indexes, select
+from taew.utils.external_sort import DEFAULT_THRESHOLD, ExternalSort
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
 from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from ._manifest import Manifest
 from ._common import (
     Mode,
     Unmarshal,
     detect_mode,
     make_path,
+    make_sort,
     read_value,
+    scan_names,
     validate_extension,
     validate_key,
+    validate_shards,
 )
 
 K = TypeVar("K")
 V = TypeVar("V")
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Marker of a file found missing by a bulk read
+_MISSING = object()
 
 
 @dataclass(eq=False, frozen=True)
@@ -37,21 +52,70 @@ class DataRepository(DataRepositoryProtocol[K, V]):
         _mode: File mode - 'b' for binary, 't' for text
         _deserialize: Tuple of (type, unmarshaler) for deserialization
         _key_type: Function to convert string to key type
+        _manifest: Keep a key index file so that len() and key iteration
+                   do not scan the folder; flat layouts only
+        _indexes: Value fields to keep secondary indexes on; they are built
+                  by reading every value on the first query naming them, and
+                  kept up to date by writes through this instance only
+        _sort_threshold: Number of values a query sorting without a limit
+                         sorts in memory before spilling sorted runs to
+                         temporary files; None always sorts in memory
+        _sort_folder: Directory for the spilled runs, None for the system
+                      temporary directory
+        _sort_serialization: Tuple of (serializer, deserializer) of the
+                             spilled runs; None for the serialization of
+                             the mutable adapter, or pickle. Keyword only,
+                             it is not set by Configure
+        _workers: Number of threads reading (and, for the mutable adapter,
+                  writing) the files of bulk operations; 1 for none
+        _shards: Hex digits of the key hash naming the shard folder of each
+                 level, see make_path; () keeps all files in _folder. Keys
+                 of a flat folder being migrated are found at either place.
+                 Cannot be combined with _manifest
     """
 
     _folder: Path
     _extension: str
     _deserialize: tuple[Unmarshal, type]
     _key_type: Callable[[str], K]
+    _manifest: bool = False
+    _indexes: tuple[str, ...] = ()
+    _sort_threshold: Optional[int] = DEFAULT_THRESHOLD
+    _sort_folder: Optional[Path] = None
+    _sort_serialization: Optional[tuple[SerializeProtocol, DeserializeProtocol]] = (
+        field(kw_only=True, default=None)
+    )
+    _workers: int = 1
+    _shards: tuple[int, ...] = ()
     _unmarshal: Unmarshal = field(init=False)
     _mode: Mode = field(init=False)
+    _sort: Optional[ExternalSort] = field(init=False)
+    _index: Optional[Manifest] = field(init=False)
+    _secondary: Optional[Indexes] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         """Initialize and validate configuration."""
         validate_extension(self._extension)
+        validate_shards(self._shards)
+        if self._workers < 1:
+            raise ValueError("Number of workers must be positive")
+        if self._manifest and self._shards:
+            raise ValueError("Manifest is not supported with shards")
         unmarshal, type_ = self._deserialize
         object.__setattr__(self, "_unmarshal", unmarshal)
         object.__setattr__(self, "_mode", detect_mode(type_))
+        object.__setattr__(self, "_sort", self._make_sort())
+        object.__setattr__(
+            self,
+            "_index",
+            (Manifest(self._folder, self._extension) if self._manifest else None),
+        )
+
+    def _make_sort(self) -> Optional[ExternalSort]:
+        """Build the sort of queries sorting without a limit, see make_sort."""
+        return make_sort(
+            self._sort_threshold, self._sort_folder, self._sort_serialization
+        )
 
     def _make_path(self, key: K) -> Path:
         """Construct the file path for a given key.
@@ -63,7 +127,19 @@ class DataRepository(DataRepositoryProtocol[K, V]):
             Path to file corresponding to key
         """
         validate_key(str(key))
-        return make_path(self._folder, str(key), self._extension)
+        return make_path(self._folder, str(key), self._extension, self._shards)
+
+    def _candidate_paths(self, path: Path) -> tuple[Path, ...]:
+        """Return the places to look for the file at path, in order.
+
+        A sharded key may still be in _folder, where migrate has not moved
+        it yet. As migrate links a file into its shard before unlinking it
+        from _folder, looking in the shard again after _folder cannot miss
+        a file moved in between.
+        """
+        if not self._shards:
+            return (path,)
+        return path, self._folder / path.name, path
 
     def __len__(self) -> int:
         """Return number of items in repository.
@@ -71,16 +147,39 @@ class DataRepository(DataRepositoryProtocol[K, V]):
         Returns:
             Count of stored items
         """
-        return sum(1 for _ in self._folder.glob(f"*.{self._extension}"))
+        if self._index is not None:
+            return len(self._index.refresh())
+        return sum(1 for _ in scan_names(self._folder, self._extension, self._shards))
 
     def __iter__(self) -> Iterator[K]:
-        """Iterate over all keys.
+        """Iterate over all keys, shard by shard in a sharded layout.
 
         Returns:
             Iterator over keys in the repository
         """
-        for file in self._folder.glob(f"*.{self._extension}"):
-            yield (self._key_type(file.stem))  # type: ignore[misc]
+        if self._index is not None:
+            for name in list(self._index.refresh()):
+                yield self._key_type(name)
+            return
+        for name in scan_names(self._folder, self._extension, self._shards):
+            yield self._key_type(name)
+
+    def version(self, key: K) -> tuple[int, int]:
+        """Return the (mtime in nanoseconds, size) of the file of key.
+
+        Changes whenever the file is written, so callers holding a value
+        can tell whether it is still current without reading the file.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        for path in self._candidate_paths(self._make_path(key)):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            return stat.st_mtime_ns, stat.st_size
+        raise KeyError(f"Item with key '{key}' not found")
 
     def __getitem__(self, key: K) -> V:
         """Retrieve value by key.
@@ -94,8 +193,87 @@ class DataRepository(DataRepositoryProtocol[K, V]):
         Raises:
             KeyError: If key does not exist
         """
-        file_path = self._make_path(key)
-        if not file_path.exists():
+        value = self._read(self._make_path(key))
+        if value is _MISSING:
+            if self._index is not None:
+                self._index.invalidate()
             raise KeyError(f"Item with key '{key}' not found")
+        return cast(V, value)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of the stored keys among keys.
+
+        All keys are validated before any file is read. Files are then
+        read in name order, without the existence check of __getitem__,
+        by _workers threads.
+
+        Returns:
+            Dictionary of the stored keys to their values, in name order
+        """
+        named = sorted({str(key): key for key in keys}.items())
+        paths = [self._make_path(key) for _, key in named]
+        values = self._map(self._read, paths)
+        found = {key: value for (_, key), value in zip(named, values)}
+        for key, value in list(found.items()):
+            if value is _MISSING:
+                del found[key]
+        if len(found) < len(named) and self._index is not None:
+            self._index.invalidate()
+        return cast(dict[K, V], found)
+
+    def _read(self, path: Path) -> object:
+        for candidate in self._candidate_paths(path):
+            try:
+                return read_value(candidate, self._mode, self._unmarshal)
+            except FileNotFoundError:
+                continue
+        return _MISSING
+
+    def _map(self, fn: Callable[[T], R], items: list[T]) -> list[R]:
+        """Apply fn to items, by _workers threads when there are several."""
+        if self._workers == 1 or len(items) < 2:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(min(self._workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def _secondary_indexes(self) -> Indexes:
+        """Return the secondary indexes, building them on first use."""
+        if self._secondary is None:
+            indexes = Indexes(self._indexes)
+            # Stored values only, without changes pending in a subclass
+            for key in DataRepository.__iter__(self):
+                try:
+                    indexes.put(key, DataRepository.__getitem__(self, key))
+                except KeyError:
+                    continue  # removed while scanning
+            object.__setattr__(self, "_secondary", indexes)
+        return cast(Indexes, self._secondary)
+
+    def _candidates(self, where: Where) -> Optional[Iterable[Any]]:
+        """Return keys that may satisfy where, or None to scan all keys."""
+        if not self._indexes or not any(name in where for name in self._indexes):
+            return None
+        return self._secondary_indexes().candidates(where)
 
-        return cast(V, read_value(file_path, self._mode, self._unmarshal))
+    def query(
+        self,
+        *,
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
+        sort_key: Optional[Callable[[V], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterable[V]:
+        """Query stored values, looking up indexed where fields."""
+        return select(
+            self,
+            self._candidates(where) if where else None,
+            filter_fn=filter_fn,
+            where=where,
+            sort_key=sort_key,
+            reverse=reverse,
+            limit=limit,
+            offset=offset,
+            sort=self._sort,
+        )
@@ -6,14 +6,16 @@ serialization formats.
 """
 
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 
 from taew.domain.configuration import PortsMapping
+from taew.utils.external_sort import DEFAULT_THRESHOLD
 from taew.adapters.python.dataclass.for_configuring_adapters import (
     Configure as ConfigureBase,
 )
 from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+from ._common import Durability
 
 
 @dataclass(eq=False, frozen=True)
@@ -28,6 +30,13 @@ class Configure(ConfigureBase):
         _extension: File extension for data files
         _serialization: Configurator instance for serialization (streaming or stringizing)
         _key_type: Callable to convert string keys to the appropriate type (for repositories)
+        _manifest: Keep a key index file for O(1) len() and scan-free key iteration
+        _durability: Fsync policy of the mutable adapters - "none", "write" or "batch"
+        _indexes: Value fields to keep secondary indexes on (for repositories)
+        _sort_threshold: Values sorted in memory before spilling to disk, None for never (for repositories)
+        _sort_folder: Directory of spilled sort runs, None for the system default (for repositories)
+        _workers: Threads doing the file I/O of bulk operations (for repositories)
+        _shards: Hash-prefix fan-out levels of the data files (for repositories)
         _marker: Path marker for root detection (set to "/adapters" for application-level use)
     """
 
@@ -35,6 +44,13 @@ class Configure(ConfigureBase):
     _extension: str = field(kw_only=True)
     _serialization: ConfigureProtocol = field(kw_only=True)
     _key_type: Callable[[str], Any] = field(kw_only=True, default=str)
+    _manifest: bool = field(kw_only=True, default=False)
+    _durability: Durability = field(kw_only=True, default="none")
+    _indexes: tuple[str, ...] = field(kw_only=True, default=())
+    _sort_threshold: Optional[int] = field(kw_only=True, default=DEFAULT_THRESHOLD)
+    _sort_folder: Optional[Path] = field(kw_only=True, default=None)
+    _workers: int = field(kw_only=True, default=1)
+    _shards: tuple[int, ...] = field(kw_only=True, default=())
     _ports: str = field(kw_only=True, default="ports")
     _root_marker: str = field(kw_only=True, default="/adapters")
 
@@ -48,6 +64,13 @@ class Configure(ConfigureBase):
             "_folder": self._folder,
             "_extension": self._extension,
             "_key_type": self._key_type,
+            "_manifest": self._manifest,
+            "_durability": self._durability,
+            "_indexes": self._indexes,
+            "_sort_threshold": self._sort_threshold,
+            "_sort_folder": self._sort_folder,
+            "_workers": self._workers,
+            "_shards": self._shards,
         }
 
     def _nested_ports(self) -> PortsMapping:
@@ -0,0 +1,77 @@
+"""Migration of directory-based repositories to a sharded layout.
+
+Converts a repository folder holding all data files directly (the flat
+layout) into the shard folder tree of a sharded one, see make_path. The
+migration is online: repositories configured with the target _shards
+keep reading and writing the folder while it runs, finding each key in
+its shard or, until moved, in the folder itself.
+"""
+
+import os
+from pathlib import Path
+
+from ._common import (
+    make_path,
+    validate_extension,
+    validate_key,
+    validate_shards,
+)
+
+
+def migrate(folder: Path, extension: str, shards: tuple[int, ...]) -> int:
+    """Move the data files of a flat repository folder into shard folders.
+
+    Each file is hard linked into its shard and then unlinked from folder,
+    so it is always found at one of the two places. A file already present
+    in its shard was written there since the migration started and is
+    kept, the stale flat copy being dropped. Interrupted migrations are
+    resumed by running migrate again.
+
+    Writers must use the sharded layout while the migration runs; the
+    folder and its shards must be on a filesystem supporting hard links.
+
+    Args:
+        folder: Repository folder
+        extension: File extension of the data files
+        shards: Hex digits of the key hash naming the shard folder of
+                each level
+
+    Returns:
+        Number of files moved
+
+    Raises:
+        ValueError: If extension or shards are invalid, or shards is empty
+    """
+    validate_extension(extension)
+    validate_shards(shards)
+    if not shards:
+        raise ValueError("Migration requires at least one shard level")
+    moved = 0
+    for source in folder.glob(f"*.{extension}"):
+        try:
+            validate_key(source.stem)
+        except ValueError:
+            continue  # not a data file
+        target = make_path(folder, source.stem, extension, shards)
+        moved += _move(source, target)
+    return moved
+
+
+def _move(source: Path, target: Path) -> bool:
+    """Link source at target unless target exists, then unlink source."""
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        pass  # written to its shard since, source is stale
+    except FileNotFoundError:
+        if not source.exists():
+            return False  # deleted since listed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            return False
+    source.unlink(missing_ok=True)
+    return True
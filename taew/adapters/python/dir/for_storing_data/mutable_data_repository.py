@@ -3,18 +3,33 @@
 Provides read-write key-value storage backed by directory structure.
 """
 
-from typing import TypeVar
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Self, TypeVar, cast
 
 from taew.ports.for_storing_data import (
     MutableDataRepository as MutableDataRepositoryProtocol,
 )
 from .data_repository import DataRepository
-from ._common import Marshal, write_value, detect_mode
+from taew.domain.query import Where
+from taew.utils.external_sort import ExternalSort
+from ._common import (
+    Durability,
+    Marshal,
+    Writer,
+    detect_mode,
+    make_path,
+    make_sort,
+    validate_key,
+)
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+# Overlay marker of a key deleted in the transaction
+_DELETED = object()
+
 
 @dataclass(eq=False, frozen=True)
 class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[K, V]):
@@ -23,22 +38,116 @@ class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[
     Extends DataRepository with write operations. Supports both binary
     (streaming) and text (stringizing) serialization formats.
 
+    Values are replaced atomically; _durability selects what is fsynced,
+    with "batch" deferring folder fsyncs to the end of a transaction or
+    bulk operation, see Writer. Every change is durable on return from the
+    call that writes it out.
+
+    A with block is a transaction: writes and deletes are buffered in an
+    in-memory overlay seen by reads, and applied to the folder on exit,
+    after all values are serialized. If the block raises, the overlay is
+    discarded and the folder is left untouched. Nested blocks join the
+    outermost.
+
+    set_many and delete_many apply their changes as one such batch, or add
+    them to the transaction in progress.
+
     Attributes:
         _serialize: Tuple of (type, marshaler) for serialization
+        _durability: Fsync policy - "none", "write" or "batch"
     """
 
     _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _durability: Durability = "none"
     _marshal: Marshal = field(init=False)
+    _writer: Writer = field(init=False)
+    _pending: dict[str, object] = field(init=False, default_factory=dict)
+    _depth: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         """Initialize and validate configuration."""
         super().__post_init__()
         marshal, type_ = self._serialize
         object.__setattr__(self, "_marshal", marshal)
+        object.__setattr__(self, "_writer", Writer(self._durability))
         # Verify that serialize and deserialize modes match
         if detect_mode(type_) != self._mode:
             raise ValueError("Serialize and deserialize protocol types must match")
 
+    def _make_sort(self) -> Optional[ExternalSort]:
+        """Spill sorted runs with the serialization of the values, by default."""
+        if self._sort_serialization is not None:
+            return super()._make_sort()
+        marshal, _ = self._serialize
+        return make_sort(
+            self._sort_threshold,
+            self._sort_folder,
+            (marshal, self._unmarshal),
+            self._mode,
+        )
+
+    def _stored(self, name: str) -> bool:
+        """Whether the folder holds a value for key name."""
+        if self._index is not None:
+            return name in self._index.refresh()
+        path = make_path(self._folder, name, self._extension, self._shards)
+        return any(path.exists() for path in self._candidate_paths(path))
+
+    def __len__(self) -> int:
+        """Return number of items in repository, including pending changes."""
+        count = super().__len__()
+        for name, value in list(self._pending.items()):
+            count += (value is not _DELETED) - self._stored(name)
+        return count
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over all keys, including pending changes."""
+        pending = dict(self._pending)
+        for key in super().__iter__():
+            if str(key) not in pending:
+                yield key
+        for name, value in pending.items():
+            if value is not _DELETED:
+                yield self._key_type(name)
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key, as changed in the transaction.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        name = str(key)
+        if name not in self._pending:
+            return super().__getitem__(key)
+        value = self._pending[name]
+        if value is _DELETED:
+            raise KeyError(f"Item with key '{key}' not found")
+        return cast(V, value)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of keys as changed in the transaction.
+
+        See DataRepository.get_many.
+        """
+        keys = list(keys)
+        pending = dict(self._pending)
+        found = super().get_many(key for key in keys if str(key) not in pending)
+        for key in keys:
+            value = pending.get(str(key), _DELETED)
+            if value is not _DELETED:
+                found[key] = cast(V, value)
+        return found
+
+    def version(self, key: K) -> tuple[int, int]:
+        """Return the version of the stored file of key, see DataRepository.
+
+        Raises:
+            KeyError: If key does not exist or is changed in the transaction
+        """
+        if str(key) in self._pending:
+            raise KeyError(f"Item with key '{key}' has pending changes")
+        return super().version(key)
+
     def __setitem__(self, key: K, value: V) -> None:
         """Store value under key.
 
@@ -46,11 +155,19 @@ class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[
             key: The key to store under
             value: The value to store
         """
-        # Ensure the folder exists
-        self._folder.mkdir(parents=True, exist_ok=True)
-
         file_path = self._make_path(key)
-        write_value(file_path, value, self._mode, self._marshal)
+        if self._depth:
+            self._pending[str(key)] = value
+            return
+        data = self._marshal(value)  # type: ignore[operator]
+        if self._index is not None:
+            self._index.refresh()
+        self._writer.write(file_path, data, self._mode)
+        if self._index is not None:
+            self._index.add(str(key))
+        if self._secondary is not None:
+            self._secondary.put(key, value)
+        self._writer.sync()
 
     def __delitem__(self, key: K) -> None:
         """Delete item by key.
@@ -61,8 +178,137 @@ class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[
         Raises:
             KeyError: If key does not exist
         """
-        file_path = self._make_path(key)
-        try:
-            file_path.unlink()
-        except FileNotFoundError:
+        name = str(key)
+        validate_key(name)
+        if self._depth:
+            if name in self._pending:
+                found = self._pending[name] is not _DELETED
+            else:
+                found = self._stored(name)
+            if not found:
+                raise KeyError(f"Key '{key}' not found")
+            self._pending[name] = _DELETED
+            return
+        if self._index is not None:
+            self._index.refresh()
+        if not self._unlink(name):
             raise KeyError(f"Key '{key}' not found")
+        if self._index is not None:
+            self._index.remove(name)
+        if self._secondary is not None:
+            self._secondary.discard(key)
+        self._writer.sync()
+
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values as one batch.
+
+        All keys are validated and, outside a transaction, all values
+        serialized before any file is written. The folder is then created
+        once, the files are written in name order by _workers threads and
+        the manifest is updated with a single append.
+
+        Args:
+            items: Mapping or iterable of (key, value) pairs to store
+        """
+        pending = self._named(dict(items).items())
+        if self._depth:
+            self._pending.update(pending)
+        else:
+            self._apply(pending)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys as one batch, ignoring keys that are not stored.
+
+        Args:
+            keys: Keys to delete
+        """
+        pending = self._named((key, _DELETED) for key in keys)
+        if self._depth:
+            self._pending.update(pending)
+        else:
+            self._apply(pending)
+
+    def _named(self, items: Iterable[tuple[K, object]]) -> dict[str, object]:
+        """Return items keyed by validated key names."""
+        named: dict[str, object] = {}
+        for key, value in items:
+            validate_key(str(key))
+            named[str(key)] = value
+        return named
+
+    def _apply(self, pending: dict[str, object]) -> None:
+        """Write out the changes of a committed transaction or batch.
+
+        Changes of a "batch" durability repository are durable on return.
+        """
+        writes = {
+            name: self._marshal(value)  # type: ignore[operator]
+            for name, value in sorted(pending.items(), key=lambda item: item[0])
+            if value is not _DELETED
+        }
+        deletes = sorted(name for name in pending if name not in writes)
+        if self._index is not None:
+            self._index.refresh()
+        if len(writes) > 1 and not self._shards:
+            self._folder.mkdir(parents=True, exist_ok=True)
+        self._map(self._write, list(writes.items()))
+        self._map(self._unlink, deletes)
+        if self._index is not None:
+            self._index.update(writes, deletes)
+        if self._secondary is not None:
+            for name, value in pending.items():
+                if value is _DELETED:
+                    self._secondary.discard(self._key_type(name))
+                else:
+                    self._secondary.put(self._key_type(name), value)
+        self._writer.sync()
+
+    def _write(self, item: tuple[str, str | bytes]) -> None:
+        name, data = item
+        path = make_path(self._folder, name, self._extension, self._shards)
+        self._writer.write(path, data, self._mode)
+
+    def _unlink(self, name: str) -> bool:
+        """Delete the file of key name, wherever it is; whether one was found.
+
+        Every candidate path is tried, so that a file left in _folder by a
+        flat layout cannot outlive the deletion of its key.
+        """
+        path = make_path(self._folder, name, self._extension, self._shards)
+        folders: set[Path] = set()
+        for candidate in self._candidate_paths(path):
+            try:
+                candidate.unlink()
+            except FileNotFoundError:
+                continue
+            folders.add(candidate.parent)
+        for folder in folders:
+            self._writer.changed(folder)
+        return bool(folders)
+
+    def _candidates(self, where: Where) -> Optional[Iterable[Any]]:
+        """Return keys that may satisfy where, including pending changes."""
+        keys = super()._candidates(where)
+        if keys is None or not self._pending:
+            return keys
+        return set(keys) | {self._key_type(name) for name in self._pending}
+
+    def __enter__(self) -> Self:
+        """Start a transaction, or join the one in progress."""
+        object.__setattr__(self, "_depth", self._depth + 1)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Commit the transaction, or discard it if the block raised."""
+        object.__setattr__(self, "_depth", self._depth - 1)
+        if self._depth:
+            return
+        pending = dict(self._pending)
+        self._pending.clear()
+        if exc_type is None:
+            self._apply(pending)
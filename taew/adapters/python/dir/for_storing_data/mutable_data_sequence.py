@@ -3,14 +3,14 @@
 Provides read-write sequence storage backed by directory structure.
 """
 
-from typing import Iterable, TypeVar, overload
+from typing import Iterable, Optional, Self, TypeVar, overload
 from dataclasses import dataclass, field
 
 from taew.ports.for_storing_data import (
     MutableDataSequence as MutableDataSequenceProtocol,
 )
 from .data_sequence import DataSequence
-from ._common import Marshal, write_value
+from ._common import Durability, Marshal, Writer
 
 V = TypeVar("V")
 
@@ -22,18 +22,27 @@ class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
     Extends DataSequence with write operations. Supports both binary
     (streaming) and text (stringizing) serialization formats.
 
+    Values are replaced atomically; _durability selects what is fsynced,
+    with "batch" deferring folder fsyncs to the exit of a with block, see
+    Writer. Changes made outside one are durable on return.
+
     Attributes:
         _serialize: Tuple of (type, marshaler) for serialization
+        _durability: Fsync policy - "none", "write" or "batch"
     """
 
     _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _durability: Durability = "none"
     _marshal: Marshal = field(init=False)
+    _writer: Writer = field(init=False)
+    _depth: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         """Initialize and validate configuration."""
         super().__post_init__()
         marshal, type_ = self._serialize
         self._marshal = marshal
+        self._writer = Writer(self._durability)
         # Verify that serialize and deserialize modes match
         from ._common import detect_mode
 
@@ -86,7 +95,9 @@ class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
             raise IndexError("sequence index out of range")
 
         base_index = self._start + i
-        write_value(self._path(base_index), value, self._mode, self._marshal)
+        data = self._marshal(value)  # type: ignore[operator]
+        self._writer.write(self._path(base_index), data, self._mode)
+        self._written()
 
     @overload
     def __delitem__(self, index: int) -> None: ...
@@ -130,6 +141,8 @@ class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
             dst = self._path(j - 1)
             if src.exists():
                 src.rename(dst)
+        self._writer.changed(self._folder)
+        self._written()
 
         # update underlying size and default-view stop if applicable
         old_size = self._size
@@ -170,10 +183,32 @@ class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
                 src.rename(dst)
 
         # write the new item
-        write_value(self._path(base_index), value, self._mode, self._marshal)
+        data = self._marshal(value)  # type: ignore[operator]
+        self._writer.write(self._path(base_index), data, self._mode)
+        self._written()
 
         # update size and default-view stop if applicable
         old_size = self._size
         self._size += 1
         if self._start == 0 and self._step == 1 and self._stop == old_size:
             self._stop = self._size
+
+    def _written(self) -> None:
+        """Make a change durable, unless deferred to the exit of a with block."""
+        if not self._depth:
+            self._writer.sync()
+
+    def __enter__(self) -> Self:
+        """Defer the folder fsyncs of "batch" durability to exit."""
+        self._depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Make writes of a "batch" durability sequence durable."""
+        self._depth -= 1
+        self._written()
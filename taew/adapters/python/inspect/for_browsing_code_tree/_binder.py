@@ -0,0 +1,97 @@
+"""Argument binder compiled once from a function signature."""
+
+import inspect
+from typing import Any
+
+_EMPTY = inspect.Parameter.empty
+
+
+class Binder:
+    """Maps call arguments to the positional and keyword arguments of a target.
+
+    Produces the same arguments as Signature.bind() followed by
+    apply_defaults(): every positional parameter is passed positionally,
+    keyword-only parameters by keyword, defaults filled in. The signature
+    is taken apart once, so binding is a few tuple and dict operations.
+    """
+
+    __slots__ = (
+        "_positional",
+        "_keyword_only",
+        "_var_positional",
+        "_var_keyword",
+        "_exact",
+    )
+
+    def __init__(self, signature: inspect.Signature) -> None:
+        positional: list[tuple[str, Any, bool]] = []
+        keyword_only: list[tuple[str, Any]] = []
+        self._var_positional = False
+        self._var_keyword = False
+        for name, param in signature.parameters.items():
+            match param.kind:
+                case inspect.Parameter.POSITIONAL_ONLY:
+                    positional.append((name, param.default, True))
+                case inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                    positional.append((name, param.default, False))
+                case inspect.Parameter.VAR_POSITIONAL:
+                    self._var_positional = True
+                case inspect.Parameter.KEYWORD_ONLY:
+                    keyword_only.append((name, param.default))
+                case inspect.Parameter.VAR_KEYWORD:
+                    self._var_keyword = True
+        self._positional = tuple(positional)
+        self._keyword_only = tuple(keyword_only)
+        # Number of positional arguments that bind without any other work
+        self._exact = len(positional) if not keyword_only else -1
+
+    def bind(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Return the (args, kwargs) to call the target with.
+
+        Raises:
+            TypeError: If the arguments do not match the signature
+        """
+        count = len(args)
+        if not kwargs and count == self._exact:
+            return args, kwargs
+
+        positional = self._positional
+        if count > len(positional) and not self._var_positional:
+            raise TypeError("too many positional arguments")
+
+        remaining = dict(kwargs)
+        values = list(args[: len(positional)])
+        for name, _, positional_only in positional[:count]:
+            if not positional_only and name in remaining:
+                raise TypeError(f"multiple values for argument '{name}'")
+        for name, default, positional_only in positional[count:]:
+            if not positional_only and name in remaining:
+                values.append(remaining.pop(name))
+            elif default is not _EMPTY:
+                values.append(default)
+            elif positional_only and name in remaining and not self._var_keyword:
+                raise TypeError(
+                    f"'{name}' parameter is positional only, but was passed as a keyword"
+                )
+            else:
+                raise TypeError(f"missing a required argument: '{name}'")
+        values.extend(args[len(positional) :])
+
+        keywords: dict[str, Any] = {}
+        for name, default in self._keyword_only:
+            if name in remaining:
+                keywords[name] = remaining.pop(name)
+            elif default is not _EMPTY:
+                keywords[name] = default
+            else:
+                raise TypeError(f"missing a required argument: '{name}'")
+
+        if remaining:
+            if not self._var_keyword:
+                raise TypeError(
+                    f"got an unexpected keyword argument '{next(iter(remaining))}'"
+                )
+            keywords.update(remaining)
+        return tuple(values), keywords
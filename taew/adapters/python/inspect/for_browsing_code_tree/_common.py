@@ -21,20 +21,31 @@ class RootBase(FolderBase):
     Uses _root_path parameter to align with dataclass Configure naming convention.
     """
 
-    def __init__(self, _root_path: Path, name_prefix: Optional[str] = None) -> None:
+    _lazy_import: bool
+
+    def __init__(
+        self,
+        _root_path: Path,
+        name_prefix: Optional[str] = None,
+        _lazy_import: bool = False,
+    ) -> None:
         """Initialize Root with underscore-prefixed parameter.
 
         Args:
             _root_path: Path to the root directory
             name_prefix: Optional prefix for module names
+            _lazy_import: Import modules through importlib.util.LazyLoader,
+                          running module bodies only on first attribute use
         """
         super().__init__(
             _root_path,
             "" if name_prefix is None else name_prefix,
             _create_module=lambda p, n: cast(
-                ModuleProtocol, ModuleAdapter.get_module(AstModule.from_path(p), n)
+                ModuleProtocol,
+                ModuleAdapter.get_module(AstModule.from_path(p), n, _lazy_import),
             ),
             _create_package=lambda p, n: cast(
-                PackageProtocol, PackageAdapter.get_package(p, n)
+                PackageProtocol, PackageAdapter.get_package(p, n, _lazy_import)
             ),
         )
+        object.__setattr__(self, "_lazy_import", _lazy_import)
@@ -11,14 +11,20 @@ from taew.ports.for_browsing_code_tree import (
 
 
 class Folder(FolderBase):
-    def __init__(self, root_path: Path, name_prefix: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        root_path: Path,
+        name_prefix: Optional[str] = None,
+        lazy_import: bool = False,
+    ) -> None:
         super().__init__(
             root_path,
             "" if name_prefix is None else name_prefix,
             _create_module=lambda p, n: cast(
-                ModuleProtocol, ModuleAdapter.get_module(AstModule.from_path(p), n)
+                ModuleProtocol,
+                ModuleAdapter.get_module(AstModule.from_path(p), n, lazy_import),
             ),
             _create_package=lambda p, n: cast(
-                PackageProtocol, PackageAdapter.get_package(p, n)
+                PackageProtocol, PackageAdapter.get_package(p, n, lazy_import)
             ),
         )
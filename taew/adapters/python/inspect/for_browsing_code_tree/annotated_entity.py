@@ -1,8 +1,13 @@
 import inspect
+from functools import cached_property
 from taew.domain.argument import ArgumentKind
-from taew.ports.for_browsing_code_tree import is_protocol
+from taew.utils.validators import Validator, compile_validator
 from docstring_parser import DocstringMeta, DocstringParam
-from typing import get_origin, get_args, Any, Optional, cast, Union
+from collections.abc import Callable
+from typing import get_origin, get_args, Any, Optional, cast
+
+DocstringLookup = Callable[[], Optional[DocstringMeta]]
+AnnotationLookup = Callable[[], Any]
 
 
 class DefaultValue:
@@ -23,27 +28,52 @@ class DefaultValue:
 
 class AnnotatedEntity:
     def __init__(
-        self, annotation: Any, docstring_param: Optional[DocstringMeta] = None
+        self,
+        annotation: Any,
+        docstring_param: Optional[DocstringMeta] = None,
+        *,
+        docstring_lookup: Optional[DocstringLookup] = None,
+        annotation_lookup: Optional[AnnotationLookup] = None,
     ) -> None:
+        """Initialize with docstring metadata given directly or looked up lazily.
+
+        Args:
+            annotation: Type annotation of the entity
+            docstring_param: Docstring metadata describing the entity
+            docstring_lookup: Called on first description access to obtain
+                              docstring metadata when docstring_param is None
+            annotation_lookup: Called on first annotation or spec access to
+                               evaluate the annotation, which replaces the
+                               unevaluated annotation given
+        """
         self._annotation = annotation
+        self._annotation_lookup = annotation_lookup
         self._docstring_param = docstring_param
+        self._docstring_lookup = docstring_lookup
 
     @property
     def annotation(self) -> Any:
+        if self._annotation_lookup is not None:
+            self._annotation = self._annotation_lookup()
+            self._annotation_lookup = None
         return self._annotation
 
     @property
     def spec(self) -> tuple[Any, tuple[Any, ...]]:
+        annotation = self.annotation
         # Handle empty annotations gracefully
-        if self._annotation is inspect.Parameter.empty:
+        if annotation is inspect.Parameter.empty:
             return None, ()
-        return get_origin(self._annotation), get_args(self._annotation)
+        return get_origin(annotation), get_args(annotation)
 
     @property
     def description(self) -> str:
+        docstring_param = self._docstring_param
+        if docstring_param is None and self._docstring_lookup is not None:
+            docstring_param = self._docstring_lookup()
         return (
-            self._docstring_param.description
-            if self._docstring_param and self._docstring_param.description
+            docstring_param.description
+            if docstring_param and docstring_param.description
             else ""
         )
 
@@ -52,9 +82,19 @@ class Argument(AnnotatedEntity):
     """Inspect adapter implementation of function/method parameters with type validation."""
 
     def __init__(
-        self, param: inspect.Parameter, docstring_param: Optional[DocstringParam] = None
+        self,
+        param: inspect.Parameter,
+        docstring_param: Optional[DocstringParam] = None,
+        *,
+        docstring_lookup: Optional[DocstringLookup] = None,
+        annotation_lookup: Optional[AnnotationLookup] = None,
     ):
-        super().__init__(param.annotation, docstring_param)
+        super().__init__(
+            param.annotation,
+            docstring_param,
+            docstring_lookup=docstring_lookup,
+            annotation_lookup=annotation_lookup,
+        )
         self._param = param
 
     @property
@@ -69,74 +109,13 @@ class Argument(AnnotatedEntity):
         # it's up to adapter to ensure this and avoid extra conversion
         return cast(ArgumentKind, self._param.kind.value)
 
+    @cached_property
+    def _validator(self) -> Validator:
+        return compile_validator(self.annotation, self.kind)
+
     def has_valid_type(self, value: Any) -> bool:
         """Returns True if value is compatible with this argument's type."""
-        if is_protocol(self):
-            return True  # cannot check protocol type compliance
-        annotation = self._param.annotation
-        if annotation == Any:
-            return True
-        # Handle variadic arguments (*args and **kwargs) - must check container type even with no annotation
-        if self._param.kind == inspect.Parameter.VAR_POSITIONAL:
-            # *args: value should be tuple, validate each element against annotation if present
-            if not isinstance(value, tuple):
-                return False
-            if annotation is inspect.Parameter.empty:
-                return True  # No type hint = accept any tuple
-            if isinstance(annotation, type):
-                return all(isinstance(item, annotation) for item in value)  # type: ignore[misc]
-            return True  # Permissive for complex annotation types
-
-        if self._param.kind == inspect.Parameter.VAR_KEYWORD:
-            # **kwargs: value should be dict, validate each value against annotation if present
-            if not isinstance(value, dict):
-                return False
-            if annotation is inspect.Parameter.empty:
-                return True  # No type hint = accept any dict
-            if isinstance(annotation, type):
-                return all(isinstance(v, annotation) for v in value.values())  # type: ignore[misc]
-            return True  # Permissive for complex annotation types
-
-        # For non-variadic arguments, no type hint means accept anything
-        if annotation is inspect.Parameter.empty:
-            return True
-
-        # Handle basic types
-        if isinstance(annotation, type):
-            return isinstance(value, annotation)
-
-        # Handle typing generics (Optional, Union, etc.)
-        origin = get_origin(annotation)
-
-        # Handle type[Any] - accepts any type
-        if origin is type:
-            args = get_args(annotation)
-            if args and args[0] is Any:
-                return isinstance(value, type)
-
-        if origin is Union:
-            args = get_args(annotation)
-            return any(
-                isinstance(value, arg)
-                for arg in args
-                if isinstance(arg, type) and arg is not Any
-            )
-        # Handle Optional (which is Union[T, None])
-        if origin is type(Union):
-            args = get_args(annotation)
-            if len(args) == 2 and type(None) in args:
-                non_none_type = next(t for t in args if t is not type(None))
-                if value is None or (
-                    isinstance(non_none_type, type) and isinstance(value, non_none_type)
-                ):
-                    return True
-            return any(
-                isinstance(value, arg)
-                for arg in args
-                if isinstance(arg, type) and arg is not Any
-            )
-
-        return True  # Fallback: permissive for complex types
+        return self._validator(value)
 
 
 class ReturnValue(AnnotatedEntity):
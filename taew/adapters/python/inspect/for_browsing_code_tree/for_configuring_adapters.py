@@ -15,9 +15,13 @@ class Configure(ConfigureBase):
     Args:
         _root_path: Path to the root directory for code tree navigation.
                    Defaults to current directory ('./').
+        _lazy_import: Import adapter modules through importlib.util.LazyLoader
+                      so that module bodies run only when an attribute is used.
+                      Defaults to False.
     """
 
     _root_path: Path = Path("./")
+    _lazy_import: bool = False
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "_package", __package__)
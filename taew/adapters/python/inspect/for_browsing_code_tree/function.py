@@ -1,68 +1,114 @@
 import inspect
+from annotationlib import Format
 from dataclasses import dataclass
-from typing import Any, Iterable, Callable
-from docstring_parser import parse, Docstring
+from functools import cached_property, partial
+from typing import Any, Iterable, Callable, Optional
+from ._binder import Binder
 from .annotated_entity import Argument, ReturnValue
+from .object_description import short_description
+from docstring_parser import parse, Docstring, DocstringParam
 from taew.domain.function import FunctionInvocationError
 
 
+def _signature(func: Callable[..., Any], evaluate: bool) -> inspect.Signature:
+    # Format.STRING renders annotations as source text without evaluating
+    # them, and so without resolving any type-only import
+    return inspect.signature(
+        func, annotation_format=Format.VALUE if evaluate else Format.STRING
+    )
+
+
 @dataclass(frozen=True)
 class Function:
     _func: Callable[..., Any]
     _signature: inspect.Signature
-    _docstring: Docstring
-    _param_docs: dict[str, Any]
+    _doc: str
 
     @classmethod
     def from_callable(cls, func: Callable[..., Any]) -> "Function":
-        """Create Function from callable with full introspection."""
+        """Create Function from callable with full introspection.
+
+        The docstring is parsed in full only when an argument or return value
+        description is requested; description uses a first-line extractor.
+        Annotations are evaluated only when an argument or return value
+        annotation is requested.
+        """
         if not callable(func):
             raise TypeError(f"Expected callable, got {type(func).__name__}")
 
         try:
-            signature = inspect.signature(func)
+            signature = _signature(func, evaluate=False)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Cannot create signature for {func}: {e}") from e
 
         try:
-            docstring_text = inspect.getdoc(func) or ""
-            docstring = parse(docstring_text)
+            doc = inspect.getdoc(func) or ""
+        except Exception:
+            doc = ""
+
+        return cls(func, signature, doc)
+
+    @cached_property
+    def _docstring(self) -> Docstring:
+        try:
+            return parse(self._doc)
         except Exception:
             # Fallback to empty docstring if parsing fails
-            docstring = Docstring()  # Could log warning here if logging is available
+            return Docstring()  # Could log warning here if logging is available
+
+    @cached_property
+    def _param_docs(self) -> dict[str, DocstringParam]:
         try:
-            param_docs = (
-                {p.arg_name: p for p in docstring.params} if docstring.params else {}
-            )
+            params = self._docstring.params
+            return {p.arg_name: p for p in params} if params else {}
         except (AttributeError, TypeError):
             # Fallback to empty param docs if docstring parsing had issues
-            param_docs = {}
+            return {}
+
+    @cached_property
+    def _evaluated_signature(self) -> inspect.Signature:
+        return _signature(self._func, evaluate=True)
+
+    def _param_annotation(self, name: str) -> Any:
+        return self._evaluated_signature.parameters[name].annotation
 
-        return cls(func, signature, docstring, param_docs)
+    def _return_annotation(self) -> Any:
+        return self._evaluated_signature.return_annotation
+
+    @cached_property
+    def _binder(self) -> Binder:
+        return Binder(self._signature)
+
+    def _param_doc(self, name: str) -> Optional[DocstringParam]:
+        return self._param_docs.get(name)
 
     @property
     def description(self) -> str:
-        if self._docstring and self._docstring.short_description:
-            return self._docstring.short_description
-        return ""
+        return short_description(self._doc) if self._doc else ""
 
     @property
     def returns(self) -> ReturnValue:
-        return ReturnValue(self._signature.return_annotation, self._docstring.returns)
+        return ReturnValue(
+            self._signature.return_annotation,
+            docstring_lookup=lambda: self._docstring.returns,
+            annotation_lookup=self._return_annotation,
+        )
 
     def items(self) -> Iterable[tuple[str, Argument]]:
         for param_name, param in self._signature.parameters.items():
-            docstring_param = self._param_docs.get(param_name)
-            argument = Argument(param, docstring_param)
+            argument = Argument(
+                param,
+                docstring_lookup=partial(self._param_doc, param_name),
+                annotation_lookup=partial(self._param_annotation, param_name),
+            )
             yield param_name, argument
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         try:
-            bound_args = self._signature.bind(*args, **kwargs)
-            bound_args.apply_defaults()
+            call_args, call_kwargs = self._binder.bind(args, kwargs)
         except TypeError as e:
             raise FunctionInvocationError(
                 self._func.__qualname__, "signature_error", str(e)
             ) from None
 
-        return self._func(*bound_args.args, **bound_args.kwargs)
+        return self._func(*call_args, **call_kwargs)
@@ -1,5 +1,7 @@
 from __future__ import annotations
+import sys
 import importlib
+import importlib.util
 from .class_ import Class
 from .function import Function
 from dataclasses import dataclass
@@ -11,18 +13,77 @@ from .object_description import extract_object_description
 from taew.adapters.python.ast.for_browsing_code_tree.module import Module as AstModule
 
 
+def _import_lazily(module_name: str) -> ModuleType:
+    """Import a module through LazyLoader, deferring execution of its body.
+
+    The module body runs on first attribute access. Parent packages are
+    imported as usual by find_spec, and the module is bound on its parent
+    as the import system does, so that "import pkg.mod; pkg.mod.X" works.
+    """
+    if (module := sys.modules.get(module_name)) is not None:
+        return module
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{module_name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+    parent, _, child = module_name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def wrap_member(module: ModuleType, module_name: str, name: str) -> Function | Class:
+    """Wrap a module attribute as a code tree Class or Function.
+
+    Raises:
+        KeyError: If the attribute is missing or neither a class nor callable
+    """
+    try:
+        obj = getattr(module, name)
+    except AttributeError:
+        raise KeyError(f"Object '{name}' not found in module '{module_name}'")
+
+    match obj:
+        case type():
+            try:
+                return Class.from_class(obj, module)
+            except Exception as e:
+                raise KeyError(f"Cannot wrap '{name}' as Class: {e}")
+        case GenericAlias():
+            try:
+                return Class.from_class(get_origin(obj), module)
+            except Exception as e:
+                raise KeyError(f"Cannot wrap '{name}' as Class: {e}")
+        case _ if callable(obj):
+            try:
+                return Function.from_callable(obj)
+            except Exception as e:
+                raise KeyError(f"Cannot wrap '{name}' as Function: {e}")
+        case _:
+            raise KeyError(f"'{name}' is neither callable nor a class")
+
+
 @dataclass(eq=False, frozen=True)
 class Module:
     _ast_module: AstModule
     _module_name: str
+    _lazy_import: bool = False
 
     @staticmethod
-    def get_module(ast_module: AstModule, module_name: str) -> Module:
-        return Module(ast_module, module_name)
+    def get_module(
+        ast_module: AstModule, module_name: str, lazy_import: bool = False
+    ) -> Module:
+        return Module(ast_module, module_name, lazy_import)
 
     @cached_property
     def _module(self) -> ModuleType:
         try:
+            if self._lazy_import:
+                return _import_lazily(self._module_name)
             return importlib.import_module(self._module_name)
         except ModuleNotFoundError as e:
             print(e)
@@ -51,29 +112,7 @@ class Module:
                 continue
 
     def __getitem__(self, name: str) -> Function | Class:
-        try:
-            obj = getattr(self._module, name)
-        except AttributeError:
-            raise KeyError(f"Object '{name}' not found in module '{self._module_name}'")
-
-        match obj:
-            case type():
-                try:
-                    return Class.from_class(obj, self._module)
-                except Exception as e:
-                    raise KeyError(f"Cannot wrap '{name}' as Class: {e}")
-            case GenericAlias():
-                try:
-                    return Class.from_class(get_origin(obj), self._module)
-                except Exception as e:
-                    raise KeyError(f"Cannot wrap '{name}' as Class: {e}")
-            case _ if callable(obj):
-                try:
-                    return Function.from_callable(obj)
-                except Exception as e:
-                    raise KeyError(f"Cannot wrap '{name}' as Function: {e}")
-            case _:
-                raise KeyError(f"'{name}' is neither callable nor a class")
+        return wrap_member(self._module, self._module_name, name)
 
     def get(
         self, name: str, default: Optional[Function | Class] = None
@@ -86,6 +125,10 @@ class Module:
     def __contains__(self, name: str) -> bool:
         if name.startswith("_"):
             return False
+        if self._lazy_import and name in self._ast_module:
+            # Classes and functions defined in the module body are answered
+            # from the AST so that the body does not have to run
+            return True
         try:
             obj = getattr(self._module, name)
             return isinstance(obj, type) or callable(obj)
@@ -1,6 +1,36 @@
+import re
 import inspect
 from typing import Any
-from docstring_parser import parse
+
+# First lines that open a meta section rather than a description: Google
+# section titles ("Args:"), reST fields (":param x:") and epydoc fields
+_META_LINE = re.compile(
+    r"^(?::|@\w+(?:\s+\w+)?:|(?:Arguments|Args|Parameters|Params|Raises"
+    r"|Exceptions|Except|Attributes|Examples?|Returns|Yields):\s*$)"
+)
+_UNDERLINE = re.compile(r"^-{3,}\s*$")
+
+
+def short_description(docstring: str) -> str:
+    """Return the first line of a docstring without a full structured parse.
+
+    Agrees with the short_description of docstring_parser.parse() for
+    docstrings opening with a summary line, without building their meta.
+    A docstring opening with a section title ("Args:", "Raises:", ...),
+    a field (":param x:", "@param x:") or an underlined heading has no summary and
+    gives "", where parse() may return the title or heading itself.
+
+    Args:
+        docstring: Docstring text, typically from inspect.getdoc()
+    """
+    lines = inspect.cleandoc(docstring).split("\n", 2)
+    first = lines[0].strip()
+    if not first or _META_LINE.match(first):
+        return ""
+    if len(lines) > 1 and _UNDERLINE.match(lines[1]):
+        # Numpydoc section title underlined with dashes
+        return ""
+    return first
 
 
 def extract_object_description(obj: Any) -> str:
@@ -11,21 +41,4 @@ def extract_object_description(obj: Any) -> str:
         # inspect.getdoc() can fail with some object types
         return ""
 
-    if docstring:
-        try:
-            parsed = parse(docstring)
-        except Exception:
-            # docstring_parser.parse() can fail with malformed docstrings
-            return ""
-
-        if parsed and parsed.short_description:
-            try:
-                # Strip whitespace and check if result is non-empty
-                cleaned = parsed.short_description.strip()
-                if cleaned:
-                    return cleaned
-            except (AttributeError, TypeError):
-                # Handle case where short_description is not a string
-                return ""
-
-    return ""
+    return short_description(docstring) if docstring else ""
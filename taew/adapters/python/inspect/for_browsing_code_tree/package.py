@@ -10,12 +10,15 @@ from taew.adapters.python.path.for_browsing_code_tree.folder import Folder
 from taew.adapters.python.ast.for_browsing_code_tree.module import Module as AstModule
 
 
-def _get_package_folder(packege_path: Path, package_name: str) -> Folder:
+def _get_package_folder(
+    packege_path: Path, package_name: str, lazy_import: bool = False
+) -> Folder:
     from ._folder import Folder as FolderImpl
 
     return FolderImpl(
         root_path=packege_path,
         name_prefix=package_name,
+        lazy_import=lazy_import,
     )
 
 
@@ -25,13 +28,16 @@ class Package:
     _package_name: str
     _init_module: Optional[AstModule] = None
     _folder_impl: Optional[Folder] = None
+    _lazy_import: bool = False
 
     @staticmethod
-    def get_package(package_path: Path, package_name: str) -> Package:
+    def get_package(
+        package_path: Path, package_name: str, lazy_import: bool = False
+    ) -> Package:
         init_path = package_path / "__init__.py"
         init_module = AstModule.from_path(init_path) if init_path.exists() else None
         folder_impl = (
-            _get_package_folder(package_path, package_name)
+            _get_package_folder(package_path, package_name, lazy_import)
             if not (init_module)
             else None
         )
@@ -41,6 +47,7 @@ class Package:
             _package_name=package_name,
             _init_module=init_module,
             _folder_impl=folder_impl,
+            _lazy_import=lazy_import,
         )
 
     @cached_property
@@ -49,7 +56,9 @@ class Package:
             raise ValueError(
                 f"Package '{self._package_name}' has no __init__.py module."
             )
-        return Module.get_module(self._init_module, self._package_name)
+        return Module.get_module(
+            self._init_module, self._package_name, self._lazy_import
+        )
 
     @cached_property
     def description(self) -> str:
@@ -4,4 +4,4 @@ from ._common import RootBase
 
 class Root(RootBase):
     def change_root(self, new_root: str) -> Root:
-        return Root(Path(new_root))
+        return Root(Path(new_root), _lazy_import=self._lazy_import)
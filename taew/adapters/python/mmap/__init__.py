@@ -0,0 +1 @@
+"""mmap adapter."""
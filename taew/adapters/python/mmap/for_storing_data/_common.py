@@ -0,0 +1,23 @@
+"""Value encoding shared by the segment file storage adapters.
+
+Values are marshaled through the configured serialization adapters, as in
+the dir adapters; stringizing (text) adapters are stored UTF-8 encoded.
+"""
+
+from taew.adapters.python.dir.for_storing_data._common import (
+    Marshal,
+    Mode,
+    Unmarshal,
+    detect_mode,
+)
+
+__all__ = ["Marshal", "Mode", "Unmarshal", "decode", "detect_mode", "encode"]
+
+
+def encode(value: object, marshal: Marshal) -> bytes:
+    data = marshal(value)
+    return data if isinstance(data, bytes) else data.encode()
+
+
+def decode(data: bytes, mode: Mode, unmarshal: Unmarshal) -> object:
+    return unmarshal(data if mode == "b" else data.decode())  # type: ignore[arg-type]
@@ -0,0 +1,246 @@
+"""Append-only segment files and index journals of log-structured storage.
+
+Values are appended to numbered segment files and never rewritten in
+place. Segment and journal files are named after their store, so that a
+repository and a sequence can share a folder; an index maps keys or
+positions to their (segment, offset, length) location. Index changes are
+appended to a journal replayed on open, and written as a full snapshot on
+checkpoint. Compaction copies the live values into fresh segments,
+checkpoints the index and only then deletes the old segments, so a crash
+at any point leaves a readable store. The fresh active segment is created
+even when there is nothing to copy, so segment numbers are never reused
+and a mapping a reader still holds never shows another segment's data.
+
+Readers follow a writer by polling the journal: records appended to the
+log since the last poll are replayed, and the whole index is loaded again
+once a checkpoint replaced the snapshot.
+"""
+
+import os
+import mmap
+from pathlib import Path
+from collections.abc import Iterable, Sequence
+from typing import BinaryIO, NamedTuple, Optional
+
+_SEGMENT_SUFFIX = ".seg"
+
+
+class Location(NamedTuple):
+    """Where a value is stored."""
+
+    segment: int
+    offset: int
+    length: int
+
+
+class Segments:
+    """Numbered append-only segment files of a store, read through mmap.
+
+    Appending rolls over to a new segment once the active one would grow
+    beyond segment_size. Reads copy the requested range out of a shared
+    read-only mapping of the segment, remapped only when it does not cover
+    that range.
+    """
+
+    def __init__(self, folder: Path, name: str, segment_size: int) -> None:
+        self._folder = folder
+        self._prefix = f"{name}-"
+        self._segment_size = segment_size
+        self._sizes = {
+            int(number): path.stat().st_size
+            for path in folder.glob(f"{self._prefix}*{_SEGMENT_SUFFIX}")
+            if (number := path.stem.removeprefix(self._prefix)).isdigit()
+        }
+        self._active = max(self._sizes, default=0)
+        self._writer: Optional[BinaryIO] = None
+        self._maps: dict[int, mmap.mmap] = {}
+
+    def _path(self, segment: int) -> Path:
+        return self._folder / f"{self._prefix}{segment:08d}{_SEGMENT_SUFFIX}"
+
+    @property
+    def segment_size(self) -> int:
+        return self._segment_size
+
+    @property
+    def total_size(self) -> int:
+        """Bytes stored in all segments, live or not."""
+        return sum(self._sizes.values())
+
+    def segments(self) -> list[int]:
+        return sorted(self._sizes)
+
+    def append(self, data: bytes) -> Location:
+        size = self._sizes.get(self._active, 0)
+        if size and size + len(data) > self._segment_size:
+            self._close_writer()
+            self._active += 1
+            size = 0
+        writer = self._open_writer()
+        writer.write(data)
+        writer.flush()
+        self._sizes[self._active] = size + len(data)
+        return Location(self._active, size, len(data))
+
+    def read(self, location: Location) -> bytes:
+        segment, offset, length = location
+        if not length:
+            return b""
+        end = offset + length
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(self._path(segment), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped[offset:end]
+
+    def copy(self, locations: Sequence[Location]) -> tuple[list[Location], list[int]]:
+        """Copy values into fresh segments, as the first step of compaction.
+
+        Returns:
+            New locations in the order given, and the old segments to
+            remove once an index pointing at the new locations is durable
+        """
+        old = self.segments()
+        self._close_writer()
+        self._active = max(old, default=-1) + 1
+        self._sizes.setdefault(self._active, 0)
+        self._open_writer()
+        return [self.append(self.read(location)) for location in locations], old
+
+    def remove(self, segments: Iterable[int]) -> None:
+        for segment in segments:
+            if (mapped := self._maps.pop(segment, None)) is not None:
+                mapped.close()
+            if segment == self._active:
+                self._close_writer()
+            self._sizes.pop(segment, None)
+            self._path(segment).unlink(missing_ok=True)
+
+    def _open_writer(self) -> BinaryIO:
+        if self._writer is None:
+            self._folder.mkdir(parents=True, exist_ok=True)
+            self._writer = open(self._path(self._active), "ab")
+        return self._writer
+
+    def unmap(self) -> None:
+        """Drop the mappings, for segments the index may no longer use."""
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> None:
+        self._close_writer()
+        self.unmap()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def needs_compaction(segments: Segments, live: int, ratio: float) -> bool:
+    """Whether garbage exceeds ratio of the stored bytes, past one segment."""
+    total = segments.total_size
+    return total >= segments.segment_size and total - live > ratio * total
+
+
+class Journal:
+    """Index snapshot plus an append-only log of index changes.
+
+    Records are lines of space separated fields, so keys must not contain
+    whitespace. The snapshot is replaced atomically on checkpoint, which
+    also empties the log.
+    """
+
+    def __init__(self, folder: Path, name: str) -> None:
+        self._folder = folder
+        self._snapshot = folder / f"{name}.index"
+        self._log = folder / f"{name}.log"
+        self._writer: Optional[BinaryIO] = None
+        self.entries = 0  # log records since the last checkpoint
+        self._loaded: Optional[tuple[int, int]] = None  # snapshot identity
+        self._offset = 0  # log bytes replayed
+
+    @staticmethod
+    def _read(path: Path, offset: int = 0) -> tuple[list[list[str]], int]:
+        """Return the complete records of path from offset, and their end."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], offset
+        end = data.rfind(b"\n") + 1
+        records = [line.decode().split() for line in data[:end].split(b"\n")[:-1]]
+        return records, offset + end
+
+    def _identity(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self._snapshot.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def load(self) -> tuple[list[list[str]], list[list[str]]]:
+        """Return the snapshot records and the log records to replay.
+
+        A partially written last log line, left by a crash or a writer
+        still appending it, is ignored.
+        """
+        self._loaded = self._identity()
+        snapshot, _ = self._read(self._snapshot)
+        log, self._offset = self._read(self._log)
+        self.entries = len(log)
+        return snapshot, log
+
+    def poll(self) -> Optional[list[list[str]]]:
+        """Return the log records appended since the last load or poll.
+
+        Returns:
+            The new records, or None if the journal was checkpointed since
+            and must be loaded again
+        """
+        if self._identity() != self._loaded:
+            return None
+        try:
+            size = self._log.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._offset:
+            return None
+        if size == self._offset:
+            return []
+        records, self._offset = self._read(self._log, self._offset)
+        return records
+
+    def append(self, *fields: object) -> None:
+        if self._writer is None:
+            self._folder.mkdir(parents=True, exist_ok=True)
+            self._writer = open(self._log, "ab")
+        self._writer.write(" ".join(map(str, fields)).encode() + b"\n")
+        self._writer.flush()
+        self.entries += 1
+
+    def checkpoint(self, records: Iterable[Iterable[object]]) -> None:
+        self._folder.mkdir(parents=True, exist_ok=True)
+        temporary = self._snapshot.with_suffix(".tmp")
+        with open(temporary, "wb") as f:
+            f.writelines(" ".join(map(str, r)).encode() + b"\n" for r in records)
+        os.replace(temporary, self._snapshot)
+        self.close()
+        self._log.unlink(missing_ok=True)
+        self.entries = 0
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __del__(self) -> None:
+        self.close()
@@ -0,0 +1,134 @@
+"""Packed segment file DataRepository implementation.
+
+Provides read-only key-value storage backed by append-only segment files.
+"""
+
+from pathlib import Path
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Callable, TypeVar, cast
+
+from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from ._common import Mode, Unmarshal, decode, detect_mode
+from ._segments import Journal, Location, Segments
+from .data_sequence import DEFAULT_SEGMENT_SIZE
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def load_index(journal: Journal) -> dict[str, Location]:
+    """Rebuild the key index from its snapshot and journal."""
+    snapshot, log = journal.load()
+    index = {key: Location(*map(int, location)) for key, *location in snapshot}
+    replay(index, log)
+    return index
+
+
+def replay(index: dict[str, Location], log: list[list[str]]) -> None:
+    """Apply journal log records to the key index."""
+    for op, key, *location in log:
+        match op:
+            case "s":
+                index[key] = Location(*map(int, location))
+            case "d":
+                index.pop(key, None)
+
+
+@dataclass(eq=False, frozen=True)
+class DataRepository(DataRepositoryProtocol[K, V]):
+    """Packed segment file read-only data repository.
+
+    Implements DataRepository protocol over segment files holding the
+    serialized values back to back, and a key to (segment, offset, length)
+    index. Values are copied out of memory-mapped segments, without
+    opening a file per key. Supports both binary (streaming) and text
+    (stringizing) serialization formats.
+
+    The index is loaded when the repository is created and kept up to date
+    with the writes of a MutableDataRepository on the same folder, in this
+    or another process, by polling its journal on every access.
+
+    Attributes:
+        _folder: Directory path for segment and index files
+        _deserialize: Tuple of (unmarshaler, type) for deserialization
+        _key_type: Function to convert string to key type
+        _segment_size: Size in bytes after which a new segment file is started
+        _compact_ratio: Garbage to stored bytes ratio that triggers compaction
+                        in the mutable variant
+    """
+
+    _folder: Path
+    _deserialize: tuple[Unmarshal, type]
+    _key_type: Callable[[str], K]
+    _segment_size: int = DEFAULT_SEGMENT_SIZE
+    _compact_ratio: float = 0.5
+    _unmarshal: Unmarshal = field(init=False)
+    _mode: Mode = field(init=False)
+    _segments: Segments = field(init=False)
+    _journal: Journal = field(init=False)
+    _index: dict[str, Location] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize configuration and load the index."""
+        unmarshal, type_ = self._deserialize
+        object.__setattr__(self, "_unmarshal", unmarshal)
+        object.__setattr__(self, "_mode", detect_mode(type_))
+        object.__setattr__(
+            self,
+            "_segments",
+            Segments(self._folder, "repository", self._segment_size),
+        )
+        journal = Journal(self._folder, "repository")
+        object.__setattr__(self, "_journal", journal)
+        object.__setattr__(self, "_index", load_index(journal))
+
+    def _refresh(self) -> None:
+        """Apply the index changes journaled since the last refresh."""
+        log = self._journal.poll()
+        if log is None:
+            self._reload()
+        else:
+            replay(self._index, log)
+
+    def _reload(self) -> None:
+        """Load the index again after a checkpoint replaced it.
+
+        The segments it pointed at may have been compacted away, so their
+        mappings are dropped as well.
+        """
+        self._segments.unmap()
+        object.__setattr__(self, "_index", load_index(self._journal))
+
+    def __len__(self) -> int:
+        """Return number of items in repository."""
+        self._refresh()
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over all keys."""
+        self._refresh()
+        for key in list(self._index):
+            yield self._key_type(key)
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        self._refresh()
+        try:
+            return self._get(key)
+        except FileNotFoundError:
+            # Loaded between the checkpoint of a compaction and the removal
+            # of the log it replaced, so pointing at removed segments
+            self._reload()
+            return self._get(key)
+
+    def _get(self, key: K) -> V:
+        location = self._index.get(str(key))
+        if location is None:
+            raise KeyError(f"Item with key '{key}' not found")
+        data = self._segments.read(location)
+        return cast(V, decode(data, self._mode, self._unmarshal))
@@ -0,0 +1,118 @@
+"""Log-structured DataSequence implementation.
+
+Provides read-only sequence storage backed by append-only segment files.
+"""
+
+from pathlib import Path
+from dataclasses import dataclass, field
+from collections.abc import Iterator, Sequence
+from typing import TypeVar, cast, overload
+
+from taew.ports.for_storing_data import DataSequence as DataSequenceProtocol
+from ._segments import Journal, Location, Segments
+from ._common import Mode, Unmarshal, decode, detect_mode
+
+V = TypeVar("V")
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+
+def load_index(journal: Journal) -> list[Location]:
+    """Rebuild the position index from its snapshot and journal."""
+    snapshot, log = journal.load()
+    index = [Location(*map(int, record)) for record in snapshot]
+    for op, position, *location in log:
+        match op:
+            case "i":
+                index.insert(int(position), Location(*map(int, location)))
+            case "s":
+                index[int(position)] = Location(*map(int, location))
+            case "d":
+                del index[int(position)]
+    return index
+
+
+@dataclass(eq=False)
+class DataSequence(DataSequenceProtocol[V]):
+    """Log-structured read-only data sequence.
+
+    Implements DataSequence protocol over segment files holding the
+    serialized items back to back, and an index of item locations in
+    sequence order. Items are copied out of memory-mapped segments.
+    Supports both binary (streaming) and text (stringizing) serialization
+    formats.
+
+    Attributes:
+        _folder: Directory path for segment and index files
+        _deserialize: Tuple of (unmarshaler, type) for deserialization
+        _segment_size: Size in bytes after which a new segment file is started
+        _compact_ratio: Garbage to stored bytes ratio that triggers compaction
+                        in the mutable variant
+    """
+
+    _folder: Path
+    _deserialize: tuple[Unmarshal, type]
+    _segment_size: int = DEFAULT_SEGMENT_SIZE
+    _compact_ratio: float = 0.5
+    _unmarshal: Unmarshal = field(init=False)
+    _mode: Mode = field(init=False)
+    _segments: Segments = field(init=False)
+    _journal: Journal = field(init=False)
+    _index: list[Location] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize configuration and load the index."""
+        unmarshal, type_ = self._deserialize
+        self._unmarshal = unmarshal
+        self._mode = detect_mode(type_)
+        self._segments = Segments(self._folder, "sequence", self._segment_size)
+        self._journal = Journal(self._folder, "sequence")
+        self._index = load_index(self._journal)
+
+    def _read(self, location: Location) -> V:
+        return cast(
+            V, decode(self._segments.read(location), self._mode, self._unmarshal)
+        )
+
+    def _position(self, index: int) -> int:
+        """Normalize a possibly negative index.
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        size = len(self._index)
+        i = index + size if index < 0 else index
+        if i < 0 or i >= size:
+            raise IndexError("sequence index out of range")
+        return i
+
+    def __len__(self) -> int:
+        """Return number of items in sequence."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[V]:
+        """Iterate over all items in order."""
+        for location in list(self._index):
+            yield self._read(location)
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[V]: ...
+
+    def __getitem__(self, index: int | slice) -> V | Sequence[V]:
+        """Retrieve item(s) by index.
+
+        Args:
+            index: Integer index or slice
+
+        Returns:
+            Single item for int index, list of items for slice
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            return [self._read(location) for location in self._index[index]]
+        return self._read(self._index[self._position(index)])
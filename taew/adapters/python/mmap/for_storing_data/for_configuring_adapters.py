@@ -0,0 +1,62 @@
+"""Configurator for segment file storage adapters.
+
+Provides configuration support for both the packed DataRepository and the
+log-structured DataSequence implementations, supporting both binary
+(streaming) and text (stringizing) serialization formats.
+"""
+
+from pathlib import Path
+from typing import Any, Callable
+from dataclasses import dataclass, field
+
+from taew.domain.configuration import PortsMapping
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+from .data_sequence import DEFAULT_SEGMENT_SIZE
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configurator for segment file storage adapters.
+
+    Accepts a serialization configurator instance and provides nested ports
+    configuration. Defers _package and _file to application-level derived classes.
+
+    Attributes:
+        _folder: Directory path for segment and index files
+        _serialization: Configurator instance for serialization (streaming or stringizing)
+        _key_type: Callable to convert string keys to the appropriate type (for repositories)
+        _segment_size: Size in bytes after which a new segment file is started
+        _compact_ratio: Garbage to stored bytes ratio that triggers compaction
+    """
+
+    _folder: Path = field(kw_only=True)
+    _serialization: ConfigureProtocol = field(kw_only=True)
+    _key_type: Callable[[str], Any] = field(kw_only=True, default=str)
+    _segment_size: int = field(kw_only=True, default=DEFAULT_SEGMENT_SIZE)
+    _compact_ratio: float = field(kw_only=True, default=0.5)
+    _ports: str = field(kw_only=True, default="ports")
+    _root_marker: str = field(kw_only=True, default="/adapters")
+
+    def _collect_kwargs(self) -> dict[str, object]:
+        """Collect kwargs for adapter instantiation.
+
+        Returns:
+            Dictionary of kwargs for segment file adapters
+        """
+        return {
+            "_folder": self._folder,
+            "_key_type": self._key_type,
+            "_segment_size": self._segment_size,
+            "_compact_ratio": self._compact_ratio,
+        }
+
+    def _nested_ports(self) -> PortsMapping:
+        """Get nested ports from serialization configurator.
+
+        Returns:
+            PortsMapping containing serialization port configuration
+        """
+        return self._serialization()
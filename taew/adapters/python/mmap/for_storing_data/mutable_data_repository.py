@@ -0,0 +1,108 @@
+"""Packed segment file MutableDataRepository implementation.
+
+Provides read-write key-value storage backed by append-only segment files.
+"""
+
+from typing import Optional, TypeVar
+from dataclasses import dataclass, field
+
+from taew.ports.for_storing_data import (
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from .data_repository import DataRepository
+from ._segments import needs_compaction
+from ._common import Marshal, detect_mode, encode
+from taew.adapters.python.dir.for_storing_data._common import validate_key
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Checkpoint the index once the journal holds this many records, or more
+# records than there are keys
+_MIN_CHECKPOINT_ENTRIES = 1024
+
+
+@dataclass(eq=False, frozen=True)
+class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[K, V]):
+    """Packed segment file mutable data repository.
+
+    __setitem__ appends the serialized value to the active segment and
+    points the key at it; __delitem__ only drops the key from the index.
+    Both append one record to the index journal. Space taken by replaced
+    and deleted values is reclaimed by compact(), run automatically once
+    garbage exceeds _compact_ratio of the stored bytes.
+
+    Attributes:
+        _serialize: Tuple of (marshaler, type) for serialization
+    """
+
+    _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _marshal: Marshal = field(init=False)
+    _live: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration."""
+        super().__post_init__()
+        marshal, type_ = self._serialize
+        object.__setattr__(self, "_marshal", marshal)
+        # Verify that serialize and deserialize modes match
+        if detect_mode(type_) != self._mode:
+            raise ValueError("Serialize and deserialize protocol types must match")
+        live = sum(location.length for location in self._index.values())
+        object.__setattr__(self, "_live", live)
+
+    def _refresh(self) -> None:
+        """Keep the index as is, it already holds every change written."""
+
+    def _maintain(self) -> None:
+        if self._journal.entries > max(len(self._index), _MIN_CHECKPOINT_ENTRIES):
+            self._journal.checkpoint((key, *loc) for key, loc in self._index.items())
+        if needs_compaction(self._segments, self._live, self._compact_ratio):
+            self.compact()
+
+    def compact(self) -> None:
+        """Copy live values into fresh segments and delete the old ones."""
+        keys = list(self._index)
+        locations, old = self._segments.copy([self._index[key] for key in keys])
+        self._index.update(zip(keys, locations))
+        self._journal.checkpoint((key, *loc) for key, loc in self._index.items())
+        self._segments.remove(old)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Store value under key.
+
+        Raises:
+            ValueError: If key contains invalid characters
+        """
+        name = str(key)
+        validate_key(name)
+        location = self._segments.append(encode(value, self._marshal))
+        self._journal.append("s", name, *location)
+        previous = self._index.get(name)
+        live = self._live + location.length - (previous.length if previous else 0)
+        object.__setattr__(self, "_live", live)
+        self._index[name] = location
+        self._maintain()
+
+    def __delitem__(self, key: K) -> None:
+        """Delete item by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        name = str(key)
+        if name not in self._index:
+            raise KeyError(f"Key '{key}' not found")
+        self._journal.append("d", name)
+        object.__setattr__(self, "_live", self._live - self._index.pop(name).length)
+        self._maintain()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Close segment and journal files; they are reopened on next use."""
+        self._journal.close()
+        self._segments.close()
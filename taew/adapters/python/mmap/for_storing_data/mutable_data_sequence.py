@@ -0,0 +1,145 @@
+"""Log-structured MutableDataSequence implementation.
+
+Provides read-write sequence storage backed by append-only segment files.
+"""
+
+from typing import Iterable, Optional, TypeVar, overload
+from dataclasses import dataclass, field
+
+from taew.ports.for_storing_data import (
+    MutableDataSequence as MutableDataSequenceProtocol,
+)
+from ._segments import Location, needs_compaction
+from .data_sequence import DataSequence
+from ._common import Marshal, detect_mode, encode
+
+V = TypeVar("V")
+
+# Checkpoint the index once the journal holds this many records, or more
+# records than there are items
+_MIN_CHECKPOINT_ENTRIES = 1024
+
+
+@dataclass(eq=False, kw_only=True)
+class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
+    """Log-structured mutable data sequence.
+
+    Every write appends the serialized item to the active segment; insert,
+    __setitem__ and __delitem__ then only edit the in-memory index and
+    append one record to the index journal, so no file is ever renamed or
+    rewritten. Space taken by replaced and deleted items is reclaimed by
+    compact(), run automatically once garbage exceeds _compact_ratio of
+    the stored bytes.
+
+    Attributes:
+        _serialize: Tuple of (marshaler, type) for serialization
+    """
+
+    _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _marshal: Marshal = field(init=False)
+    _live: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration."""
+        super().__post_init__()
+        marshal, type_ = self._serialize
+        self._marshal = marshal
+        # Verify that serialize and deserialize modes match
+        if detect_mode(type_) != self._mode:
+            raise ValueError("Serialize and deserialize protocol types must match")
+        self._live = sum(location.length for location in self._index)
+
+    def _append(self, value: V) -> Location:
+        location = self._segments.append(encode(value, self._marshal))
+        self._live += location.length
+        return location
+
+    def _maintain(self) -> None:
+        if self._journal.entries > max(len(self._index), _MIN_CHECKPOINT_ENTRIES):
+            self._journal.checkpoint(self._index)
+        if needs_compaction(self._segments, self._live, self._compact_ratio):
+            self.compact()
+
+    def compact(self) -> None:
+        """Copy live items into fresh segments and delete the old ones."""
+        index, old = self._segments.copy(self._index)
+        self._index = index
+        self._journal.checkpoint(index)
+        self._segments.remove(old)
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MutableDataSequenceProtocol[V]: ...
+
+    # Delegate to base implementation; overloads satisfy typing for MutableSequence
+    def __getitem__(self, index: int | slice) -> MutableDataSequenceProtocol[V] | V:
+        """Retrieve item(s) by index.
+
+        Runtime returns a list for slices; typed as MutableDataSequenceProtocol
+        for compatibility with MutableSequence protocol.
+        """
+        return super().__getitem__(index)  # type: ignore[return-value]
+
+    @overload
+    def __setitem__(self, index: int, value: V) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[V]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: V | Iterable[V]) -> None:
+        """Set item by index.
+
+        Raises:
+            TypeError: For slice assignment
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            raise TypeError("slice assignment is not supported")
+        i = self._position(index)
+        location = self._append(value)  # type: ignore[arg-type]
+        self._journal.append("s", i, *location)
+        self._live -= self._index[i].length
+        self._index[i] = location
+        self._maintain()
+
+    @overload
+    def __delitem__(self, index: int) -> None: ...
+
+    @overload
+    def __delitem__(self, index: slice) -> None: ...
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Delete item by index.
+
+        Raises:
+            TypeError: For slice deletion
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            raise TypeError("slice deletion is not supported")
+        i = self._position(index)
+        self._journal.append("d", i)
+        self._live -= self._index.pop(i).length
+        self._maintain()
+
+    def insert(self, index: int, value: V) -> None:
+        """Insert item at index, clamped to the sequence bounds."""
+        size = len(self._index)
+        i = index + size if index < 0 else index
+        i = min(max(i, 0), size)
+        location = self._append(value)
+        self._journal.append("i", i, *location)
+        self._index.insert(i, location)
+        self._maintain()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Close segment and journal files; they are reopened on next use."""
+        self._journal.close()
+        self._segments.close()
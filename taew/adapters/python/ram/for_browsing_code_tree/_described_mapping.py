@@ -1,14 +1,25 @@
-from types import MappingProxyType
-from functools import cached_property
-from typing import TypeVar, Generic, Optional
+import sys
+from typing import Any, TypeVar, Generic, Optional
 from collections.abc import Iterable, Iterator
 
 V = TypeVar("V")
 
 
 class NameMapping(Generic[V]):
+    """Read-only name mapping with interned keys and no per-instance __dict__.
+
+    Items are copied once into a private dict; names are interned so that
+    trees sharing the same names share the key strings.
+    """
+
+    __slots__ = ("_mapping",)
+
     def __init__(self, items: dict[str, V]) -> None:
-        self._mapping = MappingProxyType(dict(items))  # immutable view
+        self._mapping = {sys.intern(name): value for name, value in items.items()}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so that unpickled names are interned too
+        return type(self), (self._mapping,)
 
     def __getitem__(self, name: str) -> V:
         return self._mapping[name]
@@ -33,11 +44,16 @@ class NameMapping(Generic[V]):
 
 
 class DescribedMapping(NameMapping[V]):
+    __slots__ = ("_description",)
+
     def __init__(self, description: str, items: dict[str, V]) -> None:
         super().__init__(items)
         self._description = description
 
-    @cached_property
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self._description, self._mapping)
+
+    @property
     def description(self) -> str:
         return self._description
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from taew.domain.argument import ArgumentKind
 
 
-@dataclass(eq=False, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class DefaultValue:
     """RAM adapter implementation of default parameter values."""
 
@@ -20,19 +20,19 @@ class DefaultValue:
         return self._value
 
 
-@dataclass(eq=False, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class AnnotatedEntity:
     annotation: Any
     spec: tuple[Any, tuple[Any, ...]]
     description: str
 
 
-@dataclass(eq=False, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class ReturnValue(AnnotatedEntity):
     pass
 
 
-@dataclass(eq=False, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class Argument(AnnotatedEntity):
     """RAM adapter implementation of function/method parameters with type validation."""
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import Any
+from taew.utils.validators import compile_validator
 from taew.domain.argument import POSITIONAL_ONLY
 from taew.ports.for_browsing_code_tree import Function, is_interface
 
@@ -116,8 +117,13 @@ class Call:
 
             args_pos, value = state_machine[current_state][arg.kind](name, i)
 
+            if is_interface(arg):
+                continue
+            # RAM annotations describe the value as collected: *args
+            # arrives as one tuple, **kwargs values one by one
+            is_valid = compile_validator(arg.annotation)
             for v in value:
-                if not is_interface(arg) and not isinstance(v, arg.annotation):
+                if not is_valid(v):
                     raise TypeError(
                         f"Argument '{name}' must be of type {arg.annotation}, got {type(v)}"
                     )
@@ -3,4 +3,4 @@ from taew.ports.for_browsing_code_tree import Function, Class
 
 
 class Module(DescribedMapping[Function | Class]):
-    pass
+    __slots__ = ()
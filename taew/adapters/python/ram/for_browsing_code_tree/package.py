@@ -1,3 +1,4 @@
+from typing import Any
 from ._described_mapping import DescribedMapping
 from taew.ports.for_browsing_code_tree import (
     Function,
@@ -8,6 +9,8 @@ from taew.ports.for_browsing_code_tree import (
 
 
 class Package(DescribedMapping[Function | Class | Module | PackageProtocol]):
+    __slots__ = ("_version",)
+
     def __init__(
         self,
         description: str,
@@ -17,6 +20,9 @@ class Package(DescribedMapping[Function | Class | Module | PackageProtocol]):
         super().__init__(description, items)
         self._version = version
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self._description, self._mapping, self._version)
+
     @property
     def version(self) -> str:
         return self._version
@@ -1,10 +1,23 @@
 import pickle
 import base64
+from functools import lru_cache
 from ._described_mapping import NameMapping
 from taew.ports.for_browsing_code_tree import Module, Package
 
 
 class Root(NameMapping[Module | Package]):
+    __slots__ = ()
+
     def change_root(self, new_root: str) -> "Root":
-        pickled_data = base64.b64decode(new_root.encode("utf-8"))
-        return Root(pickle.loads(pickled_data))
+        return _decode_root(new_root)
+
+
+@lru_cache(maxsize=32)
+def _decode_root(new_root: str) -> Root:
+    """Decode a base64 pickled root once per encoded string.
+
+    Roots are read-only, so the decoded instance is shared by every caller
+    switching to the same encoded root.
+    """
+    pickled_data = base64.b64decode(new_root.encode("utf-8"))
+    return Root(pickle.loads(pickled_data))
@@ -0,0 +1,267 @@
+"""Code tree snapshots for the RAM browsing adapter.
+
+A snapshot is a compact pickled description of a code tree: names, kinds,
+descriptions, argument specs and module paths. ``dump``/``dumps`` walk any
+Root (typically the inspect-backed one) and ``load``/``loads`` rebuild a RAM
+Root from it in one read. Functions and classes are resolved by import path
+only when they are called or their type is requested, so a snapshot-backed
+Root never crawls or parses the source tree.
+"""
+
+from __future__ import annotations
+import pickle
+import importlib
+from pathlib import Path
+from types import ModuleType
+from dataclasses import dataclass
+from functools import cached_property
+from collections.abc import Callable, Iterable
+from typing import Any, Final, Optional, cast
+
+from .root import Root
+from .module import Module
+from .package import Package
+from .function import Function
+from .annotated_entity import Argument, ReturnValue
+from taew.ports.for_browsing_code_tree import (
+    AnnotatedEntity,
+    Class as ClassProtocol,
+    Function as FunctionProtocol,
+    Module as ModuleProtocol,
+    Package as PackageProtocol,
+    Root as RootProtocol,
+    is_class,
+    is_function,
+    is_module,
+    is_package,
+)
+
+_FORMAT_VERSION: Final = 1
+
+_PACKAGE: Final = "p"
+_MODULE: Final = "m"
+_CLASS: Final = "c"
+_FUNCTION: Final = "f"
+
+# Methods looked up through getattr by the binder and CLI, even when inherited
+_LOOKUP_METHODS: Final = ("__init__", "__call__")
+
+Entry = tuple[Any, ...]
+Item = PackageProtocol | ModuleProtocol | ClassProtocol | FunctionProtocol
+
+
+def _resolve(module_name: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+@dataclass(eq=False, frozen=True)
+class ImportedCall:
+    """Call protocol implementation invoking a target resolved by import path."""
+
+    _module_name: str
+    _qualname: str
+
+    @cached_property
+    def _target(self) -> Callable[..., Any]:
+        return cast(Callable[..., Any], _resolve(self._module_name, self._qualname))
+
+    def __call__(self, func: FunctionProtocol, *args: Any, **kwargs: Any) -> Any:
+        return self._target(*args, **kwargs)
+
+
+@dataclass(eq=False, frozen=True)
+class Class:
+    """Snapshot class whose module and type are imported on first use."""
+
+    description: str
+    _module_name: str
+    _qualname: str
+    _functions: dict[str, FunctionProtocol]
+    _listed: tuple[str, ...]
+
+    @cached_property
+    def py_module(self) -> ModuleType:
+        return importlib.import_module(self._module_name)
+
+    @cached_property
+    def type_(self) -> type:
+        return cast(type, _resolve(self._module_name, self._qualname))
+
+    def items(self) -> Iterable[tuple[str, FunctionProtocol]]:
+        return ((name, self._functions[name]) for name in self._listed)
+
+    def __getitem__(self, name: str) -> FunctionProtocol:
+        return self._functions[name]
+
+    def get(
+        self, name: str, default: Optional[FunctionProtocol] = None
+    ) -> Optional[FunctionProtocol]:
+        return self._functions.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._functions
+
+    def __call__(self, *args: Any, **kwargs: Any) -> object:
+        return self.type_(*args, **kwargs)
+
+
+def _dump_annotated(entity: AnnotatedEntity) -> Entry:
+    return entity.annotation, entity.spec, entity.description
+
+
+def _dump_function(
+    name: str, func: FunctionProtocol, module_name: str, qualname: str
+) -> Entry:
+    arguments = tuple(
+        (
+            arg_name,
+            *_dump_annotated(arg),
+            None if (empty := arg.default.is_empty()) else arg.default.value,
+            not empty,
+            arg.kind,
+        )
+        for arg_name, arg in func.items()
+    )
+    return (
+        _FUNCTION,
+        name,
+        func.description,
+        module_name,
+        qualname,
+        _dump_annotated(func.returns),
+        arguments,
+    )
+
+
+def _dump_class(name: str, cls: ClassProtocol, module_name: str) -> Entry:
+    methods = dict(cls.items())
+    listed = tuple(methods)
+    for method_name in _LOOKUP_METHODS:
+        if method_name not in methods and (method := cls.get(method_name)):
+            methods[method_name] = method
+    return (
+        _CLASS,
+        name,
+        cls.description,
+        module_name,
+        name,
+        tuple(
+            _dump_function(method_name, method, module_name, f"{name}.{method_name}")
+            for method_name, method in methods.items()
+        ),
+        listed,
+    )
+
+
+def _dump_callable(name: str, item: Item, module_name: str) -> Optional[Entry]:
+    if is_class(item):
+        entry = _dump_class(name, item, module_name)
+    elif is_function(item):
+        entry = _dump_function(name, item, module_name, name)
+    else:
+        return None
+    try:
+        pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Annotations or defaults that cannot be pickled cannot be snapshotted
+        return None
+    return entry
+
+
+def _dump_items(items: Iterable[tuple[str, Item]], prefix: str) -> tuple[Entry, ...]:
+    entries: list[Entry] = []
+    for name, item in sorted(items, key=lambda pair: pair[0]):
+        if name.startswith(("_", ".")):
+            continue
+        dotted = f"{prefix}.{name}" if prefix else name
+        if is_package(item):
+            children = _dump_items(item.items(), dotted)
+            entries.append((_PACKAGE, name, item.description, item.version, children))
+        elif is_module(item):
+            children = _dump_items(item.items(), dotted)
+            entries.append((_MODULE, name, item.description, children))
+        elif (entry := _dump_callable(name, item, prefix)) is not None:
+            entries.append(entry)
+    return tuple(entries)
+
+
+def _load_function(entry: Entry) -> Function:
+    _, _, description, module_name, qualname, returns, arguments = entry
+    return Function(
+        description=description,
+        returns=ReturnValue(*returns),
+        items_=tuple((arg[0], Argument(*arg[1:])) for arg in arguments),
+        call=ImportedCall(module_name, qualname),
+    )
+
+
+def _load_entry(entry: Entry) -> Item:
+    kind = entry[0]
+    if kind == _PACKAGE:
+        _, _, description, version, children = entry
+        return Package(description, _load_items(children), version)
+    if kind == _MODULE:
+        _, _, description, children = entry
+        return Module(description, _load_items(children))
+    if kind == _CLASS:
+        _, _, description, module_name, qualname, methods, listed = entry
+        functions: dict[str, FunctionProtocol] = {
+            method[1]: _load_function(method) for method in methods
+        }
+        return Class(description, module_name, qualname, functions, listed)
+    if kind == _FUNCTION:
+        return _load_function(entry)
+    raise ValueError(f"Unknown code tree snapshot entry kind: {kind!r}")
+
+
+def _load_items(entries: Iterable[Entry]) -> dict[str, Any]:
+    return {entry[1]: _load_entry(entry) for entry in entries}
+
+
+def dumps(root: RootProtocol, *names: str) -> bytes:
+    """Walk a code tree and return its snapshot.
+
+    Args:
+        root: Root to walk, typically the inspect-backed Root
+        *names: Top-level packages or modules to include (default: all public)
+
+    Returns:
+        Pickled snapshot bytes
+    """
+    items: Iterable[tuple[str, Item]] = (
+        [(name, root[name]) for name in names] if names else root.items()
+    )
+    return pickle.dumps(
+        (_FORMAT_VERSION, _dump_items(items, "")), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def loads(data: bytes) -> Root:
+    """Rebuild a RAM Root from snapshot bytes.
+
+    Args:
+        data: Snapshot bytes produced by dumps()
+
+    Returns:
+        RAM Root resolving functions and classes lazily by import path
+
+    Raises:
+        ValueError: If the snapshot format is not supported
+    """
+    version, entries = pickle.loads(data)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported code tree snapshot version: {version}")
+    return Root(_load_items(entries))
+
+
+def dump(root: RootProtocol, path: Path, *names: str) -> None:
+    """Walk a code tree and write its snapshot to path."""
+    path.write_bytes(dumps(root, *names))
+
+
+def load(path: Path) -> Root:
+    """Rebuild a RAM Root from the snapshot file at path in one read."""
+    return loads(path.read_bytes())
@@ -21,11 +21,16 @@ class Configure(ConfigureBase, Generic[K, V]):
 
     Provides simple configuration for in-memory storage. Unlike dir adapters,
     RAM adapters don't require serialization or other complex configuration.
+
+    Attributes:
+        _values: Initial contents of the repository
+        _indexes: Value fields to keep secondary indexes on (mutable repository)
     """
 
     _ports: str = field(kw_only=True, default="ports")
     _root_marker: str = field(kw_only=True, default="/adapters")
     _values: dict[K, V] = field(kw_only=True, default_factory=dict[K, V])
+    _indexes: tuple[str, ...] = field(kw_only=True, default=())
 
     def _collect_kwargs(self) -> dict[str, object]:
         """Collects keyword arguments for configuring the adapter.
@@ -33,4 +38,4 @@ class Configure(ConfigureBase, Generic[K, V]):
         Returns:
             dict[str, object]: A dictionary of keyword arguments.
         """
-        return {"kwargs": self._values}
+        return {"kwargs": self._values, "_indexes": self._indexes}
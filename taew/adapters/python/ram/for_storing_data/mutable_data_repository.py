@@ -3,9 +3,12 @@
 Provides read-write key-value storage backed by in-memory dictionary.
 """
 
-from typing import TypeVar
 from collections import UserDict
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Optional, Self, TypeVar
 
+from taew.domain.query import Where
+from taew.utils.indexes import Indexes, select
 from taew.ports.for_storing_data import (
     MutableDataRepository as MutableDataRepositoryProtocol,
 )
@@ -13,13 +16,121 @@ from taew.ports.for_storing_data import (
 K = TypeVar("K")
 V = TypeVar("V")
 
+# Undo log marker of a key that was absent before the transaction
+_MISSING = object()
+
 
 class MutableDataRepository(UserDict[K, V], MutableDataRepositoryProtocol[K, V]):
     """RAM-based mutable data repository extending read-only capabilities.
 
     Inherits all functionality from dict, providing
     full mutable dictionary operations.
-    The query, __enter__ and __exit__ methods are inherited from the ABC.
+
+    Fields named in _indexes get secondary indexes, maintained on every
+    change and used by query() for the where predicates on them.
+
+    A with block is a transaction: changes apply immediately, and the
+    previous value of every key changed in the block is kept in an undo
+    log, replayed if the block raises. Nested blocks join the outermost.
     """
 
-    pass
+    _undo: Optional[dict[K, object]] = None
+    _depth: int = 0
+
+    def __init__(
+        self,
+        data: Optional[dict[K, V]] = None,
+        /,
+        *,
+        _indexes: tuple[str, ...] = (),
+        **kwargs: V,
+    ) -> None:
+        self._index = Indexes(_indexes)
+        super().__init__(data, **kwargs)
+
+    def _remember(self, key: K) -> None:
+        if self._undo is not None and key not in self._undo:
+            self._undo[key] = self.data[key] if key in self.data else _MISSING
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._remember(key)
+        if self._index:
+            self._index.put(key, value)
+        self.data[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        self._remember(key)
+        del self.data[key]
+        self._index.discard(key)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of the stored keys among keys."""
+        data = self.data
+        return {key: data[key] for key in keys if key in data}
+
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values with a single dict update."""
+        items = dict(items)
+        if self._undo is not None or self._index:
+            for key, value in items.items():
+                self._remember(key)
+                if self._index:
+                    self._index.put(key, value)
+        self.data.update(items)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys, ignoring keys that are not stored."""
+        for key in keys:
+            if key in self.data:
+                del self[key]
+
+    def query(
+        self,
+        *,
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
+        sort_key: Optional[Callable[[V], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterable[V]:
+        """Query stored values, looking up indexed where fields."""
+        keys = self._index.candidates(where) if where and self._index else None
+        return select(
+            self,
+            keys,
+            filter_fn=filter_fn,
+            where=where,
+            sort_key=sort_key,
+            reverse=reverse,
+            limit=limit,
+            offset=offset,
+        )
+
+    def __enter__(self) -> Self:
+        """Start a transaction, or join the one in progress."""
+        if not self._depth:
+            self._undo = {}
+        self._depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Commit the transaction, or roll it back if the block raised."""
+        self._depth -= 1
+        if self._depth:
+            return
+        undo, self._undo = self._undo or {}, None
+        if exc_type is not None:
+            for key, value in undo.items():
+                if value is _MISSING:
+                    self.data.pop(key, None)
+                    self._index.discard(key)
+                else:
+                    self.data[key] = value  # type: ignore[assignment]
+                    if self._index:
+                        self._index.put(key, value)
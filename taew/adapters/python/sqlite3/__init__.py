@@ -0,0 +1 @@
+"""sqlite3 adapter."""
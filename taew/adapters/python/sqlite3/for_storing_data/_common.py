@@ -0,0 +1,89 @@
+"""Connection and transaction helpers shared by the sqlite3 storage adapters.
+
+Databases are opened in WAL mode, so readers never block the writer and
+commits append to the log instead of rewriting pages in place; with
+synchronous=NORMAL a commit is durable once the log is checkpointed. The
+connection runs in autocommit mode: a write outside a with block is its
+own transaction, and Transaction groups the writes of a with block.
+
+Values are stored as marshaled by the configured serialization adapters,
+as BLOB for streaming (binary) and TEXT for stringizing (text) adapters.
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Final, Pattern
+
+from taew.adapters.python.dir.for_storing_data._common import (
+    Marshal,
+    Mode,
+    Unmarshal,
+    detect_mode,
+)
+
+__all__ = [
+    "Marshal",
+    "Mode",
+    "Transaction",
+    "Unmarshal",
+    "connect",
+    "detect_mode",
+    "validate_identifier",
+]
+
+_IDENTIFIER_PATTERN: Final[Pattern[str]] = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def validate_identifier(name: str) -> None:
+    """Validate a table or field name used in SQL text.
+
+    Raises:
+        ValueError: If name is not a plain identifier
+    """
+    if not _IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Invalid SQL identifier: '{name}'")
+
+
+def connect(database: Path) -> sqlite3.Connection:
+    """Open database in WAL mode, creating it and its folder if needed."""
+    database.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(database, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class Transaction:
+    """Nested with blocks over an autocommit connection.
+
+    The outermost block starts an immediate transaction, taking the write
+    lock up front, and commits it, or rolls it back if the block raised.
+    Nested blocks join the outermost.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self.depth = 0
+
+    def enter(self) -> bool:
+        """Enter a block; return whether it started the transaction."""
+        if not self.depth:
+            self._connection.execute("BEGIN IMMEDIATE")
+        self.depth += 1
+        return self.depth == 1
+
+    def exit(self, commit: bool) -> bool:
+        """Leave a block; return whether it ended the transaction."""
+        self.depth -= 1
+        if self.depth:
+            return False
+        if commit:
+            try:
+                self._connection.execute("COMMIT")
+                return True
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        self._connection.execute("ROLLBACK")
+        return True
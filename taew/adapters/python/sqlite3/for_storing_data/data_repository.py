@@ -0,0 +1,257 @@
+"""sqlite3 DataRepository implementation.
+
+Provides read-only key-value storage backed by a table of an SQLite
+database file.
+"""
+
+import sqlite3
+from pathlib import Path
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional, TypeVar, cast
+
+from taew.domain.query import In, Range, Where, field_value, matches, paginate
+from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from ._common import Mode, Unmarshal, connect, detect_mode, validate_identifier
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Keys bound per statement by get_many, well below SQLite's variable limit
+_MAX_PARAMETERS = 500
+
+
+def column(name: str) -> str:
+    """Return the column holding the value field name."""
+    return f'"field_{name}"'
+
+
+@dataclass(eq=False, frozen=True)
+class DataRepository(DataRepositoryProtocol[K, V]):
+    """SQLite table read-only data repository.
+
+    Implements DataRepository protocol over a (key, value) table holding
+    str(key) and the serialized value. Supports both binary (streaming)
+    and text (stringizing) serialization formats.
+
+    Every field named in _indexes gets a column holding the field of each
+    value and an SQL index on it; missing columns are added and filled from
+    the stored values when the repository is created. Fields must hold
+    values SQLite can store (None, int, float, str or bytes). query()
+    answers where predicates on these fields in SQL, and pushes limit and
+    offset down to it too when nothing is left to filter or sort in Python.
+
+    Attributes:
+        _database: Path of the SQLite database file
+        _deserialize: Tuple of (unmarshaler, type) for deserialization
+        _key_type: Function to convert string to key type
+        _table: Name of the table holding the items
+        _indexes: Value fields to keep indexed columns for
+    """
+
+    _database: Path
+    _deserialize: tuple[Unmarshal, type]
+    _key_type: Callable[[str], K]
+    _table: str = field(kw_only=True, default="repository")
+    _indexes: tuple[str, ...] = ()
+    _unmarshal: Unmarshal = field(init=False)
+    _mode: Mode = field(init=False)
+    _connection: sqlite3.Connection = field(init=False)
+    _sql: dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize configuration and open the database.
+
+        Raises:
+            ValueError: If the table or an indexed field name is not a
+                        plain identifier
+        """
+        validate_identifier(self._table)
+        for name in self._indexes:
+            validate_identifier(name)
+        unmarshal, type_ = self._deserialize
+        object.__setattr__(self, "_unmarshal", unmarshal)
+        object.__setattr__(self, "_mode", detect_mode(type_))
+        object.__setattr__(self, "_connection", connect(self._database))
+        table = f'"{self._table}"'
+        columns = ", ".join(["key", "value", *map(column, self._indexes)])
+        marks = ", ".join("?" * (2 + len(self._indexes)))
+        sql = {
+            "count": f"SELECT count(*) FROM {table}",
+            "keys": f"SELECT key FROM {table}",
+            "get": f"SELECT value FROM {table} WHERE key = ?",
+            "contains": f"SELECT 1 FROM {table} WHERE key = ?",
+            "set": f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({marks})",
+            "delete": f"DELETE FROM {table} WHERE key = ?",
+        }
+        object.__setattr__(self, "_sql", sql)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the table, and the indexed columns it lacks."""
+        table = f'"{self._table}"'
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+        )
+        existing = {
+            row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")
+        }
+        missing = [name for name in self._indexes if f"field_{name}" not in existing]
+        if not missing:
+            return
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            for name in missing:
+                self._connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column(name)}"
+                )
+                self._connection.execute(
+                    f'CREATE INDEX "{self._table}_{name}" ON {table} ({column(name)})'
+                )
+            assignments = ", ".join(f"{column(name)} = ?" for name in missing)
+            rows = self._connection.execute(f"SELECT key, value FROM {table}")
+            self._connection.executemany(
+                f"UPDATE {table} SET {assignments} WHERE key = ?",
+                (
+                    (*self._fields(self._decode(data), missing), key)
+                    for key, data in rows.fetchall()
+                ),
+            )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def _decode(self, data: str | bytes) -> V:
+        return cast(V, self._unmarshal(data))  # type: ignore[arg-type]
+
+    def _fields(self, value: object, names: Iterable[str]) -> tuple[Any, ...]:
+        return tuple(field_value(value, name) for name in names)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """Return number of items in repository."""
+        return cast(int, self._connection.execute(self._sql["count"]).fetchone()[0])
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over all keys."""
+        for (name,) in self._connection.execute(self._sql["keys"]):
+            yield self._key_type(name)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key is stored, without reading its value."""
+        cursor = self._connection.execute(self._sql["contains"], (str(key),))
+        return cursor.fetchone() is not None
+
+    def __getitem__(self, key: K) -> V:
+        """Retrieve value by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        row = self._connection.execute(self._sql["get"], (str(key),)).fetchone()
+        if row is None:
+            raise KeyError(f"Item with key '{key}' not found")
+        return self._decode(row[0])
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of the stored keys among keys.
+
+        Keys are looked up with one IN query per few hundred keys.
+        """
+        named = {str(key): key for key in keys}
+        names = list(named)
+        found: dict[K, V] = {}
+        for start in range(0, len(names), _MAX_PARAMETERS):
+            chunk = names[start : start + _MAX_PARAMETERS]
+            cursor = self._connection.execute(
+                f'SELECT key, value FROM "{self._table}" '
+                f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for name, data in cursor:
+                found[named[name]] = self._decode(data)
+        return found
+
+    def _where_sql(self, where: Where) -> tuple[list[str], list[Any], dict[str, Any]]:
+        """Translate the predicates of where on indexed fields to SQL.
+
+        Returns:
+            SQL conditions, their parameters, and the predicates left for
+            Python
+        """
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        rest: dict[str, Any] = {}
+        for name, predicate in where.items():
+            if name not in self._indexes:
+                rest[name] = predicate
+                continue
+            target = column(name)
+            if isinstance(predicate, In):
+                values = [value for value in predicate.values if value is not None]
+                options = [f"{target} IN ({', '.join('?' * len(values))})"]
+                if None in predicate.values:
+                    options.append(f"{target} IS NULL")
+                conditions.append(f"({' OR '.join(options)})")
+                parameters.extend(values)
+            elif isinstance(predicate, Range):
+                for bound, operator in (
+                    (predicate.ge, ">="),
+                    (predicate.gt, ">"),
+                    (predicate.le, "<="),
+                    (predicate.lt, "<"),
+                ):
+                    if bound is not None:
+                        conditions.append(f"{target} {operator} ?")
+                        parameters.append(bound)
+            else:
+                conditions.append(f"{target} IS ?")
+                parameters.append(predicate)
+        return conditions, parameters, rest
+
+    def query(
+        self,
+        *,
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
+        sort_key: Optional[Callable[[V], Any]] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterable[V]:
+        """Query stored values, filtering indexed where fields in SQL.
+
+        Raises:
+            ValueError: If limit or offset is negative
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("limit and offset must not be negative")
+        conditions, parameters, rest = self._where_sql(where or {})
+        sql = f'SELECT value FROM "{self._table}"'
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        if not rest and filter_fn is None and sort_key is None:
+            if limit is None and not offset:
+                return self._values(sql, parameters)
+            sql += " ORDER BY key LIMIT ? OFFSET ?"
+            return self._values(
+                sql, [*parameters, -1 if limit is None else limit, offset]
+            )
+        matching = (
+            value
+            for value in self._values(sql, parameters)
+            if (not rest or matches(value, rest))
+            and (filter_fn is None or filter_fn(value))
+        )
+        return paginate(
+            matching, sort_key=sort_key, reverse=reverse, limit=limit, offset=offset
+        )
+
+    def _values(self, sql: str, parameters: list[Any]) -> Iterator[V]:
+        for (data,) in self._connection.execute(sql, parameters):
+            yield self._decode(data)
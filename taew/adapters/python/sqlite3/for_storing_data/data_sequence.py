@@ -0,0 +1,143 @@
+"""sqlite3 DataSequence implementation.
+
+Provides read-only sequence storage backed by a table of an SQLite
+database file.
+"""
+
+import sqlite3
+from array import array
+from pathlib import Path
+from dataclasses import dataclass, field
+from collections.abc import Iterator, Sequence
+from typing import TypeVar, cast, overload
+
+from taew.ports.for_storing_data import DataSequence as DataSequenceProtocol
+from ._common import Mode, Unmarshal, connect, detect_mode, validate_identifier
+
+V = TypeVar("V")
+
+
+@dataclass(eq=False)
+class DataSequence(DataSequenceProtocol[V]):
+    """SQLite table read-only data sequence.
+
+    Implements DataSequence protocol over an (id, pos, value) table, items
+    ordered by their integer position pos. Positions are spaced apart, so
+    an insert takes a free position between its neighbours instead of
+    renumbering the items after it. The ids and positions of all items,
+    in order, are loaded into memory when the sequence is created, so an
+    item is read by its primary key. Supports both binary (streaming) and
+    text (stringizing) serialization formats.
+
+    Attributes:
+        _database: Path of the SQLite database file
+        _deserialize: Tuple of (unmarshaler, type) for deserialization
+        _table: Name of the table holding the items
+    """
+
+    _database: Path
+    _deserialize: tuple[Unmarshal, type]
+    _table: str = field(kw_only=True, default="sequence")
+    _unmarshal: Unmarshal = field(init=False)
+    _mode: Mode = field(init=False)
+    _connection: sqlite3.Connection = field(init=False)
+    _ids: array[int] = field(init=False)
+    _positions: array[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize configuration, open the database and load the order.
+
+        Raises:
+            ValueError: If the table name is not a plain identifier
+        """
+        validate_identifier(self._table)
+        unmarshal, type_ = self._deserialize
+        self._unmarshal = unmarshal
+        self._mode = detect_mode(type_)
+        self._connection = connect(self._database)
+        self._connection.execute(
+            f'CREATE TABLE IF NOT EXISTS "{self._table}" '
+            "(id INTEGER PRIMARY KEY, pos INTEGER NOT NULL, value BLOB NOT NULL)"
+        )
+        self._connection.execute(
+            f'CREATE INDEX IF NOT EXISTS "{self._table}_pos" ON "{self._table}" (pos)'
+        )
+        self._ids, self._positions = array("q"), array("q")
+        for id_, position in self._connection.execute(
+            f'SELECT id, pos FROM "{self._table}" ORDER BY pos, id'
+        ):
+            self._ids.append(id_)
+            self._positions.append(position)
+
+    def _read(self, id_: int) -> V:
+        row = self._connection.execute(
+            f'SELECT value FROM "{self._table}" WHERE id = ?', (id_,)
+        ).fetchone()
+        return cast(V, self._unmarshal(row[0]))
+
+    def _position(self, index: int) -> int:
+        """Normalize a possibly negative index.
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        size = len(self._ids)
+        i = index + size if index < 0 else index
+        if i < 0 or i >= size:
+            raise IndexError("sequence index out of range")
+        return i
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """Return number of items in sequence."""
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[V]:
+        """Iterate over all items in order."""
+        for (data,) in self._connection.execute(
+            f'SELECT value FROM "{self._table}" ORDER BY pos, id'
+        ):
+            yield cast(V, self._unmarshal(data))
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[V]: ...
+
+    def __getitem__(self, index: int | slice) -> V | Sequence[V]:
+        """Retrieve item(s) by index.
+
+        Args:
+            index: Integer index or slice
+
+        Returns:
+            Single item for int index, list of items for slice
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self._read(self._ids[self._position(index)])
+
+    def _slice(self, index: slice) -> list[V]:
+        """Read the items of a slice with one range query over positions."""
+        selected = range(len(self._ids))[index]
+        if not selected:
+            return []
+        first, last = min(selected), max(selected)
+        values = {
+            id_: data
+            for id_, data in self._connection.execute(
+                f'SELECT id, value FROM "{self._table}" WHERE pos BETWEEN ? AND ?',
+                (self._positions[first], self._positions[last]),
+            )
+        }
+        return [
+            cast(V, self._unmarshal(values[self._ids[i]]))  # type: ignore[arg-type]
+            for i in selected
+        ]
@@ -0,0 +1,63 @@
+"""Configurator for sqlite3 storage adapters.
+
+Provides configuration support for both DataRepository and DataSequence
+implementations, supporting both binary (streaming) and text (stringizing)
+serialization formats.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+
+from taew.domain.configuration import PortsMapping
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configurator for sqlite3 storage adapters.
+
+    Accepts a serialization configurator instance and provides nested ports
+    configuration. Defers _package and _file to application-level derived classes.
+
+    Attributes:
+        _database: Path of the SQLite database file
+        _serialization: Configurator instance for serialization (streaming or stringizing)
+        _table: Table name, None for the adapter default ("repository" or "sequence")
+        _key_type: Callable to convert string keys to the appropriate type (for repositories)
+        _indexes: Value fields to keep indexed columns for (for repositories)
+    """
+
+    _database: Path = field(kw_only=True)
+    _serialization: ConfigureProtocol = field(kw_only=True)
+    _table: Optional[str] = field(kw_only=True, default=None)
+    _key_type: Callable[[str], Any] = field(kw_only=True, default=str)
+    _indexes: tuple[str, ...] = field(kw_only=True, default=())
+    _ports: str = field(kw_only=True, default="ports")
+    _root_marker: str = field(kw_only=True, default="/adapters")
+
+    def _collect_kwargs(self) -> dict[str, object]:
+        """Collect kwargs for adapter instantiation.
+
+        Returns:
+            Dictionary of kwargs for sqlite3 adapters
+        """
+        kwargs: dict[str, object] = {
+            "_database": self._database,
+            "_key_type": self._key_type,
+            "_indexes": self._indexes,
+        }
+        if self._table is not None:
+            kwargs["_table"] = self._table
+        return kwargs
+
+    def _nested_ports(self) -> PortsMapping:
+        """Get nested ports from serialization configurator.
+
+        Returns:
+            PortsMapping containing serialization port configuration
+        """
+        return self._serialization()
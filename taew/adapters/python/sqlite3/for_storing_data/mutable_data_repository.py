@@ -0,0 +1,105 @@
+"""sqlite3 MutableDataRepository implementation.
+
+Provides read-write key-value storage backed by a table of an SQLite
+database file.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Optional, Self, TypeVar
+
+from taew.ports.for_storing_data import (
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from .data_repository import DataRepository
+from ._common import Marshal, Transaction, detect_mode
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(eq=False, frozen=True)
+class MutableDataRepository(DataRepository[K, V], MutableDataRepositoryProtocol[K, V]):
+    """SQLite table mutable data repository.
+
+    Extends DataRepository with write operations. Outside a with block
+    every write commits on its own. A with block is a transaction,
+    committed on exit or rolled back if the block raises; nested blocks
+    join the outermost. set_many and delete_many run as one transaction,
+    or join the one in progress.
+
+    Attributes:
+        _serialize: Tuple of (marshaler, type) for serialization
+    """
+
+    _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _marshal: Marshal = field(init=False)
+    _transaction: Transaction = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration."""
+        super().__post_init__()
+        marshal, type_ = self._serialize
+        object.__setattr__(self, "_marshal", marshal)
+        object.__setattr__(self, "_transaction", Transaction(self._connection))
+        # Verify that serialize and deserialize modes match
+        if detect_mode(type_) != self._mode:
+            raise ValueError("Serialize and deserialize protocol types must match")
+
+    def _row(self, key: K, value: V) -> tuple[Any, ...]:
+        data = self._marshal(value)  # type: ignore[operator]
+        return (str(key), data, *self._fields(value, self._indexes))
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Store value under key.
+
+        Args:
+            key: The key to store under
+            value: The value to store
+        """
+        self._connection.execute(self._sql["set"], self._row(key, value))
+
+    def __delitem__(self, key: K) -> None:
+        """Delete item by key.
+
+        Raises:
+            KeyError: If key does not exist
+        """
+        cursor = self._connection.execute(self._sql["delete"], (str(key),))
+        if not cursor.rowcount:
+            raise KeyError(f"Key '{key}' not found")
+
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values with one prepared statement in one transaction.
+
+        Args:
+            items: Mapping or iterable of (key, value) pairs to store
+        """
+        rows = [self._row(key, value) for key, value in dict(items).items()]
+        with self:
+            self._connection.executemany(self._sql["set"], rows)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys in one transaction, ignoring keys not stored.
+
+        Args:
+            keys: Keys to delete
+        """
+        with self:
+            self._connection.executemany(
+                self._sql["delete"], ((str(key),) for key in keys)
+            )
+
+    def __enter__(self) -> Self:
+        """Start a transaction, or join the one in progress."""
+        self._transaction.enter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Commit the transaction, or roll it back if the block raised."""
+        self._transaction.exit(exc_type is None)
@@ -0,0 +1,181 @@
+"""sqlite3 MutableDataSequence implementation.
+
+Provides read-write sequence storage backed by a table of an SQLite
+database file.
+"""
+
+from array import array
+from typing import Iterable, Optional, Self, TypeVar, overload
+from dataclasses import dataclass, field
+
+from taew.ports.for_storing_data import (
+    MutableDataSequence as MutableDataSequenceProtocol,
+)
+from .data_sequence import DataSequence
+from ._common import Marshal, Transaction, detect_mode
+
+V = TypeVar("V")
+
+# Distance between the positions of appended items, leaving room for 31
+# inserts in a row at the same index before the positions are respaced
+_GAP = 1 << 32
+_LIMIT = 1 << 62
+
+
+@dataclass(eq=False, kw_only=True)
+class MutableDataSequence(DataSequence[V], MutableDataSequenceProtocol[V]):
+    """SQLite table mutable data sequence.
+
+    insert() writes one row at a position halfway between its neighbours,
+    so its cost in the database does not grow with the items after it;
+    only when two neighbours are adjacent are all positions respaced.
+    __setitem__ and __delitem__ update or delete one row by id.
+
+    Outside a with block every write commits on its own. A with block is a
+    transaction, committed on exit or rolled back, together with the
+    in-memory order, if the block raises; nested blocks join the outermost.
+
+    Attributes:
+        _serialize: Tuple of (marshaler, type) for serialization
+    """
+
+    _serialize: tuple[Marshal, type] = None  # type: ignore[assignment]
+    _marshal: Marshal = field(init=False)
+    _transaction: Transaction = field(init=False)
+    _saved: Optional[tuple[array[int], array[int]]] = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Initialize and validate configuration."""
+        super().__post_init__()
+        marshal, type_ = self._serialize
+        self._marshal = marshal
+        self._transaction = Transaction(self._connection)
+        # Verify that serialize and deserialize modes match
+        if detect_mode(type_) != self._mode:
+            raise ValueError("Serialize and deserialize protocol types must match")
+
+    @overload
+    def __getitem__(self, index: int) -> V: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MutableDataSequenceProtocol[V]: ...
+
+    # Delegate to base implementation; overloads satisfy typing for MutableSequence
+    def __getitem__(self, index: int | slice) -> MutableDataSequenceProtocol[V] | V:
+        """Retrieve item(s) by index.
+
+        Runtime returns a list for slices; typed as MutableDataSequenceProtocol
+        for compatibility with MutableSequence protocol.
+        """
+        return super().__getitem__(index)  # type: ignore[return-value]
+
+    @overload
+    def __setitem__(self, index: int, value: V) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[V]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: V | Iterable[V]) -> None:
+        """Set item by index.
+
+        Raises:
+            TypeError: For slice assignment
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            raise TypeError("slice assignment is not supported")
+        id_ = self._ids[self._position(index)]
+        self._connection.execute(
+            f'UPDATE "{self._table}" SET value = ? WHERE id = ?',
+            (self._marshal(value), id_),  # type: ignore[operator]
+        )
+
+    @overload
+    def __delitem__(self, index: int) -> None: ...
+
+    @overload
+    def __delitem__(self, index: slice) -> None: ...
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Delete item by index.
+
+        Raises:
+            TypeError: For slice deletion
+            IndexError: If index is out of range
+        """
+        if isinstance(index, slice):
+            raise TypeError("slice deletion is not supported")
+        i = self._position(index)
+        self._connection.execute(
+            f'DELETE FROM "{self._table}" WHERE id = ?', (self._ids[i],)
+        )
+        del self._ids[i]
+        del self._positions[i]
+
+    def insert(self, index: int, value: V) -> None:
+        """Insert item at index, clamped to the sequence bounds."""
+        size = len(self._ids)
+        i = index + size if index < 0 else index
+        i = min(max(i, 0), size)
+        data = self._marshal(value)  # type: ignore[operator]
+        position = self._free_position(i)
+        if position is not None:
+            self._insert(i, position, data)
+            return
+        with self:
+            self._respace()
+            self._insert(i, self._free_position(i), data)  # type: ignore[arg-type]
+
+    def _insert(self, i: int, position: int, data: str | bytes) -> None:
+        cursor = self._connection.execute(
+            f'INSERT INTO "{self._table}" (pos, value) VALUES (?, ?)',
+            (position, data),
+        )
+        self._ids.insert(i, cursor.lastrowid)  # type: ignore[arg-type]
+        self._positions.insert(i, position)
+
+    def _free_position(self, i: int) -> Optional[int]:
+        """Return a position between items i - 1 and i, None if there is none."""
+        positions = self._positions
+        if not positions:
+            return 0
+        if i == len(positions):
+            position = positions[-1] + _GAP
+        elif i == 0:
+            position = positions[0] - _GAP
+        elif positions[i] - positions[i - 1] > 1:
+            position = (positions[i - 1] + positions[i]) // 2
+        else:
+            return None
+        return position if -_LIMIT <= position <= _LIMIT else None
+
+    def _respace(self) -> None:
+        """Space the positions of all items _GAP apart."""
+        positions = array("q", range(0, len(self._ids) * _GAP, _GAP))
+        self._connection.executemany(
+            f'UPDATE "{self._table}" SET pos = ? WHERE id = ?',
+            zip(positions, self._ids),
+        )
+        self._positions = positions
+
+    def __enter__(self) -> Self:
+        """Start a transaction, or join the one in progress."""
+        if self._transaction.enter():
+            self._saved = (array("q", self._ids), array("q", self._positions))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object],
+    ) -> None:
+        """Commit the transaction, or roll it back if the block raised."""
+        committed = False
+        try:
+            committed = self._transaction.exit(exc_type is None) and exc_type is None
+        finally:
+            if not self._transaction.depth:
+                saved, self._saved = self._saved, None
+                if not committed and saved is not None:
+                    self._ids, self._positions = saved
@@ -0,0 +1,21 @@
+"""Configuration adapter for sys.modules based code tree browsing."""
+
+from dataclasses import dataclass
+
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configure the sys.modules based Root for code tree browsing.
+
+    Suited to frozen applications, embedded interpreters and tests, where
+    the application modules are already imported or importable without
+    their source files.
+    """
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", __package__)
+        object.__setattr__(self, "_file", __file__)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+import inspect
+from typing import Optional
+from types import ModuleType
+from dataclasses import dataclass
+from collections.abc import Iterable
+from functools import cached_property
+from taew.ports.for_browsing_code_tree import Function, Class
+from taew.adapters.python.inspect.for_browsing_code_tree.module import wrap_member
+
+
+@dataclass(eq=False, frozen=True)
+class Module:
+    """Code tree Module over an already imported module object."""
+
+    _module: ModuleType
+
+    @cached_property
+    def description(self) -> str:
+        return inspect.getdoc(self._module) or ""
+
+    def items(self) -> Iterable[tuple[str, Function | Class]]:
+        for name in dir(self._module):
+            if name.startswith("_"):
+                continue
+            try:
+                yield name, self[name]
+            except KeyError:
+                continue
+
+    def __getitem__(self, name: str) -> Function | Class:
+        return wrap_member(self._module, self._module.__name__, name)
+
+    def get(
+        self, name: str, default: Optional[Function | Class] = None
+    ) -> Optional[Function | Class]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: str) -> bool:
+        if name.startswith("_"):
+            return False
+        obj = getattr(self._module, name, None)
+        return isinstance(obj, type) or callable(obj)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+import sys
+import inspect
+import pkgutil
+import importlib
+from types import ModuleType
+from dataclasses import dataclass
+from collections.abc import Iterable
+from functools import cached_property
+from typing import Optional
+from .module import Module
+from taew.ports.for_browsing_code_tree import (
+    Class,
+    Function,
+    Module as ModuleProtocol,
+    Package as PackageProtocol,
+)
+
+
+def child_names(module_name: str, path: Optional[Iterable[str]] = None) -> list[str]:
+    """Names of the direct submodules of a package, or of the top level.
+
+    Submodules already in sys.modules are listed first; for a package,
+    those its finders can locate on its __path__ are added.
+
+    Args:
+        module_name: Dotted package name, "" for the top level
+        path: The package __path__, if any
+    """
+    prefix = f"{module_name}." if module_name else ""
+    names = dict.fromkeys(
+        key[len(prefix) :]
+        for key in list(sys.modules)
+        if key.startswith(prefix) and "." not in key[len(prefix) :]
+    )
+    if path is not None:
+        names.update(dict.fromkeys(info.name for info in pkgutil.iter_modules(path)))
+    return list(names)
+
+
+def load_child(module_name: str, name: str) -> ModuleType:
+    """Return a direct submodule from sys.modules, importing it on a miss.
+
+    Raises:
+        KeyError: If there is no such module
+    """
+    fqname = f"{module_name}.{name}" if module_name else name
+    if (module := sys.modules.get(fqname)) is not None:
+        return module
+    try:
+        return importlib.import_module(fqname)
+    except ModuleNotFoundError as e:
+        if e.name != fqname:
+            raise
+        raise KeyError(f"'{name}' not found in '{module_name or 'sys.modules'}'")
+
+
+def wrap_module(module: ModuleType) -> Package | Module:
+    return Package(module) if hasattr(module, "__path__") else Module(module)
+
+
+def _defines_members(module: ModuleType) -> bool:
+    """Whether a package __init__ stands for the package, as for source files.
+
+    That is when it declares __all__ or defines public classes or functions
+    itself, the rule the source based Package applies to __init__.py.
+    """
+    if hasattr(module, "__all__"):
+        return True
+    return any(
+        not name.startswith("_")
+        and (inspect.isclass(obj) or inspect.isfunction(obj))
+        and getattr(obj, "__module__", None) == module.__name__
+        for name, obj in vars(module).items()
+    )
+
+
+@dataclass(eq=False, frozen=True)
+class Package:
+    """Code tree Package over an already imported package object.
+
+    Like the source based Package, a package whose __init__ declares
+    __all__ or defines public classes or functions exposes its members;
+    otherwise it exposes submodules.
+    """
+
+    _module: ModuleType
+
+    @cached_property
+    def _delegate_module(self) -> Optional[Module]:
+        return Module(self._module) if _defines_members(self._module) else None
+
+    @cached_property
+    def description(self) -> str:
+        return inspect.getdoc(self._module) or ""
+
+    @property
+    def version(self) -> str:
+        version = getattr(self._module, "__version__", "")
+        return version if isinstance(version, str) else ""
+
+    def items(
+        self,
+    ) -> Iterable[tuple[str, PackageProtocol | ModuleProtocol | Function | Class]]:
+        if self._delegate_module is not None:
+            yield from self._delegate_module.items()
+            return
+        package_name = self._module.__name__
+        for name in child_names(package_name, self._module.__path__):
+            if name.startswith("_"):
+                continue
+            try:
+                yield name, wrap_module(load_child(package_name, name))
+            except KeyError:
+                continue
+
+    def __getitem__(
+        self, name: str
+    ) -> PackageProtocol | ModuleProtocol | Function | Class:
+        if self._delegate_module is not None:
+            return self._delegate_module[name]
+        return wrap_module(load_child(self._module.__name__, name))
+
+    def get(
+        self,
+        name: str,
+        default: Optional[PackageProtocol | ModuleProtocol | Function | Class] = None,
+    ) -> Optional[PackageProtocol | ModuleProtocol | Function | Class]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: str) -> bool:
+        if name.startswith("_"):
+            return False
+        try:
+            self[name]
+            return True
+        except KeyError:
+            return False
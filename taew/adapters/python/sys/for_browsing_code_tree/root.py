@@ -0,0 +1,58 @@
+"""Root over already imported modules for frozen and embedded deployments."""
+
+from __future__ import annotations
+from typing import Optional
+from collections.abc import Iterable
+
+from taew.ports.for_browsing_code_tree import Module, Package
+from .package import child_names, load_child, wrap_module
+
+
+class Root:
+    """Code tree Root navigating sys.modules instead of source files.
+
+    Packages and modules are looked up in sys.modules and only imported,
+    through the regular import system, when missing; submodules are listed
+    from sys.modules and the package finders. Descriptions come from
+    __doc__, so no source file is ever read or parsed.
+    """
+
+    def __init__(self, name_prefix: Optional[str] = None) -> None:
+        """Initialize Root.
+
+        Args:
+            name_prefix: Optional dotted package name to navigate from
+        """
+        self._name_prefix = "" if name_prefix is None else name_prefix
+
+    def items(self) -> Iterable[tuple[str, Package | Module]]:
+        path = None
+        if self._name_prefix:
+            path = getattr(load_child("", self._name_prefix), "__path__", None)
+        for name in child_names(self._name_prefix, path):
+            try:
+                yield name, wrap_module(load_child(self._name_prefix, name))
+            except KeyError:
+                continue
+
+    def __getitem__(self, name: str) -> Package | Module:
+        return wrap_module(load_child(self._name_prefix, name))
+
+    def get(
+        self, name: str, default: Optional[Package | Module] = None
+    ) -> Optional[Package | Module]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self[name]
+            return True
+        except KeyError:
+            return False
+
+    def change_root(self, new_root: str) -> Root:
+        # Modules are found by dotted name wherever they were loaded from
+        return self
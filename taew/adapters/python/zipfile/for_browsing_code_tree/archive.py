@@ -0,0 +1,65 @@
+"""Package and module map of a zip archive built from its central directory."""
+
+from __future__ import annotations
+import zipfile
+import zipimport
+from pathlib import Path
+from collections.abc import Iterable
+
+# Folder (archive-relative, "" for the top level) -> name -> is a package
+Layout = dict[str, dict[str, bool]]
+
+
+class Archive:
+    """Read-only view of the Python sources stored in a zip archive.
+
+    The central directory is read once, when the archive is opened, and
+    turned into a folder layout so that listing and lookups never touch
+    the file again; the archive is closed right after. Module sources are
+    read on demand through zipimport, whose cached copy of the directory
+    is shared with the imports of the archive modules, and which opens the
+    file only for the read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        with zipfile.ZipFile(path) as archive:
+            self._layout = _make_layout(archive.namelist())
+        self._importer = zipimport.zipimporter(str(path))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def entries(self, folder: str) -> Iterable[tuple[str, bool]]:
+        """Yield (name, is_package) of the modules and packages in a folder."""
+        return self._layout.get(folder, {}).items()
+
+    def is_package(self, folder: str, name: str) -> bool:
+        return self._layout.get(folder, {}).get(name) is True
+
+    def is_module(self, folder: str, name: str) -> bool:
+        return self._layout.get(folder, {}).get(name) is False
+
+    def has_file(self, name: str) -> bool:
+        folder, _, filename = name.rpartition("/")
+        return filename.endswith(".py") and self.is_module(folder, filename[:-3])
+
+    def read(self, name: str) -> bytes:
+        """Read an archive member by its archive-relative name."""
+        return self._importer.get_data(name)
+
+
+def _make_layout(names: Iterable[str]) -> Layout:
+    layout: Layout = {"": {}}
+    for name in names:
+        if not name.endswith(".py"):
+            continue
+        *folders, filename = name.split("/")
+        parent = ""
+        for folder in folders:
+            layout[parent].setdefault(folder, True)
+            parent = f"{parent}/{folder}" if parent else folder
+            layout.setdefault(parent, {})
+        layout[parent].setdefault(filename[: -len(".py")], False)
+    return layout
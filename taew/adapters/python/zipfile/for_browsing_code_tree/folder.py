@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import cast
+from pathlib import Path
+from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+
+from .archive import Archive
+from taew.ports.for_browsing_code_tree import Module, Package
+from taew.adapters.python.inspect.for_browsing_code_tree.module import (
+    Module as ModuleAdapter,
+)
+from taew.adapters.python.inspect.for_browsing_code_tree.package import (
+    Package as PackageAdapter,
+)
+from taew.adapters.python.ast.for_browsing_code_tree.module import Module as AstModule
+from taew.adapters.python.path.for_browsing_code_tree.folder import Folder as FolderBase
+
+
+def _join(folder: str, name: str) -> str:
+    return f"{folder}/{name}" if folder else name
+
+
+def factories(
+    archive: Archive, folder: str
+) -> tuple[Callable[[Path, str], Module], Callable[[Path, str], Package]]:
+    """Return the module and package factories for a folder of an archive."""
+
+    def _create_module(path: Path, name: str) -> Module:
+        module_name = _join(folder, f"{path.stem}.py")
+        ast_module = AstModule.from_source(
+            archive.read(module_name), f"{archive.path}/{module_name}"
+        )
+        return cast(Module, ModuleAdapter.get_module(ast_module, name))
+
+    def _create_package(path: Path, name: str) -> Package:
+        package_folder = _join(folder, path.name)
+        init_name = f"{package_folder}/__init__.py"
+        init_module = (
+            AstModule.from_source(
+                archive.read(init_name), f"{archive.path}/{init_name}"
+            )
+            if archive.has_file(init_name)
+            else None
+        )
+        return cast(
+            Package,
+            PackageAdapter(
+                _package_path=path,
+                _package_name=name,
+                _init_module=init_module,
+                _folder_impl=(
+                    Folder.from_archive(archive, package_folder, name)
+                    if not init_module
+                    else None
+                ),
+            ),
+        )
+
+    return _create_module, _create_package
+
+
+@dataclass(eq=False, frozen=True)
+class Folder(FolderBase):
+    """Folder over a directory stored in a zip archive.
+
+    Listing and lookups are answered from the archive layout; module sources
+    are parsed straight from the archive. _folder_path is the archive path
+    joined with the folder, as reported by Package adapters.
+    """
+
+    _archive: Archive
+    _folder: str  # archive-relative, "" for the top level
+
+    @staticmethod
+    def from_archive(archive: Archive, folder: str, module_prefix: str) -> Folder:
+        return Folder(
+            archive.path / folder if folder else archive.path,
+            module_prefix,
+            *factories(archive, folder),
+            archive,
+            folder,
+        )
+
+    def _fqname(self, name: str) -> str:
+        return f"{self._module_prefix}.{name}" if self._module_prefix else name
+
+    def items(self) -> Iterable[tuple[str, Package | Module]]:
+        for name, is_package in list(self._archive.entries(self._folder)):
+            if is_package:
+                yield (
+                    name,
+                    self._create_package(self._folder_path / name, self._fqname(name)),
+                )
+            else:
+                yield (
+                    name,
+                    self._create_module(
+                        self._folder_path / f"{name}.py", self._fqname(name)
+                    ),
+                )
+
+    def __getitem__(self, name: str) -> Package | Module:
+        if self._archive.is_package(self._folder, name):
+            return self._create_package(self._folder_path / name, self._fqname(name))
+        elif self._archive.is_module(self._folder, name):
+            return self._create_module(
+                self._folder_path / f"{name}.py", self._fqname(name)
+            )
+
+        raise KeyError(f"'{name}' not found in '{self._folder_path}'")
+
+    def __contains__(self, name: str) -> bool:
+        return self._archive.is_package(self._folder, name) or self._archive.is_module(
+            self._folder, name
+        )
@@ -0,0 +1,24 @@
+"""Configuration adapter for zip archive based code tree browsing."""
+
+from pathlib import Path
+from dataclasses import dataclass
+
+from taew.adapters.python.dataclass.for_configuring_adapters import (
+    Configure as ConfigureBase,
+)
+
+
+@dataclass(eq=False, frozen=True)
+class Configure(ConfigureBase):
+    """Configure the zip archive based Root for code tree browsing.
+
+    Args:
+        _archive_path: Path to the zip archive (typically a zipapp .pyz file)
+                       holding the application packages.
+    """
+
+    _archive_path: Path = Path("./app.pyz")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", __package__)
+        object.__setattr__(self, "_file", __file__)
@@ -0,0 +1,41 @@
+"""Root over a zip archive such as a zipapp (.pyz) for single-file deployments."""
+
+from __future__ import annotations
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .folder import Folder, factories
+from .archive import Archive
+
+
+class Root(Folder):
+    """Code tree Root reading packages and modules from a zip archive.
+
+    The package and module map is built from the archive central directory
+    in one pass, module sources are parsed from the archive and modules are
+    imported by zipimport, the archive being added to the front of sys.path
+    if needed.
+    """
+
+    def __init__(self, _archive_path: Path, name_prefix: Optional[str] = None) -> None:
+        """Initialize Root with underscore-prefixed parameter.
+
+        Args:
+            _archive_path: Path to the zip archive
+            name_prefix: Optional prefix for module names
+        """
+        archive = Archive(Path(_archive_path))
+        if str(archive.path) not in sys.path:
+            # First, so that installed copies of its packages do not shadow it
+            sys.path.insert(0, str(archive.path))
+        super().__init__(
+            archive.path,
+            "" if name_prefix is None else name_prefix,
+            *factories(archive, ""),
+            archive,
+            "",
+        )
+
+    def change_root(self, new_root: str) -> Root:
+        return Root(Path(new_root))
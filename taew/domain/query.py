@@ -0,0 +1,112 @@
+"""Structured predicates of repository queries.
+
+A query's where clause maps value field names to predicates, all of
+which must hold. Unlike an opaque filter function, a where clause can be
+answered from a secondary index on the fields it names:
+
+    repo.query(where={"city": "Paris", "age": Range(ge=18, lt=65)})
+
+A plain value stands for equality with it.
+
+paginate applies the ordering and the limit/offset window of a query to
+its matching values without holding more of them than it returns.
+"""
+
+import heapq
+from itertools import islice
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeAlias, TypeVar
+from collections.abc import Iterable, Mapping
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class In:
+    """Field value is one of values."""
+
+    values: frozenset[Any]
+
+    def __init__(self, *values: Any) -> None:
+        object.__setattr__(self, "values", frozenset(values))
+
+    def __call__(self, value: Any) -> bool:
+        return value in self.values
+
+
+@dataclass(frozen=True, kw_only=True)
+class Range:
+    """Field value lies within the given bounds, None for unbounded."""
+
+    ge: Any = None
+    gt: Any = None
+    le: Any = None
+    lt: Any = None
+
+    def __call__(self, value: Any) -> bool:
+        return (
+            (self.ge is None or value >= self.ge)
+            and (self.gt is None or value > self.gt)
+            and (self.le is None or value <= self.le)
+            and (self.lt is None or value < self.lt)
+        )
+
+
+Predicate: TypeAlias = In | Range
+Where: TypeAlias = Mapping[str, Any]  # field name -> Predicate or value
+# Sort function taking (values, key, reverse), e.g. an external merge sort
+Sort: TypeAlias = Callable[[Iterable[Any], Callable[[Any], Any], bool], Iterable[Any]]
+
+
+def field_value(value: Any, name: str) -> Any:
+    """Return field name of a stored value (attribute or mapping item)."""
+    if isinstance(value, Mapping):
+        return value[name]
+    return getattr(value, name)
+
+
+def matches(value: Any, where: Where) -> bool:
+    """Whether a stored value satisfies every predicate of where."""
+    for name, predicate in where.items():
+        field = field_value(value, name)
+        if isinstance(predicate, (In, Range)):
+            if not predicate(field):
+                return False
+        elif field != predicate:
+            return False
+    return True
+
+
+def paginate(
+    values: Iterable[V],
+    *,
+    sort_key: Optional[Callable[[V], Any]] = None,
+    reverse: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    sort: Optional[Sort] = None,
+) -> Iterable[V]:
+    """Order values and cut the [offset, offset + limit) window out of them.
+
+    Unsorted results are a lazy iterator over values. Sorted results with a
+    limit keep only the best offset + limit values in a heap, in the order
+    a stable sort would give them; without a limit all values are sorted,
+    by sort if given (which must be stable too) or else in memory.
+
+    Raises:
+        ValueError: If limit or offset is negative
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit and offset must not be negative")
+    stop = None if limit is None else offset + limit
+    if sort_key is None:
+        return islice(values, offset, stop)
+    if stop is None and sort is not None:
+        return islice(sort(values, sort_key, reverse), offset, None)
+    if stop is None:
+        ordered = sorted(values, key=sort_key, reverse=reverse)
+    elif reverse:
+        ordered = heapq.nlargest(stop, values, key=sort_key)
+    else:
+        ordered = heapq.nsmallest(stop, values, key=sort_key)
+    return ordered[offset:]
@@ -187,6 +187,11 @@ def is_interface_type(annotation: type) -> bool:
     return _is_protocol(annotation) or _is_abc(annotation)
 
 
+def is_protocol_type(annotation: Any) -> bool:
+    """Check if a type annotation is a Protocol type."""
+    return _is_protocol(annotation)
+
+
 def is_protocol(arg: Argument) -> bool:
     """Check if an Argument annotation is a Protocol type."""
     return _is_protocol(arg.annotation)
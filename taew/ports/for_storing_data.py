@@ -1,5 +1,6 @@
 from typing import TypeVar, Callable, Optional, Any, Self
 from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
+from taew.domain.query import Where, matches, paginate
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -20,31 +21,71 @@ class DataRepository(Mapping[K, V]):
     def query(
         self,
         *,
-        filter_fn: Callable[[V], bool],
+        filter_fn: Optional[Callable[[V], bool]] = None,
+        where: Optional[Where] = None,
         sort_key: Optional[Callable[[V], Any]] = None,
         reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Iterable[V]:
         """Query stored data with filtering and optional sorting.
 
+        Notes:
+            - Adapters with secondary indexes on the fields named in
+              ``where`` answer it without scanning every value; filter_fn
+              is then applied to the matching values only.
+            - Unsorted results are produced lazily while iterating, so
+              stop early rather than reading every value. Sorted results
+              with a limit hold only offset + limit values at a time.
+
         Args:
             filter_fn: Function that takes a value and returns True if it
                       should be included in results
+            where: Mapping of value field names to predicates (In, Range,
+                   or a value for equality) that must all hold
             sort_key: Optional function that takes a value and returns a
                      comparison key for sorting
             reverse: Whether to reverse the sort order (default: False)
+            limit: Maximum number of values to return, None for all
+            offset: Number of leading matching values to skip
 
         Returns:
             Iterable of values that match the filter criteria, optionally sorted
         """
         # default implementation using existing Mapping methods
-        # need to convert to list for sorting
         # db backends can override for efficiency
-        filtered_values = [value for value in self.values() if filter_fn(value)]
+        matching = (
+            value
+            for value in self.values()
+            if (where is None or matches(value, where))
+            and (filter_fn is None or filter_fn(value))
+        )
+        return paginate(
+            matching, sort_key=sort_key, reverse=reverse, limit=limit, offset=offset
+        )
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Retrieve the values of many keys at once.
 
-        if sort_key is not None:
-            filtered_values.sort(key=sort_key, reverse=reverse)
+        Notes:
+            - The default implementation looks keys up one by one.
+              Adapters that can batch the lookups (e.g., by reading files
+              in parallel or with a single database query) override it.
 
-        return filtered_values
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            Dictionary of the stored keys among keys to their values;
+            keys that are not stored are left out
+        """
+        found: dict[K, V] = {}
+        for key in keys:
+            try:
+                found[key] = self[key]
+            except KeyError:
+                continue
+        return found
 
 
 class MutableDataRepository(DataRepository[K, V], MutableMapping[K, V]):
@@ -61,6 +102,31 @@ class MutableDataRepository(DataRepository[K, V], MutableMapping[K, V]):
         V: Value type of stored data items
     """
 
+    def set_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Store many values at once.
+
+        Notes:
+            - The default implementation stores items one by one, like
+              update(). Adapters that can batch the writes override it.
+
+        Args:
+            items: Mapping or iterable of (key, value) pairs to store
+        """
+        self.update(items)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Delete many keys at once; keys that are not stored are ignored.
+
+        Notes:
+            - The default implementation deletes keys one by one.
+              Adapters that can batch the deletes override it.
+
+        Args:
+            keys: Keys to delete
+        """
+        for key in keys:
+            self.pop(key, None)
+
     def __enter__(self) -> Self:
         """Enter context manager - default no-op implementation.
 
@@ -102,15 +168,17 @@ class DataSequence(Sequence[V]):
         filter_fn: Callable[[V], bool],
         sort_key: Optional[Callable[[V], Any]] = None,
         reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Iterable[V]:
         """Query stored items with filtering and optional sorting.
 
         Notes:
-            - The default implementation materializes results from iteration
-              into a list to support in-memory sorting when ``sort_key`` is
-              provided. Adapters that support native filtering/sorting (e.g.,
-              database-backed) may override this to stream results and/or
-              push sorting to the backend.
+            - The default implementation streams unsorted results lazily
+              from iteration, and keeps only offset + limit items in memory
+              when sorting with a limit. Adapters that support native
+              filtering/sorting (e.g., database-backed) may override this
+              to push filtering and sorting to the backend.
 
         Args:
             filter_fn: Function that takes a value and returns True if it
@@ -118,17 +186,17 @@ class DataSequence(Sequence[V]):
             sort_key: Optional function that takes a value and returns a
                       comparison key for sorting
             reverse: Whether to reverse the sort order (default: False)
+            limit: Maximum number of items to return, None for all
+            offset: Number of leading matching items to skip
 
         Returns:
             Iterable of values that match the filter criteria, optionally sorted
         """
         # default implementation using existing Sequence methods
-        filtered_values = [value for value in self if filter_fn(value)]
-
-        if sort_key is not None:
-            filtered_values.sort(key=sort_key, reverse=reverse)
-
-        return filtered_values
+        matching = (value for value in self if filter_fn(value))
+        return paginate(
+            matching, sort_key=sort_key, reverse=reverse, limit=limit, offset=offset
+        )
 
 
 class MutableDataSequence(DataSequence[V], MutableSequence[V]):
@@ -0,0 +1,107 @@
+"""External merge sort of query results larger than memory.
+
+Up to _threshold values are sorted in memory. Beyond that, values are
+sorted in runs of _threshold, each spilled to a temporary file as
+length-prefixed serialized records, and the runs are merged lazily with
+heapq.merge. Runs are merged in input order, so the result is ordered as
+a stable sort would order it.
+"""
+
+import heapq
+import struct
+import tempfile
+from pathlib import Path
+from itertools import chain, islice
+from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any, Optional
+
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+
+DEFAULT_THRESHOLD = 100_000
+
+# Runs merged at once; more are merged in passes over consecutive groups
+_MAX_FAN_IN = 64
+
+_LENGTH = struct.Struct(">Q")
+
+
+@dataclass(eq=False, frozen=True)
+class ExternalSort:
+    """Sort function spilling sorted runs to temporary files.
+
+    Attributes:
+        _serialize: Serializer of spilled values
+        _deserialize: Deserializer of spilled values
+        _threshold: Number of values sorted in memory, and size of a run
+        _folder: Directory for the run files, None for the system default
+    """
+
+    _serialize: SerializeProtocol
+    _deserialize: DeserializeProtocol
+    _threshold: int = DEFAULT_THRESHOLD
+    _folder: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        if self._threshold < 1:
+            raise ValueError("External sort threshold must be positive")
+
+    def __call__(
+        self, values: Iterable[Any], key: Callable[[Any], Any], reverse: bool
+    ) -> Iterator[Any]:
+        """Return values sorted by key, spilling to disk above _threshold."""
+        iterator = iter(values)
+        run = list(islice(iterator, self._threshold))
+        if len(run) < self._threshold:
+            run.sort(key=key, reverse=reverse)
+            return iter(run)
+        return self._merge_runs(run, iterator, key, reverse)
+
+    def _merge_runs(
+        self,
+        run: list[Any],
+        iterator: Iterator[Any],
+        key: Callable[[Any], Any],
+        reverse: bool,
+    ) -> Iterator[Any]:
+        runs: list[IO[bytes]] = []
+        try:
+            while run:
+                run.sort(key=key, reverse=reverse)
+                runs.append(self._spill(run))
+                run = list(islice(iterator, self._threshold))
+            while len(runs) > _MAX_FAN_IN:
+                groups = [
+                    runs[i : i + _MAX_FAN_IN] for i in range(0, len(runs), _MAX_FAN_IN)
+                ]
+                runs = []
+                try:
+                    for group in groups:
+                        runs.append(self._spill(self._merge(group, key, reverse)))
+                finally:
+                    for f in chain.from_iterable(groups):
+                        f.close()
+            yield from self._merge(runs, key, reverse)
+        finally:
+            for f in runs:
+                f.close()
+
+    def _merge(
+        self, runs: list[IO[bytes]], key: Callable[[Any], Any], reverse: bool
+    ) -> Iterator[Any]:
+        return heapq.merge(*map(self._read, runs), key=key, reverse=reverse)
+
+    def _spill(self, values: Iterable[Any]) -> IO[bytes]:
+        f = tempfile.TemporaryFile(dir=self._folder)
+        for value in values:
+            data = self._serialize(value)
+            f.write(_LENGTH.pack(len(data)))
+            f.write(data)
+        f.seek(0)
+        return f
+
+    def _read(self, f: IO[bytes]) -> Iterator[Any]:
+        while header := f.read(_LENGTH.size):
+            (length,) = _LENGTH.unpack(header)
+            yield self._deserialize(f.read(length))
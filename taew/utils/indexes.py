@@ -0,0 +1,169 @@
+"""Secondary indexes on value fields of key-value repositories.
+
+Repository adapters keep an Indexes instance up to date on writes and ask
+it for the keys that can satisfy a where clause. Equality and In use a
+hash index per field. Range uses a sorted list of the distinct field
+values, built on the first range query and kept sorted afterwards. The
+candidate values are always checked against the full where clause, so an
+index only has to return a superset of the matching keys.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from typing import Any, Optional
+
+from taew.domain.query import In, Range, Sort, Where, field_value, matches, paginate
+
+
+class _FieldIndex:
+    """Keys by value of one field."""
+
+    def __init__(self) -> None:
+        self.keys: dict[Any, set[Hashable]] = {}
+        self._sorted: Optional[list[Any]] = None
+
+    def add(self, field: Any, key: Hashable) -> None:
+        keys = self.keys.get(field)
+        if keys is None:
+            keys = self.keys[field] = set()
+            if self._sorted is not None:
+                insort(self._sorted, field)
+        keys.add(key)
+
+    def discard(self, field: Any, key: Hashable) -> None:
+        keys = self.keys.get(field)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.keys[field]
+            if self._sorted is not None:
+                del self._sorted[bisect_left(self._sorted, field)]
+
+    def lookup(self, predicate: Any) -> set[Hashable]:
+        if isinstance(predicate, In):
+            found: set[Hashable] = set()
+            for field in predicate.values:
+                found |= self.keys.get(field, set())
+            return found
+        if isinstance(predicate, Range):
+            return self._range(predicate)
+        return set(self.keys.get(predicate, ()))
+
+    def _range(self, predicate: Range) -> set[Hashable]:
+        if self._sorted is None:
+            self._sorted = sorted(self.keys)
+        values = self._sorted
+        start, stop = 0, len(values)
+        if predicate.ge is not None:
+            start = max(start, bisect_left(values, predicate.ge))
+        if predicate.gt is not None:
+            start = max(start, bisect_right(values, predicate.gt))
+        if predicate.le is not None:
+            stop = min(stop, bisect_right(values, predicate.le))
+        if predicate.lt is not None:
+            stop = min(stop, bisect_left(values, predicate.lt))
+        found: set[Hashable] = set()
+        for field in values[start:stop]:
+            found |= self.keys[field]
+        return found
+
+
+class Indexes:
+    """Secondary indexes on the given fields of the values of a repository.
+
+    Args:
+        fields: Names of the indexed value fields
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        self._fields = tuple(fields)
+        self._indexes = {name: _FieldIndex() for name in self._fields}
+        self._entries: dict[Hashable, tuple[Any, ...]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._fields)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Index value stored under key, replacing its previous value."""
+        self.discard(key)
+        entry = tuple(field_value(value, name) for name in self._fields)
+        for name, field in zip(self._fields, entry):
+            self._indexes[name].add(field, key)
+        self._entries[key] = entry
+
+    def discard(self, key: Hashable) -> None:
+        """Drop key from the indexes, if indexed."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            for name, field in zip(self._fields, entry):
+                self._indexes[name].discard(field, key)
+
+    def clear(self) -> None:
+        for name in self._fields:
+            self._indexes[name] = _FieldIndex()
+        self._entries.clear()
+
+    def candidates(self, where: Where) -> Optional[set[Hashable]]:
+        """Return keys whose values may satisfy where.
+
+        Returns:
+            Intersection of the index lookups of the indexed fields named in
+            where, or None if it names no indexed field
+        """
+        found: Optional[set[Hashable]] = None
+        for name, predicate in where.items():
+            index = self._indexes.get(name)
+            if index is None:
+                continue
+            keys = index.lookup(predicate)
+            found = keys if found is None else found & keys
+            if not found:
+                break
+        return found
+
+
+def select(
+    repository: Mapping[Any, Any],
+    keys: Optional[Iterable[Any]],
+    *,
+    filter_fn: Optional[Callable[[Any], bool]],
+    where: Optional[Where],
+    sort_key: Optional[Callable[[Any], Any]],
+    reverse: bool,
+    limit: Optional[int],
+    offset: int,
+    sort: Optional[Sort] = None,
+) -> Iterable[Any]:
+    """Run a query over the values of candidate keys, or of all keys.
+
+    Candidate keys that are no longer stored are skipped. Results are
+    ordered and windowed by paginate.
+    """
+    values: Iterable[Any]
+    if keys is None:
+        values = repository.values()
+    else:
+        values = _existing(repository, keys)
+    matching = (
+        value
+        for value in values
+        if (where is None or matches(value, where))
+        and (filter_fn is None or filter_fn(value))
+    )
+    return paginate(
+        matching,
+        sort_key=sort_key,
+        reverse=reverse,
+        limit=limit,
+        offset=offset,
+        sort=sort,
+    )
+
+
+def _existing(repository: Mapping[Any, Any], keys: Iterable[Any]) -> Iterator[Any]:
+    for key in keys:
+        try:
+            yield repository[key]
+        except KeyError:
+            continue
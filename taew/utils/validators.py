@@ -0,0 +1,135 @@
+"""Type validators compiled once per annotation.
+
+Checking a value against an annotation means taking the annotation apart
+(get_origin/get_args, Union members, variadic containers). compile_validator
+does that once and returns a closure that only runs the isinstance checks;
+compiled validators are cached by (annotation, kind), so every Argument,
+the binder and the RAM Call share them.
+"""
+
+from inspect import Parameter
+from functools import lru_cache
+from collections.abc import Callable, Iterable
+from typing import Any, Union, get_args, get_origin
+from taew.ports.for_browsing_code_tree import is_protocol_type
+from taew.domain.argument import (
+    POSITIONAL_OR_KEYWORD,
+    VAR_KEYWORD,
+    VAR_POSITIONAL,
+    ArgumentKind,
+)
+
+Validator = Callable[[Any], bool]
+
+
+def _accept(value: Any) -> bool:
+    return True
+
+
+def _is_type(value: Any) -> bool:
+    return isinstance(value, type)
+
+
+def _instance_of(annotation: Any) -> Validator:
+    def _validate(value: Any) -> bool:
+        return isinstance(value, annotation)
+
+    return _validate
+
+
+def _any_of(types: tuple[type, ...]) -> Validator:
+    def _validate(value: Any) -> bool:
+        return isinstance(value, types)
+
+    return _validate
+
+
+def _union_types(args: tuple[Any, ...]) -> tuple[type, ...]:
+    return tuple(arg for arg in args if isinstance(arg, type) and arg is not Any)
+
+
+def _optional(non_none_type: Any, types: tuple[type, ...]) -> Validator:
+    def _validate(value: Any) -> bool:
+        if value is None or isinstance(value, non_none_type):
+            return True
+        return isinstance(value, types)
+
+    return _validate
+
+
+def _compile_value(annotation: Any) -> Validator:
+    if annotation is Parameter.empty:
+        return _accept
+    if isinstance(annotation, type):
+        return _instance_of(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is type and args and args[0] is Any:
+        return _is_type
+    if origin is Union:
+        return _any_of(_union_types(args))
+    if origin is type(Union):
+        types = _union_types(args)
+        if len(args) == 2 and type(None) in args:
+            non_none_type = next(t for t in args if t is not type(None))
+            if isinstance(non_none_type, type):
+                return _optional(non_none_type, types)
+            return _optional(type(None), types)
+        return _any_of(types)
+    return _accept  # permissive for complex types
+
+
+def _compile_items(
+    annotation: Any, container: type, items: Callable[[Any], Iterable[Any]]
+) -> Validator:
+    if annotation is not Parameter.empty and isinstance(annotation, type):
+
+        def _validate(value: Any) -> bool:
+            return isinstance(value, container) and all(
+                isinstance(item, annotation)  # type: ignore[arg-type]
+                for item in items(value)
+            )
+
+        return _validate
+
+    # No type hint or a complex one: only the container type is checked
+    return _instance_of(container)
+
+
+def _compile(annotation: Any, kind: ArgumentKind) -> Validator:
+    if is_protocol_type(annotation):
+        return _accept  # cannot check protocol type compliance
+    if annotation == Any:
+        return _accept
+    if kind == VAR_POSITIONAL:
+        return _compile_items(annotation, tuple, iter)
+    if kind == VAR_KEYWORD:
+        return _compile_items(annotation, dict, dict.values)
+    return _compile_value(annotation)
+
+
+_compile_cached = lru_cache(maxsize=1024)(_compile)
+
+
+def compile_validator(
+    annotation: Any, kind: ArgumentKind = POSITIONAL_OR_KEYWORD
+) -> Validator:
+    """Return a validator checking values against a type annotation.
+
+    Covers plain types, Optional and Union, type[Any] and the *args/**kwargs
+    containers; Protocols, Any, missing and unsupported annotations accept
+    any value.
+
+    Args:
+        annotation: Type annotation, inspect.Parameter.empty if missing
+        kind: Argument kind; VAR_POSITIONAL and VAR_KEYWORD validate the
+              tuple or dict of collected values
+
+    Returns:
+        Callable returning True if a value is compatible with the annotation
+    """
+    try:
+        return _compile_cached(annotation, kind)
+    except TypeError:  # unhashable annotation
+        return _compile(annotation, kind)
@@ -1736,6 +1736,27 @@ class TestBind(TestLunchTimeAdapterBase):
         self.assertIn("not found in adapters mapping", str(ctx.exception))
         self.assertIn("InterfaceB", str(ctx.exception))
 
+    def test_clear_port_module_cache(self) -> None:
+        import sys
+        import types
+        from taew.adapters.launch_time.for_binding_interfaces._imp import (
+            clear_port_module_cache,
+            get_port_by_interface,
+        )
+
+        name = InterfaceB.__module__
+        self.assertIs(get_port_by_interface(InterfaceB), iface_mod)
+        # Simulate the port module being purged and re-imported
+        reloaded = types.ModuleType(name)
+        sys.modules[name] = reloaded
+        try:
+            self.assertIs(get_port_by_interface(InterfaceB), iface_mod)
+            clear_port_module_cache()
+            self.assertIs(get_port_by_interface(InterfaceB), reloaded)
+        finally:
+            sys.modules[name] = iface_mod
+            clear_port_module_cache()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from textwrap import dedent
+from taew.adapters.python.ast.for_browsing_code_tree.index import index_tree
+from taew.adapters.python.ast.for_browsing_code_tree.implementers import (
+    candidates,
+    find_implementers,
+    protocol_members,
+)
+from taew.adapters.python.ast.for_browsing_code_tree.module import Arity
+from taew.ports.for_serializing_objects import Serialize
+
+_PACKAGE_NAME = "implementers_fixture_pkg"
+
+
+class TestImplementers(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = Path(tempfile.mkdtemp())
+        self._write("__init__.py", "")
+        self._write(
+            "base.py",
+            """
+            class Base:
+                def __call__(self, value): pass
+            """,
+        )
+        self._write(
+            "adapters.py",
+            """
+            from .base import Base
+
+            class Direct:
+                def __call__(self, value, *args): pass
+
+            class Inherited(Base):
+                pass
+
+            class TooStrict:
+                def __call__(self, value, other): pass
+
+            class NoCall:
+                def run(self, value): pass
+
+            class FromDict(dict):
+                pass
+            """,
+        )
+        self._write("broken.py", "class Unknown(SomewhereElse): pass\n")
+        sys.path.insert(0, str(self._root))
+
+    def tearDown(self) -> None:
+        sys.path.remove(str(self._root))
+        for name in [n for n in sys.modules if n.startswith(_PACKAGE_NAME)]:
+            del sys.modules[name]
+        shutil.rmtree(self._root)
+
+    def _write(self, name: str, content: str) -> None:
+        path = self._root / _PACKAGE_NAME / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dedent(content))
+
+    def test_protocol_members(self) -> None:
+        self.assertEqual(protocol_members(Serialize), {"__call__": Arity(1, 1)})
+
+    def test_candidates(self) -> None:
+        index = index_tree(self._root, max_workers=1)
+        prefix = f"{_PACKAGE_NAME}.adapters"
+        self.assertEqual(
+            candidates(index, Serialize),
+            [
+                f"{prefix}.Direct",
+                f"{prefix}.Inherited",
+                f"{_PACKAGE_NAME}.base.Base",
+                f"{_PACKAGE_NAME}.broken.Unknown",
+            ],
+        )
+        self.assertNotIn(f"{_PACKAGE_NAME}.adapters", sys.modules)
+
+    def test_find_implementers_verifies_candidates(self) -> None:
+        index = index_tree(self._root, max_workers=1)
+        prefix = f"{_PACKAGE_NAME}.adapters"
+        self.assertEqual(
+            find_implementers(index, Serialize),
+            [
+                f"{prefix}.Direct",
+                f"{prefix}.Inherited",
+                f"{_PACKAGE_NAME}.base.Base",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from textwrap import dedent
+from taew.adapters.python.ast.for_browsing_code_tree.index import (
+    Progress,
+    index_tree,
+)
+
+
+class TestIndexTree(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = Path(tempfile.mkdtemp())
+        self._write("app/__init__.py", '"""App package."""\n__version__ = "0.1"\n')
+        self._write(
+            "app/tools.py",
+            """
+            \"\"\"Tools module.\"\"\"
+
+            def run(x, y=1):
+                \"\"\"Run it.\"\"\"
+
+            class Runner:
+                \"\"\"Runs things.\"\"\"
+
+            def _private(): pass
+            """,
+        )
+        self._write("app/plain/cmd.py", "def cmd(): pass\n")
+        self._write("app/_internal.py", "def hidden(): pass\n")
+        self._write("app/__pycache__/junk.py", "def junk(): pass\n")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._root)
+
+    def _write(self, name: str, content: str) -> None:
+        path = self._root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dedent(content))
+
+    def test_index_entries(self) -> None:
+        index = index_tree(self._root, max_workers=1)
+        self.assertEqual(
+            sorted(index),
+            [
+                "app",
+                "app.plain",
+                "app.plain.cmd",
+                "app.plain.cmd.cmd",
+                "app.tools",
+                "app.tools.Runner",
+                "app.tools.run",
+            ],
+        )
+        self.assertEqual(index["app"].kind, "package")
+        self.assertEqual(index["app"].description, "App package.")
+        self.assertEqual(index["app"].version, "0.1")
+        self.assertEqual(index["app.plain"].kind, "package")
+        self.assertEqual(index["app.tools"].kind, "module")
+        self.assertEqual(index["app.tools.run"].kind, "function")
+        self.assertEqual(index["app.tools.run"].arguments, ("x", "y"))
+        self.assertEqual(index["app.tools.Runner"].kind, "class")
+        self.assertEqual(index["app.tools.Runner"].description, "Runs things.")
+
+    def test_parallel_matches_serial(self) -> None:
+        serial = index_tree(self._root, max_workers=1)
+        parallel = index_tree(self._root, max_workers=2)
+        self.assertEqual(serial, parallel)
+
+    def test_progress_reported(self) -> None:
+        reports: list[Progress] = []
+        index_tree(self._root, max_workers=2, progress=reports.append)
+        self.assertEqual([p.done for p in reports], [1, 2, 3])
+        self.assertTrue(all(p.total == 3 for p in reports))
+        self.assertGreaterEqual(reports[-1].throughput, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import tempfile
 from pathlib import Path
 from textwrap import dedent
-from taew.adapters.python.ast.for_browsing_code_tree.module import Module
+from taew.adapters.python.ast.for_browsing_code_tree.module import Arity, Module
 
 
 class TestAstModuleAdapter(unittest.TestCase):
@@ -66,6 +66,99 @@ class TestAstModuleAdapter(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = mod["bar"]
 
+    def test_items_public_only(self) -> None:
+        path = self._write_module("""
+            def foo(): pass
+            def _hidden(): pass
+            class Bar: pass
+            VALUE = 1
+        """)
+        mod = Module.from_path(path)
+        self.assertEqual([name for name, _ in mod.items()], ["foo", "Bar"])
+
+    def test_async_functions_and_methods(self) -> None:
+        path = self._write_module("""
+            async def fetch(url, timeout=None): pass
+            class Client:
+                async def __call__(self, request): pass
+        """)
+        mod = Module.from_path(path)
+        self.assertEqual([name for name, _ in mod.items()], ["fetch", "Client"])
+        self.assertTrue("fetch" in mod)
+        self.assertEqual(mod["fetch"].arity, Arity(1, 2))  # type: ignore[union-attr]
+        self.assertEqual(
+            dict(mod["Client"].members),  # type: ignore[union-attr]
+            {"__call__": Arity(1, 1)},
+        )
+
+    def test_function_arguments(self) -> None:
+        path = self._write_module("def foo(a, /, b, *args, c, d=1, **kwargs): pass")
+        mod = Module.from_path(path)
+        func = mod["foo"]
+        self.assertEqual(
+            func.arguments,  # type: ignore[union-attr]
+            ("a", "b", "args", "c", "d", "kwargs"),
+        )
+
+    def test_function_arity(self) -> None:
+        path = self._write_module("def foo(a, b=1, *args): pass\ndef bar(a, b=1): pass")
+        mod = Module.from_path(path)
+        self.assertEqual(mod["foo"].arity, Arity(1, None))  # type: ignore[union-attr]
+        self.assertEqual(mod["bar"].arity, Arity(1, 2))  # type: ignore[union-attr]
+
+    def test_arity_accepts(self) -> None:
+        self.assertTrue(Arity(0, None).accepts(Arity(1, 1)))
+        self.assertTrue(Arity(1, 2).accepts(Arity(1, 1)))
+        self.assertFalse(Arity(2, 2).accepts(Arity(1, 1)))
+        self.assertFalse(Arity(1, 2).accepts(Arity(1, None)))
+
+    def test_class_bases_and_members(self) -> None:
+        path = self._write_module("""
+            class Bar(base.Base, Generic[T]):
+                value: int
+                LIMIT = 1
+                def __call__(self, x, y=None): pass
+                def run(self, *args): pass
+                @property
+                def name(self): pass
+                @staticmethod
+                def make(a): pass
+                def _hidden(self): pass
+        """)
+        cls = Module.from_path(path)["Bar"]
+        self.assertEqual(cls.bases, ("base.Base", "Generic"))  # type: ignore[union-attr]
+        self.assertEqual(
+            dict(cls.members),  # type: ignore[union-attr]
+            {
+                "value": None,
+                "LIMIT": None,
+                "__call__": Arity(1, 2),
+                "run": Arity(0, None),
+                "name": None,
+                "make": Arity(1, 1),
+            },
+        )
+
+    def test_imports(self) -> None:
+        path = self._write_module("""
+            import os.path
+            import json as j
+            from typing import Protocol
+            from .sibling import Thing
+            from .. import parent
+        """)
+        mod = Module.from_path(path)
+        self.assertEqual(
+            mod.imports("pkg.sub"),
+            {
+                "os": "os",
+                "j": "json",
+                "Protocol": "typing.Protocol",
+                "Thing": "pkg.sub.sibling.Thing",
+                "parent": "pkg.parent",
+            },
+        )
+
     def test_bool_true_public_function(self) -> None:
         path = self._write_module("def foo(): pass")
         mod = Module.from_path(path)
@@ -0,0 +1,184 @@
+import os
+import shutil
+import unittest
+from pathlib import Path
+from typing import Any, TypeAlias
+from dataclasses import dataclass
+
+from taew.ports.for_storing_data import (
+    DataRepository as DataRepositoryProtocol,
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.adapters.python.ram.for_storing_data.mutable_data_repository import (
+    MutableDataRepository as RamRepository,
+)
+
+_FOLDER = Path("/tmp/cache-repo-sample")
+
+
+@dataclass(frozen=True)
+class Rec:
+    id: str
+    val: int
+
+
+Repo: TypeAlias = DataRepositoryProtocol[str, Rec]
+MutRepo: TypeAlias = MutableDataRepositoryProtocol[str, Rec]
+
+
+class CountingRepository(RamRepository[str, Rec]):
+    """RAM repository counting value reads."""
+
+    reads = 0
+
+    def __getitem__(self, key: str) -> Rec:
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+class TestCachingDataRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_cached(self, repository: Any, **kwargs: Any) -> MutRepo:
+        from taew.adapters.python.cache.for_storing_data.mutable_data_repository import (
+            MutableDataRepository,
+        )
+
+        return MutableDataRepository(_repository=repository, **kwargs)
+
+    def _get_dir(self) -> MutRepo:
+        from taew.adapters.python.dir.for_storing_data.mutable_data_repository import (
+            MutableDataRepository,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        return MutableDataRepository(
+            _folder=_FOLDER,
+            _extension="pkl",
+            _key_type=str,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _serialize=(Serialize(), SerializeProtocol),
+        )
+
+    def _backend(self, count: int) -> CountingRepository:
+        backend = CountingRepository()
+        for i in range(count):
+            backend[f"k{i}"] = Rec(f"k{i}", i)
+        return backend
+
+    def test_hits_do_not_read_backend(self) -> None:
+        backend = self._backend(3)
+        cached = self._get_cached(backend)
+        for _ in range(3):
+            self.assertEqual(cached["k1"], Rec("k1", 1))
+        self.assertEqual(backend.reads, 1)
+        self.assertEqual(len(cached), 3)
+        self.assertEqual(sorted(cached), ["k0", "k1", "k2"])
+        with self.assertRaises(KeyError):
+            cached["missing"]
+
+    def test_bulk_operations(self) -> None:
+        backend = self._backend(3)
+        cached = self._get_cached(backend)
+        cached["k0"]
+        self.assertEqual(
+            cached.get_many(["k0", "k1", "nope"]),
+            {"k0": Rec("k0", 0), "k1": Rec("k1", 1)},
+        )
+        backend.reads = 0
+        cached.get_many(["k0", "k1"])
+        self.assertEqual(backend.reads, 0)
+
+        cached.set_many({"k1": Rec("k1", 10)})
+        cached.delete_many(["k0"])
+        self.assertEqual(cached.get_many(["k0", "k1"]), {"k1": Rec("k1", 10)})
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        backend = self._backend(3)
+        cached = self._get_cached(backend, _max_entries=2)
+        cached["k0"], cached["k1"], cached["k0"]
+        cached["k2"]  # evicts k1
+        backend.reads = 0
+        cached["k0"], cached["k2"]
+        self.assertEqual(backend.reads, 0)
+        cached["k1"]
+        self.assertEqual(backend.reads, 1)
+
+    def test_lfu_evicts_least_frequently_used(self) -> None:
+        backend = self._backend(3)
+        cached = self._get_cached(backend, _max_entries=2, _eviction="lfu")
+        cached["k0"], cached["k0"], cached["k1"]
+        cached["k2"]  # evicts k1, used once
+        backend.reads = 0
+        cached["k0"], cached["k2"]
+        self.assertEqual(backend.reads, 0)
+        cached["k1"]
+        self.assertEqual(backend.reads, 1)
+
+    def test_byte_bound(self) -> None:
+        with self._get_dir() as repo:
+            for i in range(4):
+                repo[f"k{i}"] = Rec(f"k{i}", i)
+        size = (_FOLDER / "k0.pkl").stat().st_size
+        cached: Any = self._get_cached(repo, _max_bytes=2 * size, _max_entries=None)
+        for i in range(4):
+            cached[f"k{i}"]
+        self.assertEqual(len(cached._entries), 2)
+        self.assertEqual(cached._bytes, 2 * size)
+
+    def test_writes_invalidate_cached_value(self) -> None:
+        backend = self._backend(1)
+        cached = self._get_cached(backend)
+        cached["k0"]
+        cached["k0"] = Rec("k0", 10)
+        self.assertEqual(cached["k0"], Rec("k0", 10))
+        del cached["k0"]
+        with self.assertRaises(KeyError):
+            cached["k0"]
+
+    def test_validation_detects_external_writes(self) -> None:
+        repo = self._get_dir()
+        repo["a"] = Rec("a", 1)
+        cached = self._get_cached(repo, _validate=True)
+        self.assertEqual(cached["a"], Rec("a", 1))
+
+        other = self._get_dir()
+        other["a"] = Rec("a", 2)
+        # Same size, so only the mtime tells the values apart
+        stat = (_FOLDER / "a.pkl").stat()
+        os.utime(_FOLDER / "a.pkl", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        self.assertEqual(cached["a"], Rec("a", 2))
+        del other["a"]
+        with self.assertRaises(KeyError):
+            cached["a"]
+
+    def test_validation_requires_versioned_repository(self) -> None:
+        with self.assertRaises(ValueError):
+            self._get_cached(self._backend(1), _validate=True)
+
+    def test_aborted_transaction_drops_cache(self) -> None:
+        repo = self._get_dir()
+        repo["a"] = Rec("a", 1)
+        cached = self._get_cached(repo)
+        with self.assertRaises(RuntimeError):
+            with cached:
+                cached["a"] = Rec("a", 2)
+                self.assertEqual(cached["a"], Rec("a", 2))
+                raise RuntimeError("abort")
+        self.assertEqual(cached["a"], Rec("a", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
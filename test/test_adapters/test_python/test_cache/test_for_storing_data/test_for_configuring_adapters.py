@@ -0,0 +1,71 @@
+import unittest
+from pathlib import Path
+from typing import cast
+from dataclasses import dataclass
+
+from taew.domain.configuration import PortConfigurationDict
+from taew.ports import for_storing_data as for_storing_port
+from taew.ports.for_storing_data import MutableDataRepository
+from taew.adapters.python.ram.for_storing_data import (
+    for_configuring_adapters as ram_configuring,
+)
+from taew.adapters.python.cache.for_storing_data import (
+    for_configuring_adapters as cache_configuring,
+)
+
+
+@dataclass(eq=False, frozen=True)
+class RamConfigure(ram_configuring.Configure[str, int]):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", ram_configuring.__package__)
+        object.__setattr__(self, "_file", ram_configuring.__file__)
+
+
+@dataclass(eq=False, frozen=True)
+class CacheConfigure(cache_configuring.Configure):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", cache_configuring.__package__)
+        object.__setattr__(self, "_file", cache_configuring.__file__)
+
+
+class TestCachingConfigure(unittest.TestCase):
+    def _get_configure(self) -> CacheConfigure:
+        ram = RamConfigure(_ports="taew.ports", _root_marker="/taew", _values={"a": 1})
+        return CacheConfigure(
+            _repository=ram,
+            _ports="taew.ports",
+            _root_marker="/taew",
+            _max_entries=2,
+            _eviction="lfu",
+        )
+
+    def test_wraps_nested_repository_ports(self) -> None:
+        mapping = self._get_configure()()
+
+        pc = cast(PortConfigurationDict, mapping[for_storing_port])
+        self.assertEqual(pc.adapter, "taew.adapters.python.cache")
+        self.assertEqual(pc.kwargs["_max_entries"], 2)
+        self.assertEqual(pc.kwargs["_eviction"], "lfu")
+        nested = cast(PortConfigurationDict, pc.ports[for_storing_port])
+        self.assertEqual(nested.adapter, "taew.adapters.python.ram")
+
+    def test_binds_cache_around_configured_repository(self) -> None:
+        from taew.adapters.launch_time.for_binding_interfaces.bind import bind
+        from taew.adapters.python.inspect.for_browsing_code_tree.for_configuring_adapters import (
+            Configure as BrowseCodeTree,
+        )
+        from taew.adapters.python.cache.for_storing_data.mutable_data_repository import (
+            MutableDataRepository as CachingRepository,
+        )
+
+        ports = self._get_configure()()
+        ports.update(BrowseCodeTree(_root_path=Path("./"))())
+        repo = bind(MutableDataRepository[str, int], ports)
+
+        self.assertIsInstance(repo, CachingRepository)
+        repo["b"] = 2
+        self.assertEqual(dict(repo.items()), {"a": 1, "b": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
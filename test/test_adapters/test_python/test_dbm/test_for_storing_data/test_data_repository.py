@@ -0,0 +1,157 @@
+import dbm
+import shutil
+import unittest
+from pathlib import Path
+from typing import Any, Optional, TypeAlias
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from taew.domain.query import Range
+from taew.adapters.python.dbm.for_storing_data.data_repository import DataRepository
+from taew.adapters.python.dbm.for_storing_data.mutable_data_repository import (
+    MutableDataRepository,
+)
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+
+_FOLDER = Path("/tmp/dbm-repo-sample")
+
+
+@dataclass(frozen=True)
+class Rec:
+    id: str
+    val: int
+
+
+Repo: TypeAlias = DataRepository[str, Rec]
+MutRepo: TypeAlias = MutableDataRepository[str, Rec]
+
+
+class TestDbmDataRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+        # Registered first, so it runs after the repositories are closed
+        self.addCleanup(shutil.rmtree, _FOLDER, ignore_errors=True)
+
+    def _get_mutable(self, backend: Optional[str] = None, **kwargs: Any) -> MutRepo:
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        repo: MutRepo = MutableDataRepository(
+            _folder=_FOLDER,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _key_type=str,
+            _backend=backend,
+            _serialize=(Serialize(), SerializeProtocol),
+            **kwargs,
+        )
+        self.addCleanup(repo.close)
+        return repo
+
+    def _get_readonly(self) -> Repo:
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        repo: Repo = DataRepository(
+            _folder=_FOLDER,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _key_type=str,
+        )
+        self.addCleanup(repo.close)
+        return repo
+
+    def test_mapping_operations(self) -> None:
+        for backend in ("dbm.sqlite3", "dbm.dumb"):
+            with self.subTest(backend=backend):
+                self.setUp()
+                m = self._get_mutable(backend)
+                m.set_many({f"k{i}": Rec(f"k{i}", i) for i in range(5)})
+                m["k5"] = Rec("k5", 5)
+                del m["k0"]
+                m.delete_many(["k1", "nope"])
+                with self.assertRaises(KeyError):
+                    del m["k0"]
+                with self.assertRaises(KeyError):
+                    m["k0"]
+                m.close()
+
+                self.assertEqual(dbm.whichdb(str(_FOLDER / "repository")), backend)
+                r = self._get_readonly()
+                self.assertEqual(len(r), 4)
+                self.assertEqual(sorted(r), ["k2", "k3", "k4", "k5"])
+                self.assertIn("k5", r)
+                self.assertEqual(r["k3"], Rec("k3", 3))
+                self.assertEqual(
+                    [x.id for x in r.query(filter_fn=lambda x: x.val > 3)],
+                    ["k4", "k5"],
+                )
+
+    def test_readonly_requires_database(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            self._get_readonly()
+        self.assertFalse(_FOLDER.exists())
+        self._get_mutable()["a"] = Rec("a", 1)
+        self.assertEqual(list(self._get_readonly()), ["a"])
+
+    def test_unavailable_backends_are_skipped(self) -> None:
+        real_import = __import__("importlib").import_module
+
+        def import_module(name: str) -> Any:
+            if name == "dbm.sqlite3":
+                raise ImportError(name)
+            return real_import(name)
+
+        with patch("importlib.import_module", import_module):
+            m = self._get_mutable()
+            m["a"] = Rec("a", 1)
+        self.assertIn(dbm.whichdb(str(_FOLDER / "repository")), ("dbm.gnu", "dbm.dumb"))
+        with self.assertRaises(ValueError):
+            self._get_mutable("dbm.nope")
+
+    def test_transaction_and_indexes(self) -> None:
+        m = self._get_mutable(_indexes=("val",))
+        m.set_many([(f"k{i}", Rec(f"k{i}", i % 3)) for i in range(6)])
+        self.assertEqual(sorted(r.id for r in m.query(where={"val": 1})), ["k1", "k4"])
+
+        with self.assertRaises(RuntimeError):
+            with m:
+                m["k1"] = Rec("k1", 2)
+                del m["k4"]
+                self.assertEqual(len(m), 5)
+                self.assertNotIn("k4", m)
+                self.assertEqual(list(m.query(where={"val": 1}, limit=5)), [])
+                raise RuntimeError("abort")
+        self.assertEqual(sorted(r.id for r in m.query(where={"val": 1})), ["k1", "k4"])
+
+        with m:
+            with m:
+                m["k1"] = Rec("k1", 2)
+            m.delete_many(["k4"])
+            self.assertEqual(len(self._get_readonly()), 6)
+        self.assertEqual(list(m.query(where={"val": Range(ge=1, lt=2)})), [])
+        self.assertEqual(len(m), 5)
+
+    def test_durability_flushes(self) -> None:
+        for durability, expected in (("none", 0), ("write", 2), ("batch", 1)):
+            with self.subTest(durability=durability):
+                self.setUp()
+                m = self._get_mutable("dbm.dumb", _durability=durability)
+                with patch.object(type(m._db), "sync") as sync:
+                    m["a"] = Rec("a", 1)
+                    with m:
+                        m["b"] = Rec("b", 2)
+                        del m["a"]
+                self.assertEqual(sync.call_count, expected)
+                m.close()
+        with self.assertRaises(ValueError):
+            self._get_mutable(_durability="always")
+
+
+if __name__ == "__main__":
+    unittest.main()
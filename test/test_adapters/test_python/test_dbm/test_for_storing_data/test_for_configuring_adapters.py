@@ -0,0 +1,74 @@
+import shutil
+import unittest
+from pathlib import Path
+from typing import cast
+from dataclasses import dataclass
+
+from taew.domain.configuration import PortConfigurationDict
+from taew.ports import for_storing_data as for_storing_port
+from taew.ports.for_storing_data import MutableDataRepository
+from taew.adapters.python.pickle.for_serializing_objects.for_configuring_adapters import (
+    Configure as PickleConfigure,
+)
+from taew.adapters.python.dbm.for_storing_data import (
+    for_configuring_adapters as dbm_configuring,
+)
+
+_FOLDER = Path("/tmp/dbm-configure-sample")
+
+
+@dataclass(eq=False, frozen=True)
+class DbmConfigure(dbm_configuring.Configure):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", dbm_configuring.__package__)
+        object.__setattr__(self, "_file", dbm_configuring.__file__)
+
+
+class TestDbmConfigure(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, _FOLDER, ignore_errors=True)
+
+    def _get_configure(self) -> DbmConfigure:
+        return DbmConfigure(
+            _folder=_FOLDER,
+            _serialization=PickleConfigure(_ports="taew.ports", _root_marker="/taew"),
+            _backend="dbm.dumb",
+            _durability="batch",
+            _sort_threshold=2,
+            _ports="taew.ports",
+            _root_marker="/taew",
+        )
+
+    def test_kwargs_mirror_dir_configuration(self) -> None:
+        mapping = self._get_configure()()
+
+        pc = cast(PortConfigurationDict, mapping[for_storing_port])
+        self.assertEqual(pc.adapter, "taew.adapters.python.dbm")
+        self.assertEqual(pc.kwargs["_folder"], _FOLDER)
+        self.assertEqual(pc.kwargs["_durability"], "batch")
+        self.assertEqual(pc.kwargs["_indexes"], ())
+        self.assertEqual(pc.kwargs["_sort_threshold"], 2)
+        self.assertIsNone(pc.kwargs["_sort_folder"])
+
+    def test_binds_repository(self) -> None:
+        from taew.adapters.launch_time.for_binding_interfaces.bind import bind
+        from taew.adapters.python.inspect.for_browsing_code_tree.for_configuring_adapters import (
+            Configure as BrowseCodeTree,
+        )
+
+        ports = self._get_configure()()
+        ports.update(BrowseCodeTree(_root_path=Path("./"))())
+        repo = bind(MutableDataRepository[str, int], ports)
+        self.addCleanup(repo.close)  # type: ignore[attr-defined]
+        with repo:
+            repo["a"] = 1
+            repo["b"] = 3
+            repo["c"] = 2
+        self.assertEqual(dict(repo.items()), {"a": 1, "b": 3, "c": 2})
+        self.assertEqual(list(repo.query(sort_key=lambda v: -v)), [3, 2, 1])
+        self.assertTrue((_FOLDER / "repository.dat").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,16 @@
+import ast
 import shutil
 import unittest
 from pathlib import Path
 from typing import Any
 
 from taew.adapters.python.dir.for_storing_data._common import make_path
+from taew.adapters.python.dir.for_storing_data._common import make_sort
 from taew.adapters.python.dir.for_storing_data._common import read_value
+from taew.adapters.python.dir.for_storing_data._common import scan_names
 from taew.adapters.python.dir.for_storing_data._common import validate_key
 from taew.adapters.python.dir.for_storing_data._common import validate_extension
+from taew.adapters.python.dir.for_storing_data._common import validate_shards
 from taew.adapters.python.dir.for_storing_data._common import write_value
 
 
@@ -39,6 +43,33 @@ class TestCommonHelpers(unittest.TestCase):
         p = make_path(folder, "name", "pkl")
         self.assertEqual(p, folder / "name.pkl")
 
+    def test_make_path_places_keys_in_shard_folders(self) -> None:
+        folder = Path("/tmp/common-sample")
+        self.assertEqual(make_path(folder, "a", "pkl", (2, 2)), folder / "40/f8/a.pkl")
+        self.assertEqual(make_path(folder, "a", "pkl", (1,)), folder / "4/a.pkl")
+        for bad in ((0,), (5,), (4, 4, 4, 4, 1)):
+            with self.subTest(shards=bad):
+                with self.assertRaises(ValueError):
+                    validate_shards(bad)
+
+    def test_scan_names_walks_shards_then_flat_leftovers(self) -> None:
+        folder = Path("/tmp/common-sample")
+        names = [f"k{i}" for i in range(20)]
+        for name in names:
+            write_value(make_path(folder, name, "pkl", (1, 1)), name, "b", str.encode)  # type: ignore[arg-type]
+        # Left by a flat layout, one of them also moved to its shard
+        write_value(make_path(folder, "flat", "pkl"), "flat", "b", str.encode)  # type: ignore[arg-type]
+        write_value(make_path(folder, "k0", "pkl"), "k0", "b", str.encode)  # type: ignore[arg-type]
+
+        scanned = list(scan_names(folder, "pkl", (1, 1)))
+        self.assertEqual(sorted(scanned), sorted([*names, "flat"]))
+        self.assertEqual(scanned[-1], "flat")
+        shards = [
+            "/".join(make_path(folder, n, "pkl", (1, 1)).parts[-3:-1])
+            for n in scanned[:-1]
+        ]
+        self.assertEqual(shards, sorted(shards))
+
     def test_write_and_read_value_roundtrip(self) -> None:
         from taew.adapters.python.pickle.for_serializing_objects.serialize import (
             Serialize,
@@ -55,6 +86,20 @@ class TestCommonHelpers(unittest.TestCase):
         out = read_value(path, "b", Deserialize())
         self.assertEqual(out, obj)
 
+    def test_make_sort_spills_text_serialization_encoded(self) -> None:
+        def dumps(value: object) -> str:
+            return repr(value)
+
+        def loads(buf: str) -> object:
+            return ast.literal_eval(buf)
+
+        self.assertIsNone(make_sort(None, None))
+        sort = make_sort(2, None, (dumps, loads), "t")
+        assert sort is not None
+        self.assertEqual(
+            list(sort([3, 1, 2, 5, 4], lambda v: v, False)), [1, 2, 3, 4, 5]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
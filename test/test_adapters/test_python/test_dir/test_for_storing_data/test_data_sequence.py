@@ -5,6 +5,7 @@ import unittest
 from pathlib import Path
 from typing import TypeAlias
 from dataclasses import dataclass
+from unittest.mock import patch
 
 from taew.ports.for_storing_data import (
     DataSequence as DataSequenceProtocol,
@@ -12,6 +13,7 @@ from taew.ports.for_storing_data import (
 )
 from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
 from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.adapters.python.dir.for_storing_data._common import Durability
 
 
 @dataclass(frozen=True)
@@ -30,7 +32,7 @@ class TestDataSequence(unittest.TestCase):
         if folder.exists():
             shutil.rmtree(folder)
 
-    def _get_mutable(self) -> MutableDataSeq:
+    def _get_mutable(self, durability: Durability = "none") -> MutableDataSeq:
         from taew.adapters.python.dir.for_storing_data.mutable_data_sequence import (
             MutableDataSequence,
         )
@@ -46,6 +48,7 @@ class TestDataSequence(unittest.TestCase):
             _extension="pkl",
             _deserialize=(Deserialize(), DeserializeProtocol),
             _serialize=(Serialize(), SerializeProtocol),
+            _durability=durability,
         )
 
     def _get_readonly_with_data(self) -> DataSeq:
@@ -145,6 +148,24 @@ class TestDataSequence(unittest.TestCase):
         self.assertEqual(m[1].id, 4)
         self.assertEqual(m[2].id, 2)
 
+    def test_batch_durability_defers_folder_sync_to_exit(self) -> None:
+        folder = Path("/tmp/seq-sample")
+        m = self._get_mutable(durability="batch")
+        with patch(
+            "taew.adapters.python.dir.for_storing_data._common.sync_path"
+        ) as sync_path:
+            m.append(Item(1, "one"))
+            m[0] = Item(1, "uno")
+            del m[0]
+            # Outside a with block every change is durable on return
+            self.assertEqual(sync_path.call_count, 3)
+            sync_path.reset_mock()
+            with m:
+                m.append(Item(2, "two"))
+                m.insert(0, Item(1, "one"))
+                sync_path.assert_not_called()
+            sync_path.assert_called_once_with(folder)
+
 
 if __name__ == "__main__":
     unittest.main()
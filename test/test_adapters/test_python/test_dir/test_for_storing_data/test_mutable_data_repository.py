@@ -1,7 +1,9 @@
+import os
 import shutil
 import unittest
+from unittest.mock import Mock, patch
 from pathlib import Path
-from typing import TypeAlias
+from typing import Optional, TypeAlias, cast
 from dataclasses import dataclass
 
 from taew.ports.for_storing_data import (
@@ -10,6 +12,11 @@ from taew.ports.for_storing_data import (
 )
 from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
 from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.utils.external_sort import DEFAULT_THRESHOLD, ExternalSort
+from taew.adapters.python.dir.for_storing_data._common import Durability, read_value
+
+_COMMON = "taew.adapters.python.dir.for_storing_data._common"
+_MIGRATE = "taew.adapters.python.dir.for_storing_data.migrate"
 
 
 @dataclass(frozen=True)
@@ -28,7 +35,18 @@ class TestMutableDataRepository(unittest.TestCase):
         if folder.exists():
             shutil.rmtree(folder)
 
-    def _get_mutable(self) -> MutRepo:
+    def _get_mutable(
+        self,
+        manifest: bool = False,
+        durability: Durability = "none",
+        indexes: tuple[str, ...] = (),
+        sort_threshold: Optional[int] = DEFAULT_THRESHOLD,
+        sort_serialization: Optional[
+            tuple[SerializeProtocol, DeserializeProtocol]
+        ] = None,
+        workers: int = 1,
+        shards: tuple[int, ...] = (),
+    ) -> MutRepo:
         from taew.adapters.python.dir.for_storing_data.mutable_data_repository import (
             MutableDataRepository,
         )
@@ -45,6 +63,13 @@ class TestMutableDataRepository(unittest.TestCase):
             _key_type=str,
             _deserialize=(Deserialize(), DeserializeProtocol),
             _serialize=(Serialize(), SerializeProtocol),
+            _manifest=manifest,
+            _durability=durability,
+            _indexes=indexes,
+            _sort_threshold=sort_threshold,
+            _sort_serialization=sort_serialization,
+            _workers=workers,
+            _shards=shards,
         )
 
     def _get_readonly(self) -> Repo:
@@ -62,6 +87,313 @@ class TestMutableDataRepository(unittest.TestCase):
         out = self._get_readonly()["a"]
         self.assertEqual(out, r)
 
+    def test_manifest_len_and_keys_without_scan(self) -> None:
+        m = self._get_mutable(manifest=True)
+        for i in range(3):
+            m[f"k{i}"] = Rec(f"k{i}", i)
+        m["k1"] = Rec("k1", 10)
+        del m["k0"]
+        with patch.object(Path, "glob", side_effect=AssertionError("scanned")):
+            self.assertEqual(len(m), 2)
+            self.assertEqual(list(m), ["k1", "k2"])
+            # A second instance loads the manifest file instead of scanning
+            other = self._get_mutable(manifest=True)
+            self.assertEqual(sorted(other), ["k1", "k2"])
+
+    def test_manifest_rebuilt_after_external_change(self) -> None:
+        m = self._get_mutable(manifest=True)
+        m["a"] = Rec("a", 1)
+        plain = self._get_mutable()
+        plain["b"] = Rec("b", 2)
+        folder = Path("/tmp/repo-sample")
+        manifest = folder / ".manifest-pkl"
+        past = folder.stat().st_mtime_ns - 10**9
+        os.utime(manifest, ns=(past, past))  # written before the change
+        self.assertEqual(sorted(m), ["a", "b"])
+
+        mtime = folder.stat().st_mtime_ns
+        (folder / "a.pkl").unlink()
+        os.utime(folder, ns=(mtime, mtime))  # deletion not visible in the stamp
+        self.assertEqual(sorted(m), ["a", "b"])
+        self.assertNotIn("a", m)
+        self.assertEqual(list(m), ["b"])
+
+    def test_interrupted_manifest_rewrite_keeps_previous_manifest(self) -> None:
+        m = self._get_mutable(manifest=True)
+        m["a"] = Rec("a", 1)
+        m["b"] = Rec("b", 2)
+        self._get_mutable()["c"] = Rec("c", 3)
+        folder = Path("/tmp/repo-sample")
+        manifest = folder / ".manifest-pkl"
+        past = folder.stat().st_mtime_ns - 10**9
+        os.utime(manifest, ns=(past, past))  # written before the change
+        with patch(f"{_COMMON}.os.replace", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                len(m)  # rebuilds the manifest
+        self.assertEqual(manifest.read_text(), "+a\n+b\n")
+        self.assertEqual(
+            sorted(os.listdir(folder)), [".manifest-pkl", "a.pkl", "b.pkl", "c.pkl"]
+        )
+        self.assertEqual(sorted(m), ["a", "b", "c"])
+        # The rebuilt manifest is trusted despite replacing a folder entry
+        with patch.object(Path, "glob", side_effect=AssertionError("scanned")):
+            self.assertEqual(len(self._get_mutable(manifest=True)), 3)
+
+    def test_failed_write_keeps_previous_value(self) -> None:
+        m = self._get_mutable()
+        m["a"] = Rec("a", 1)
+        with patch(f"{_COMMON}.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                m["a"] = Rec("a", 2)
+        self.assertEqual(m["a"], Rec("a", 1))
+        self.assertEqual(os.listdir("/tmp/repo-sample"), ["a.pkl"])
+
+    def test_write_durability_syncs_file_and_folder(self) -> None:
+        m = self._get_mutable(durability="write")
+        with (
+            patch(f"{_COMMON}.os.fsync") as fsync,
+            patch(f"{_COMMON}.sync_path") as sync_path,
+        ):
+            m["a"] = Rec("a", 1)
+            self.assertEqual(fsync.call_count, 1)
+            sync_path.assert_called_once_with(Path("/tmp/repo-sample"))
+
+    def test_batch_durability_syncs_on_exit(self) -> None:
+        folder = Path("/tmp/repo-sample")
+        replace = os.replace
+        synced_before_replace: list[bool] = []
+
+        def check_replace(source: Path, target: Path) -> None:
+            synced_before_replace.append(fsync.call_count > 0)
+            replace(source, target)
+
+        with (
+            patch(f"{_COMMON}.os.fsync") as fsync,
+            patch(f"{_COMMON}.os.replace", side_effect=check_replace),
+            patch(f"{_COMMON}.sync_path") as sync_path,
+        ):
+            with self._get_mutable(durability="batch") as m:
+                for i in range(3):
+                    m[f"k{i}"] = Rec(f"k{i}", i)
+                del m["k0"]
+                sync_path.assert_not_called()
+            # Files are fsynced before replacing their target, the folder
+            # once on exit
+            self.assertEqual(synced_before_replace, [True, True])
+            self.assertEqual(fsync.call_count, 2)
+            sync_path.assert_called_once_with(folder)
+        self.assertEqual(sorted(self._get_readonly()), ["k1", "k2"])
+
+    def test_batch_durability_outside_transaction_syncs_on_return(self) -> None:
+        folder = Path("/tmp/repo-sample")
+        m = self._get_mutable(durability="batch")
+        with patch(f"{_COMMON}.sync_path") as sync_path:
+            m["k0"] = Rec("k0", 0)
+            sync_path.assert_called_once_with(folder)
+            m.set_many({"k1": Rec("k1", 1), "k2": Rec("k2", 2)})
+            self.assertEqual(sync_path.call_count, 2)
+            del m["k0"]
+            m.delete_many(["k1"])
+            self.assertEqual(sync_path.call_count, 4)
+
+    def test_transaction_buffers_until_exit(self) -> None:
+        m = self._get_mutable(manifest=True)
+        m["a"] = Rec("a", 1)
+        m["b"] = Rec("b", 2)
+        folder = Path("/tmp/repo-sample")
+        with m:
+            m["a"] = Rec("a", 10)
+            m["c"] = Rec("c", 3)
+            del m["b"]
+            with self.assertRaises(KeyError):
+                del m["b"]
+            # Reads see the overlay, the folder is not touched yet
+            self.assertEqual(m["a"], Rec("a", 10))
+            self.assertNotIn("b", m)
+            self.assertEqual(len(m), 2)
+            self.assertEqual(sorted(m), ["a", "c"])
+            self.assertEqual(
+                sorted(os.listdir(folder)), [".manifest-pkl", "a.pkl", "b.pkl"]
+            )
+        self.assertEqual(
+            sorted(os.listdir(folder)), [".manifest-pkl", "a.pkl", "c.pkl"]
+        )
+        other = self._get_mutable(manifest=True)
+        self.assertEqual(sorted(other), ["a", "c"])
+        self.assertEqual(other["a"], Rec("a", 10))
+
+    def test_transaction_discarded_on_error(self) -> None:
+        m = self._get_mutable()
+        m["a"] = Rec("a", 1)
+        with self.assertRaises(RuntimeError):
+            with m:
+                m["a"] = Rec("a", 2)
+                m["b"] = Rec("b", 2)
+                del m["a"]
+                raise RuntimeError("abort")
+        self.assertEqual(dict(m.items()), {"a": Rec("a", 1)})
+
+    def test_unknown_durability_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self._get_mutable(durability="always")  # type: ignore[arg-type]
+
+    def test_query_where_reads_only_candidates(self) -> None:
+        from taew.domain.query import Range
+
+        m = self._get_mutable(indexes=("val",))
+        for i in range(10):
+            m[f"k{i}"] = Rec(f"k{i}", i)
+        self.assertEqual([r.id for r in m.query(where={"val": 3})], ["k3"])
+
+        m["k3"] = Rec("k3", 30)
+        del m["k4"]
+        reader = "taew.adapters.python.dir.for_storing_data.data_repository.read_value"
+        with patch(reader, wraps=read_value) as reads:
+            found = m.query(where={"val": Range(ge=4, lt=7)}, sort_key=lambda r: r.id)
+            self.assertEqual([r.id for r in found], ["k5", "k6"])
+            self.assertEqual(reads.call_count, 2)
+        with m:
+            m["k0"] = Rec("k0", 5)
+            del m["k5"]
+            found = m.query(where={"val": 5})
+            self.assertEqual([r.id for r in found], ["k0"])
+        self.assertEqual([r.id for r in m.query(where={"val": 30})], ["k3"])
+
+    def test_sorted_query_spills_through_external_sort(self) -> None:
+        m = self._get_mutable(sort_threshold=3)
+        for i in range(10):
+            m[f"k{i}"] = Rec(f"k{i}", -i)
+        with patch.object(
+            ExternalSort, "_spill", autospec=True, side_effect=ExternalSort._spill
+        ) as spill:
+            found = m.query(sort_key=lambda r: r.val, offset=7)
+            self.assertEqual([r.id for r in found], ["k2", "k1", "k0"])
+        self.assertEqual(spill.call_count, 4)
+        # A limited query keeps its heap and does not spill
+        with patch.object(ExternalSort, "_spill") as spill:
+            found = m.query(sort_key=lambda r: r.val, limit=2)
+            self.assertEqual([r.id for r in found], ["k9", "k8"])
+        spill.assert_not_called()
+
+    def test_sorted_query_spills_through_configured_serialization(self) -> None:
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        serialize, deserialize = Mock(wraps=Serialize()), Mock(wraps=Deserialize())
+        m = self._get_mutable(
+            sort_threshold=3, sort_serialization=(serialize, deserialize)
+        )
+        m.set_many({f"k{i}": Rec(f"k{i}", -i) for i in range(5)})
+        found = m.query(sort_key=lambda r: r.val)
+        self.assertEqual([r.id for r in found], ["k4", "k3", "k2", "k1", "k0"])
+        self.assertEqual(serialize.call_count, 5)
+        self.assertEqual(deserialize.call_count, 5)
+
+    def test_bulk_operations(self) -> None:
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                self.setUp()
+                m = self._get_mutable(manifest=True, workers=workers)
+                m.set_many({f"k{i}": Rec(f"k{i}", i) for i in range(10)})
+                self.assertEqual(len(m), 10)
+                found = m.get_many(["k3", "k1", "nope"])
+                self.assertEqual(found, {"k1": Rec("k1", 1), "k3": Rec("k3", 3)})
+                m.delete_many(["k1", "k2", "nope"])
+                self.assertEqual(len(m), 8)
+                self.assertNotIn("k1", m)
+
+    def test_bulk_write_validates_and_serializes_before_writing(self) -> None:
+        m = self._get_mutable()
+        m["k0"] = Rec("k0", 0)
+        with patch(f"{_COMMON}.os.replace") as replace:
+            with self.assertRaises(ValueError):
+                m.set_many({"k1": Rec("k1", 1), "bad key": Rec("x", 0)})
+            # Lambdas do not pickle
+            unpicklable = cast(Rec, lambda: None)
+            items: dict[str, Rec] = {"k1": Rec("k1", 1), "k2": unpicklable}
+            with self.assertRaises(Exception):
+                m.set_many(items)
+        replace.assert_not_called()
+        self.assertEqual(list(m), ["k0"])
+
+    def test_bulk_operations_join_transaction(self) -> None:
+        m = self._get_mutable()
+        m.set_many([("k0", Rec("k0", 0)), ("k1", Rec("k1", 1))])
+        with self.assertRaises(RuntimeError):
+            with m:
+                m.set_many({"k2": Rec("k2", 2)})
+                m.delete_many(["k0"])
+                self.assertEqual(
+                    m.get_many(["k0", "k1", "k2"]),
+                    {"k1": Rec("k1", 1), "k2": Rec("k2", 2)},
+                )
+                raise RuntimeError("abort")
+        self.assertEqual(sorted(m), ["k0", "k1"])
+
+    def test_sharded_layout(self) -> None:
+        folder = Path("/tmp/repo-sample")
+        m = self._get_mutable(shards=(2, 1))
+        m.set_many({f"k{i}": Rec(f"k{i}", i) for i in range(50)})
+        m["k50"] = Rec("k50", 50)
+        del m["k0"]
+        m.delete_many(["k1", "nope"])
+        with self.assertRaises(KeyError):
+            del m["k0"]
+
+        self.assertEqual(list(folder.glob("*.pkl")), [])
+        self.assertEqual(len(list(folder.glob("*/*/*.pkl"))), 49)
+        self.assertEqual(len(m), 49)
+        self.assertEqual(sorted(m), sorted(f"k{i}" for i in range(2, 51)))
+        self.assertEqual(m["k7"], Rec("k7", 7))
+        self.assertNotIn("k0", m)
+        self.assertEqual(m.get_many(["k2", "k1"]), {"k2": Rec("k2", 2)})
+        # The manifest watches the top folder only
+        with self.assertRaises(ValueError):
+            self._get_mutable(manifest=True, shards=(2, 1))
+
+    def test_migrate_flat_repository_online(self) -> None:
+        from taew.adapters.python.dir.for_storing_data.migrate import migrate
+
+        folder = Path("/tmp/repo-sample")
+        self._get_mutable().set_many({f"k{i}": Rec(f"k{i}", i) for i in range(10)})
+        m = self._get_mutable(shards=(2,))
+        # Flat files are found before they are moved
+        self.assertEqual(len(m), 10)
+        self.assertEqual(m["k3"], Rec("k3", 3))
+        m["k4"] = Rec("k4", 40)
+        del m["k5"]
+
+        self.assertEqual(migrate(folder, "pkl", (2,)), 9)
+        self.assertEqual(list(folder.glob("*.pkl")), [])
+        self.assertEqual(len(m), 9)
+        self.assertEqual(m["k4"], Rec("k4", 40))
+        self.assertNotIn("k5", m)
+        self.assertEqual(migrate(folder, "pkl", (2,)), 0)
+        with self.assertRaises(ValueError):
+            migrate(folder, "pkl", ())
+
+    def test_migrate_keeps_keys_readable_while_moving(self) -> None:
+        from taew.adapters.python.dir.for_storing_data.migrate import migrate
+
+        folder = Path("/tmp/repo-sample")
+        self._get_mutable().set_many({"k0": Rec("k0", 0), "k1": Rec("k1", 1)})
+        m = self._get_mutable(shards=(1,))
+        link = os.link
+        seen: list[Rec] = []
+
+        def link_and_read(source: Path, target: Path) -> None:
+            link(source, target)
+            seen.append(m[source.stem])
+
+        with patch(f"{_MIGRATE}.os.link", side_effect=link_and_read):
+            migrate(folder, "pkl", (1,))
+        self.assertEqual(sorted(seen, key=lambda r: r.id), [Rec("k0", 0), Rec("k1", 1)])
+        self.assertEqual(sorted(m), ["k0", "k1"])
+
 
 if __name__ == "__main__":
     unittest.main()
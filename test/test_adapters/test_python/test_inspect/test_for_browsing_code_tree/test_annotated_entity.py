@@ -92,6 +92,19 @@ class TestAnnotatedEntity(unittest.TestCase):
         arg = Argument(param)
         self.assertEqual(arg.kind, POSITIONAL_ONLY)
 
+    def test_annotation_evaluated_once_on_first_access(self) -> None:
+        param = inspect.Parameter(
+            "x", _ParameterKind.POSITIONAL_ONLY, annotation="list[int]"
+        )
+        lookup = Mock(return_value=list[int])
+        arg = Argument(param, annotation_lookup=lookup)
+        self.assertEqual(arg.kind, POSITIONAL_ONLY)
+        lookup.assert_not_called()
+        self.assertEqual(arg.spec, (list, (int,)))
+        self.assertEqual(arg.annotation, list[int])
+        self.assertTrue(arg.has_valid_type([1]))
+        lookup.assert_called_once()
+
     def test_return_value_inherits_annotated_entity(self) -> None:
         ret = ReturnValue(int)
         self.assertEqual(ret.annotation, int)
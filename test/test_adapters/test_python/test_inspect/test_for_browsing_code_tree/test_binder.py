@@ -0,0 +1,60 @@
+import inspect
+import unittest
+from typing import Any
+from taew.adapters.python.inspect.for_browsing_code_tree._binder import Binder
+
+
+def _positional(a: int, b: int = 2, /) -> None: ...
+
+
+def _mixed(a: int, b: str = "b", *, c: float, d: bool = False) -> None: ...
+
+
+def _variadic(a: int, /, b: int = 2, *args: int, c: int = 3, **kwargs: int) -> None: ...
+
+
+class TestBinder(unittest.TestCase):
+    def _assert_binds_like_signature(
+        self, func: Any, *args: Any, **kwargs: Any
+    ) -> None:
+        signature = inspect.signature(func)
+        try:
+            expected = signature.bind(*args, **kwargs)
+        except TypeError:
+            with self.assertRaises(TypeError):
+                Binder(signature).bind(args, kwargs)
+            return
+        expected.apply_defaults()
+        self.assertEqual(
+            Binder(signature).bind(args, kwargs), (expected.args, expected.kwargs)
+        )
+
+    def test_matches_signature_bind(self) -> None:
+        cases: list[tuple[Any, tuple[Any, ...], dict[str, Any]]] = [
+            (_positional, (1,), {}),
+            (_positional, (1, 3), {}),
+            (_positional, (), {}),
+            (_positional, (1, 2, 3), {}),
+            (_positional, (1,), {"b": 3}),
+            (_mixed, (1,), {"c": 1.0}),
+            (_mixed, (), {"a": 1, "b": "x", "c": 1.0, "d": True}),
+            (_mixed, (1,), {}),
+            (_mixed, (1,), {"a": 1, "c": 1.0}),
+            (_mixed, (1,), {"c": 1.0, "e": 0}),
+            (_variadic, (1, 2, 3, 4), {"c": 5, "x": 6}),
+            (_variadic, (1,), {"a": 7}),
+            (_variadic, (), {"b": 1}),
+        ]
+        for func, args, kwargs in cases:
+            with self.subTest(func=func.__name__, args=args, kwargs=kwargs):
+                self._assert_binds_like_signature(func, *args, **kwargs)
+
+    def test_exact_positional_call_passes_arguments_through(self) -> None:
+        args = (1, 2)
+        bound_args, bound_kwargs = Binder(inspect.signature(_positional)).bind(args, {})
+        self.assertIs(bound_args, args)
+        self.assertEqual(bound_kwargs, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
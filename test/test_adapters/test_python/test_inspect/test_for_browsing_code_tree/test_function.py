@@ -206,9 +206,9 @@ class TestFunctionAdapter(unittest.TestCase):
             self.assertIn("Cannot create signature", str(error))
 
     def test_from_callable_with_malformed_docstring(self) -> None:
-        """Test from_callable gracefully handles docstring parsing errors."""
+        """Test docstring parsing errors only affect argument descriptions."""
 
-        def func_with_docstring() -> None:
+        def func_with_docstring(x: int) -> None:
             """This is a function."""
             pass
 
@@ -219,8 +219,10 @@ class TestFunctionAdapter(unittest.TestCase):
         ):
             func_adapter = self._make_function(func_with_docstring)
 
-            # Should have empty description due to fallback
-            self.assertEqual(func_adapter.description, "")
+            # Short description does not depend on the full parse
+            self.assertEqual(func_adapter.description, "This is a function.")
+            # Argument descriptions fall back to empty
+            self.assertEqual(dict(func_adapter.items())["x"].description, "")
 
     def test_from_callable_with_broken_param_docs(self) -> None:
         """Test from_callable handles broken parameter documentation."""
@@ -251,11 +253,49 @@ class TestFunctionAdapter(unittest.TestCase):
             # Should not raise, should fallback to empty param_docs
             func_adapter = self._make_function(func_with_params)
 
-            # Should still work but with empty param docs
-            self.assertEqual(func_adapter.description, "Test function")
+            self.assertEqual(func_adapter.description, "Function with parameters.")
             # Arguments should still be accessible (just without docstring info)
             arguments = list(func_adapter.items())
             self.assertEqual(len(arguments), 2)
+            self.assertEqual(arguments[0][1].description, "")
+
+    def test_docstring_parsed_only_for_argument_descriptions(self) -> None:
+        """Test the full docstring parse is deferred to argument descriptions."""
+
+        def func_with_params(x: int) -> None:
+            """Function with parameters.
+
+            Args:
+                x: Integer parameter
+            """
+            pass
+
+        from docstring_parser import parse
+
+        with patch(
+            "taew.adapters.python.inspect.for_browsing_code_tree.function.parse",
+            wraps=parse,
+        ) as mock_parse:
+            func_adapter = self._make_function(func_with_params)
+            self.assertEqual(func_adapter.description, "Function with parameters.")
+            arguments = dict(func_adapter.items())
+            mock_parse.assert_not_called()
+            self.assertEqual(arguments["x"].description, "Integer parameter")
+            self.assertEqual(func_adapter.returns.description, "")
+            mock_parse.assert_called_once()
+
+    def test_annotations_evaluated_on_access(self) -> None:
+        """Test unresolvable annotations do not fail until they are read."""
+
+        def func_with_type_only_hint(x: Missing) -> Missing:  # type: ignore[name-defined] # noqa: F821
+            return x
+
+        func_adapter = self._make_function(func_with_type_only_hint)
+        arguments = dict(func_adapter.items())
+        self.assertEqual(arguments["x"].kind, POSITIONAL_OR_KEYWORD)
+        self.assertEqual(func_adapter(1), 1)
+        with self.assertRaises(NameError):
+            arguments["x"].annotation
 
     def test_function_without_docstring(self) -> None:
         """Test function with no docstring."""
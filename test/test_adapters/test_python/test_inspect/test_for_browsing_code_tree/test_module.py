@@ -1,3 +1,7 @@
+import importlib
+import sys
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 from types import ModuleType
@@ -125,5 +129,73 @@ class TestModule(unittest.TestCase):
             mock_from_class.assert_called_once_with(dict, dummy_mod)
 
 
+_LAZY_MODULE_NAME = "lazy_import_fixture_mod"
+_LAZY_PACKAGE_NAME = "lazy_import_fixture_pkg"
+
+_LAZY_MODULE_SOURCE = """
+import sys
+
+executed = True
+
+
+def greet(name):
+    return f"Hello, {name}"
+"""
+
+
+class TestLazyImport(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = Path(tempfile.mkdtemp())
+        self._path = self._tmp / f"{_LAZY_MODULE_NAME}.py"
+        self._path.write_text(_LAZY_MODULE_SOURCE)
+        sys.path.insert(0, str(self._tmp))
+
+    def tearDown(self) -> None:
+        sys.path.remove(str(self._tmp))
+        for name in list(sys.modules):
+            if name.startswith((_LAZY_MODULE_NAME, _LAZY_PACKAGE_NAME)):
+                del sys.modules[name]
+        shutil.rmtree(self._tmp)
+
+    def _get_module(self) -> Module:
+        return Module.get_module(
+            AstModule.from_path(self._path), _LAZY_MODULE_NAME, lazy_import=True
+        )
+
+    def _is_executed(self) -> bool:
+        # A lazy module changes its class to ModuleType once its body runs
+        return type(sys.modules[_LAZY_MODULE_NAME]) is ModuleType
+
+    def test_contains_does_not_execute_module(self) -> None:
+        mod = self._get_module()
+        self.assertTrue("greet" in mod)
+        _ = mod._module  # type: ignore
+        self.assertFalse(self._is_executed())
+
+    def test_attribute_use_executes_module(self) -> None:
+        mod = self._get_module()
+        greet = mod["greet"]
+        self.assertEqual(greet("taew"), "Hello, taew")
+        self.assertTrue(self._is_executed())
+        self.assertTrue(sys.modules[_LAZY_MODULE_NAME].executed)
+        self.assertFalse("sys" in mod)
+
+    def test_submodule_bound_on_parent_package(self) -> None:
+        package = self._tmp / _LAZY_PACKAGE_NAME
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "tools.py").write_text(_LAZY_MODULE_SOURCE)
+        module_name = f"{_LAZY_PACKAGE_NAME}.tools"
+        mod = Module.get_module(
+            AstModule.from_path(package / "tools.py"), module_name, lazy_import=True
+        )
+        self.assertTrue("greet" in mod)
+        _ = mod._module  # type: ignore
+
+        parent = importlib.import_module(_LAZY_PACKAGE_NAME)
+        self.assertIs(parent.tools, sys.modules[module_name])
+        self.assertEqual(parent.tools.greet("taew"), "Hello, taew")
+
+
 if __name__ == "__main__":
     unittest.main()
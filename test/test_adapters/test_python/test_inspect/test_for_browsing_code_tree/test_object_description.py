@@ -2,6 +2,8 @@ import unittest
 from typing import Callable
 from unittest.mock import Mock, patch
 
+from docstring_parser import parse
+
 
 class TestExtractShortDescription(unittest.TestCase):
     """Test extract_short_description function."""
@@ -128,62 +130,73 @@ class TestExtractShortDescription(unittest.TestCase):
             result = extract_short_description(mock_obj)
             self.assertEqual(result, "")
 
-    def test_docstring_parse_failure(self) -> None:
-        """Test graceful handling when docstring parsing fails."""
+    def test_docstring_with_sections(self) -> None:
+        """Test only the first line of a sectioned docstring is extracted."""
 
         def test_function() -> None:
-            """This is a test function."""
-            pass
-
-        extract_short_description = self._get_extract_function()
-
-        with patch(
-            "taew.adapters.python.inspect.for_browsing_code_tree.object_description.parse",
-            side_effect=Exception("parse failed"),
-        ):
-            # Should not raise, should return empty string
-            result = extract_short_description(test_function)
-            self.assertEqual(result, "")
-
-    def test_parsed_docstring_without_short_description(self) -> None:
-        """Test handling when parsed docstring has no short_description."""
+            """This is a test function.
 
-        def test_function() -> None:
-            """This is a test function."""
+            Args:
+                x: Not parsed
+            """
             pass
 
         extract_short_description = self._get_extract_function()
+        result = extract_short_description(test_function)
+        self.assertEqual(result, "This is a test function.")
 
-        # Mock parse to return docstring without short_description
-        mock_parsed = Mock()
-        mock_parsed.short_description = None
-
-        with patch(
-            "taew.adapters.python.inspect.for_browsing_code_tree.object_description.parse",
-            return_value=mock_parsed,
-        ):
-            result = extract_short_description(test_function)
-            self.assertEqual(result, "")
-
-    def test_parsed_docstring_with_empty_short_description(self) -> None:
-        """Test handling when parsed docstring has empty short_description."""
+    def test_short_description_matches_docstring_parser(self) -> None:
+        """Test first-line extraction agrees with docstring_parser.parse()."""
+        from docstring_parser import parse
+        from taew.adapters.python.inspect.for_browsing_code_tree.object_description import (
+            short_description,
+        )
 
-        def test_function() -> None:
-            """This is a test function."""
-            pass
+        docstrings = [
+            "Summary line.",
+            "  Summary line.  \n\n  Details.",
+            "Summary line\ncontinued.",
+            "Summary.\n\nArgs:\n    x: value",
+            "Returns:\n    int: value",
+            ":param x: value",
+            "Parameters\n----------\nx : int\n    value",
+            "Subclass with properties:\n\nmsg: message",
+        ]
+        for docstring in docstrings:
+            with self.subTest(docstring=docstring):
+                self.assertEqual(
+                    short_description(docstring),
+                    (parse(docstring).short_description or "").strip(),
+                )
+
+    def test_short_description_empty_without_summary_line(self) -> None:
+        """Test docstrings opening with a title or heading have no summary."""
+        from taew.adapters.python.inspect.for_browsing_code_tree.object_description import (
+            short_description,
+        )
 
-        extract_short_description = self._get_extract_function()
+        docstrings = [
+            "Args:\n    x: value",
+            "Raises:\n    ValueError: if bad",
+            "Attributes:\n    name: value",
+            "Summary\n-------\nDetails.",
+            ":param x: value",
+            "@param x: value",
+            "@return: value",
+        ]
+        for docstring in docstrings:
+            with self.subTest(docstring=docstring):
+                self.assertEqual(short_description(docstring), "")
 
-        # Mock parse to return docstring with empty short_description
-        mock_parsed = Mock()
-        mock_parsed.short_description = ""
+    def test_short_description_keeps_summary_starting_with_at(self) -> None:
+        """Test a summary opening with "@" is not taken for an epydoc field."""
+        from taew.adapters.python.inspect.for_browsing_code_tree.object_description import (
+            short_description,
+        )
 
-        with patch(
-            "taew.adapters.python.inspect.for_browsing_code_tree.object_description.parse",
-            return_value=mock_parsed,
-        ):
-            result = extract_short_description(test_function)
-            self.assertEqual(result, "")
+        docstring = "@decorator helper\n\nWraps functions."
+        self.assertEqual(short_description(docstring), "@decorator helper")
+        self.assertEqual(parse(docstring).short_description, "@decorator helper")
 
     def test_various_object_types(self) -> None:
         """Test extraction from various object types."""
@@ -0,0 +1,150 @@
+import shutil
+import unittest
+from pathlib import Path
+from typing import TypeAlias
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from taew.ports.for_storing_data import DataRepository as DataRepositoryProtocol
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.adapters.python.mmap.for_storing_data.mutable_data_repository import (
+    MutableDataRepository,
+)
+
+_FOLDER = Path("/tmp/mmap-repo-sample")
+
+
+@dataclass(frozen=True)
+class Rec:
+    id: str
+    val: int
+
+
+Repo: TypeAlias = DataRepositoryProtocol[str, Rec]
+
+
+class TestPackedDataRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_mutable(
+        self, segment_size: int = 1 << 20
+    ) -> MutableDataRepository[str, Rec]:
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        return MutableDataRepository(
+            _folder=_FOLDER,
+            _key_type=str,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _serialize=(Serialize(), SerializeProtocol),
+            _segment_size=segment_size,
+        )
+
+    def _get_readonly(self) -> Repo:
+        from taew.adapters.python.mmap.for_storing_data.data_repository import (
+            DataRepository,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        return DataRepository(
+            _folder=_FOLDER,
+            _key_type=str,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+        )
+
+    def test_set_get_delete(self) -> None:
+        m = self._get_mutable()
+        m["a"] = Rec("a", 1)
+        m["b"] = Rec("b", 2)
+        m["a"] = Rec("a", 3)
+        del m["b"]
+        self.assertEqual(m["a"], Rec("a", 3))
+        self.assertNotIn("b", m)
+        self.assertEqual(list(m), ["a"])
+        with self.assertRaises(KeyError):
+            del m["b"]
+        with self.assertRaises(ValueError):
+            m["has space"] = Rec("x", 0)
+
+    def test_values_packed_into_segments(self) -> None:
+        with self._get_mutable() as m:
+            for i in range(100):
+                m[f"k{i}"] = Rec(f"k{i}", i)
+        self.assertEqual(len(list(_FOLDER.glob("*.seg"))), 1)
+        repo = self._get_readonly()
+        self.assertEqual(repo["k0"], Rec("k0", 0))
+        # The segment is mapped once, later reads open no files
+        with patch("builtins.open", side_effect=AssertionError("opened")):
+            self.assertEqual(repo["k42"], Rec("k42", 42))
+            self.assertEqual(repo["k99"], Rec("k99", 99))
+        self.assertEqual(len(repo), 100)
+        self.assertEqual(
+            [r.val for r in repo.query(filter_fn=lambda r: r.val < 3)], [0, 1, 2]
+        )
+
+    def test_compaction_reclaims_replaced_values(self) -> None:
+        m = self._get_mutable(segment_size=512)
+        for i in range(40):
+            m[f"k{i}"] = Rec(f"k{i}", 0)
+        live_bytes = sum(p.stat().st_size for p in _FOLDER.glob("*.seg"))
+        for round_ in range(1, 5):
+            for i in range(40):
+                m[f"k{i}"] = Rec(f"k{i}", round_)
+        segment_bytes = sum(p.stat().st_size for p in _FOLDER.glob("*.seg"))
+        self.assertLessEqual(segment_bytes, 2 * live_bytes + 512)
+
+        m.compact()
+        del m["k0"]
+        repo = self._get_readonly()
+        self.assertEqual(len(repo), 39)
+        self.assertEqual({repo[f"k{i}"].val for i in range(1, 40)}, {4})
+
+    def test_reader_follows_writer(self) -> None:
+        m = self._get_mutable(segment_size=512)
+        m["a"] = Rec("a", 1)
+        repo = self._get_readonly()
+        self.assertEqual(list(repo), ["a"])
+
+        m["b"] = Rec("b", 2)
+        del m["a"]
+        self.assertEqual(list(repo), ["b"])
+        self.assertNotIn("a", repo)
+        self.assertEqual(repo["b"], Rec("b", 2))
+
+        # Compaction checkpoints the index and removes old segments
+        for i in range(40):
+            m["b"] = Rec("b", i)
+        m.compact()
+        self.assertEqual(repo["b"], Rec("b", 39))
+        self.assertEqual(len(repo), 1)
+
+    def test_segment_numbers_not_reused_after_compaction(self) -> None:
+        m = self._get_mutable()
+        m["a"] = Rec("a", 1)
+        repo = self._get_readonly()
+        self.assertEqual(repo["a"], Rec("a", 1))
+        with m:
+            del m["a"]
+            m.compact()
+
+        # A new writer continues after the emptied segments
+        other = self._get_mutable()
+        other["b"] = Rec("b", 2)
+        self.assertFalse((_FOLDER / "repository-00000000.seg").exists())
+        self.assertEqual(repo["b"], Rec("b", 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+from pathlib import Path
+from typing import TypeAlias
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from taew.ports.for_storing_data import DataSequence as DataSequenceProtocol
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+from taew.adapters.python.mmap.for_storing_data.mutable_data_sequence import (
+    MutableDataSequence,
+)
+
+_FOLDER = Path("/tmp/mmap-seq-sample")
+
+
+@dataclass(frozen=True)
+class Item:
+    id: int
+    name: str
+
+
+DataSeq: TypeAlias = DataSequenceProtocol[Item]
+
+
+class TestLogStructuredDataSequence(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_mutable(self, segment_size: int = 1 << 20) -> MutableDataSequence[Item]:
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        return MutableDataSequence(
+            _folder=_FOLDER,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _serialize=(Serialize(), SerializeProtocol),
+            _segment_size=segment_size,
+        )
+
+    def _get_readonly(self) -> DataSeq:
+        from taew.adapters.python.mmap.for_storing_data.data_sequence import (
+            DataSequence,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        return DataSequence(
+            _folder=_FOLDER, _deserialize=(Deserialize(), DeserializeProtocol)
+        )
+
+    def test_len_iter_get_slice(self) -> None:
+        m = self._get_mutable()
+        m.insert(0, Item(1, "one"))
+        m.append(Item(2, "two"))
+        m.append(Item(3, "three"))
+        self.assertEqual(len(m), 3)
+        self.assertEqual([x.name for x in m], ["one", "two", "three"])
+        self.assertEqual(m[-1].name, "three")
+        self.assertEqual([x.name for x in m[1:]], ["two", "three"])
+        with self.assertRaises(IndexError):
+            m[3]
+
+    def test_insert_and_delete_do_not_rename_files(self) -> None:
+        m = self._get_mutable()
+        for i in range(5):
+            m.append(Item(i, str(i)))
+        with patch.object(Path, "rename", side_effect=AssertionError("renamed")):
+            del m[0]
+            m.insert(0, Item(10, "ten"))
+            m[1] = Item(11, "eleven")
+        self.assertEqual([x.id for x in m], [10, 11, 2, 3, 4])
+
+    def test_reopen_replays_journal(self) -> None:
+        with self._get_mutable() as m:
+            for i in range(4):
+                m.append(Item(i, str(i)))
+            del m[1]
+            m.insert(1, Item(9, "nine"))
+            m[-1] = Item(8, "eight")
+        self.assertEqual([x.id for x in self._get_readonly()], [0, 9, 2, 8])
+
+    def test_compaction_reclaims_garbage(self) -> None:
+        m = self._get_mutable(segment_size=512)
+        for i in range(40):
+            m.append(Item(i, "x" * 20))
+        live_bytes = sum(p.stat().st_size for p in _FOLDER.glob("*.seg"))
+        for name in ("y", "z"):
+            for i in range(40):
+                m[i] = Item(i, name * 20)
+        segment_bytes = sum(p.stat().st_size for p in _FOLDER.glob("*.seg"))
+        self.assertLessEqual(segment_bytes, 2 * live_bytes + 512)
+        self.assertEqual([x.name for x in self._get_readonly()], ["z" * 20] * 40)
+
+        m.compact()
+        self.assertEqual([x.id for x in self._get_readonly()], list(range(40)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import shutil
+import unittest
+from pathlib import Path
+from typing import cast
+from dataclasses import dataclass
+
+from taew.domain.configuration import PortConfigurationDict
+from taew.ports import for_storing_data as for_storing_port
+from taew.ports.for_storing_data import (
+    DataRepository,
+    DataSequence,
+    MutableDataRepository,
+    MutableDataSequence,
+)
+from taew.adapters.python.pickle.for_serializing_objects.for_configuring_adapters import (
+    Configure as PickleConfigure,
+)
+from taew.adapters.python.mmap.for_storing_data import (
+    for_configuring_adapters as mmap_configuring,
+)
+
+_FOLDER = Path("/tmp/mmap-configure-sample")
+
+
+@dataclass(eq=False, frozen=True)
+class MmapConfigure(mmap_configuring.Configure):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", mmap_configuring.__package__)
+        object.__setattr__(self, "_file", mmap_configuring.__file__)
+
+
+class TestMmapConfigure(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_configure(self) -> MmapConfigure:
+        return MmapConfigure(
+            _folder=_FOLDER,
+            _serialization=PickleConfigure(_ports="taew.ports", _root_marker="/taew"),
+            _segment_size=256,
+            _ports="taew.ports",
+            _root_marker="/taew",
+        )
+
+    def test_kwargs_and_nested_serialization_ports(self) -> None:
+        mapping = self._get_configure()()
+
+        pc = cast(PortConfigurationDict, mapping[for_storing_port])
+        self.assertEqual(pc.adapter, "taew.adapters.python.mmap")
+        self.assertEqual(pc.kwargs["_folder"], _FOLDER)
+        self.assertEqual(pc.kwargs["_segment_size"], 256)
+        self.assertTrue(pc.ports)
+
+    def test_repository_and_sequence_share_folder(self) -> None:
+        from taew.adapters.launch_time.for_binding_interfaces.bind import bind
+        from taew.adapters.python.inspect.for_browsing_code_tree.for_configuring_adapters import (
+            Configure as BrowseCodeTree,
+        )
+
+        ports = self._get_configure()()
+        ports.update(BrowseCodeTree(_root_path=Path("./"))())
+        repo = bind(MutableDataRepository[str, str], ports)
+        seq = bind(MutableDataSequence[str], ports)
+        # Interleaved appends, rolling over several segments of each store
+        for i in range(20):
+            repo[f"k{i}"] = f"value {i}"
+            seq.append(f"item {i}")
+        del repo["k0"]
+        seq[0] = "first"
+
+        reader = bind(DataRepository[str, str], ports)
+        self.assertEqual(len(reader), 19)
+        self.assertEqual(
+            {reader[f"k{i}"] for i in range(1, 20)},
+            {f"value {i}" for i in range(1, 20)},
+        )
+        items = list(bind(DataSequence[str], ports))
+        self.assertEqual(items, ["first", *(f"item {i}" for i in range(1, 20))])
+        self.assertTrue(list(_FOLDER.glob("repository-*.seg")))
+        self.assertTrue(list(_FOLDER.glob("sequence-*.seg")))
+
+
+if __name__ == "__main__":
+    unittest.main()
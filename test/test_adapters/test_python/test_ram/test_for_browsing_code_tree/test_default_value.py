@@ -1,6 +1,9 @@
 import unittest
+from taew.domain.argument import POSITIONAL_OR_KEYWORD
 from taew.adapters.python.ram.for_browsing_code_tree.annotated_entity import (
+    Argument,
     DefaultValue,
+    ReturnValue,
 )
 
 
@@ -43,6 +46,22 @@ class TestDefaultValue(unittest.TestCase):
                 self.assertEqual(default_value.value, test_value)
                 self.assertIsInstance(default_value.value, expected_type)
 
+    def test_entities_are_slotted(self) -> None:
+        """Test annotated entities carry no per-instance __dict__."""
+        argument = Argument(
+            annotation=int,
+            spec=(int, ()),
+            description="",
+            _default_value=None,
+            _has_default=False,
+            kind=POSITIONAL_OR_KEYWORD,
+        )
+        returns = ReturnValue(annotation=int, spec=(int, ()), description="")
+
+        for entity in (argument, returns, argument.default):
+            with self.subTest(entity=type(entity).__name__):
+                self.assertFalse(hasattr(entity, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
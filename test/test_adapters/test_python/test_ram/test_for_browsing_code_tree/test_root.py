@@ -60,6 +60,28 @@ class TestRoot(unittest.TestCase):
         self.assertFalse("m" in new_root)
         self.assertFalse("p" in new_root)
 
+    def test_change_root_decodes_once(self) -> None:
+        import pickle
+        import base64
+
+        root = self._get_root()
+        encoded = base64.b64encode(pickle.dumps({"cached": {}})).decode("utf-8")
+        self.assertIs(root.change_root(encoded), root.change_root(encoded))
+
+    def test_compact_pickle_round_trip(self) -> None:
+        import sys
+        import pickle
+
+        root = self._get_root()
+        self.assertFalse(hasattr(root, "__dict__"))
+        self.assertFalse(hasattr(root["p"], "__dict__"))
+        restored = pickle.loads(pickle.dumps(root))
+        self.assertEqual(sorted(name for name, _ in restored.items()), ["m", "p"])
+        self.assertEqual(restored["m"].description, "module desc")
+        self.assertEqual(restored["p"].version, "1.0.0")  # type: ignore[union-attr]
+        name = next(iter(dict(restored.items())))
+        self.assertIs(name, sys.intern(name))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from taew.ports.for_browsing_code_tree import (
+    Root as RootProtocol,
+    is_class,
+    is_function,
+    is_module,
+    is_package,
+)
+
+_PACKAGE_NAME = "snapshot_fixture_pkg"
+
+_MODULE_SOURCE = '''"""Fixture module."""
+
+from typing import Optional
+
+
+def greet(name: str, punctuation: Optional[str] = "!") -> str:
+    """Greet someone.
+
+    Args:
+        name: Who to greet
+    """
+    return f"Hello, {name}{punctuation}"
+
+
+class Counter:
+    """Counts things."""
+
+    def __init__(self, start: int = 0) -> None:
+        self._value = start
+
+    def __call__(self, step: int) -> int:
+        """Advance the counter."""
+        self._value += step
+        return self._value
+'''
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = Path(tempfile.mkdtemp())
+        package = self._tmp / _PACKAGE_NAME
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "tools.py").write_text(_MODULE_SOURCE)
+        sys.path.insert(0, str(self._tmp))
+
+    def tearDown(self) -> None:
+        sys.path.remove(str(self._tmp))
+        for name in [n for n in sys.modules if n.startswith(_PACKAGE_NAME)]:
+            del sys.modules[name]
+        shutil.rmtree(self._tmp)
+
+    def _get_source_root(self) -> RootProtocol:
+        from taew.adapters.python.inspect.for_browsing_code_tree.root import Root
+
+        return Root(self._tmp)
+
+    def _get_snapshot_root(self) -> RootProtocol:
+        from taew.adapters.python.ram.for_browsing_code_tree.snapshot import (
+            dump,
+            load,
+        )
+
+        path = self._tmp / "tree.snapshot"
+        dump(self._get_source_root(), path, _PACKAGE_NAME)
+        for name in [n for n in sys.modules if n.startswith(_PACKAGE_NAME)]:
+            del sys.modules[name]
+        return load(path)
+
+    def test_structure_is_preserved(self) -> None:
+        root = self._get_snapshot_root()
+        package = root[_PACKAGE_NAME]
+        self.assertTrue(is_package(package))
+        module = package["tools"]  # type: ignore[index]
+        self.assertTrue(is_module(module))
+        self.assertEqual(module.description, "Fixture module.")
+        names = [name for name, _ in module.items()]
+        self.assertIn("Counter", names)
+        self.assertIn("greet", names)
+
+    def test_function_metadata_and_lazy_call(self) -> None:
+        root = self._get_snapshot_root()
+        greet = root[_PACKAGE_NAME]["tools"]["greet"]  # type: ignore[index]
+        assert is_function(greet)
+        self.assertEqual(greet.description, "Greet someone.")
+        args = dict(greet.items())
+        self.assertEqual(args["name"].annotation, str)
+        self.assertEqual(args["name"].description, "Who to greet")
+        self.assertTrue(args["name"].default.is_empty())
+        self.assertEqual(args["punctuation"].default.value, "!")
+        self.assertNotIn(f"{_PACKAGE_NAME}.tools", sys.modules)
+        self.assertEqual(greet("taew"), "Hello, taew!")
+        self.assertIn(f"{_PACKAGE_NAME}.tools", sys.modules)
+
+    def test_class_instantiation_and_lookup_methods(self) -> None:
+        root = self._get_snapshot_root()
+        counter = root[_PACKAGE_NAME]["tools"]["Counter"]  # type: ignore[index]
+        assert is_class(counter)
+        self.assertEqual(counter.description, "Counts things.")
+        self.assertTrue("__init__" in counter)
+        call = counter.get("__call__")
+        assert call is not None
+        self.assertEqual(call.description, "Advance the counter.")
+        instance = counter(5)
+        self.assertEqual(call(instance, 2), 7)
+        self.assertIs(counter.type_, type(instance))
+
+    def test_unsupported_version_raises(self) -> None:
+        import pickle
+        from taew.adapters.python.ram.for_browsing_code_tree.snapshot import loads
+
+        with self.assertRaises(ValueError):
+            loads(pickle.dumps((0, ())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,6 +110,82 @@ class TestDataRepository(unittest.TestCase):
         # Then
         self.assertEqual(len(perfect_scorers), 0)
 
+    def test_transaction_rolled_back_on_error(self) -> None:
+        """Test that a with block raising restores the previous contents."""
+        repo = self.create_mutable_data_repository()
+        repo["rec1"] = SampleRecord(id="rec1", name="Alice", score=95)
+        repo["rec2"] = SampleRecord(id="rec2", name="Bob", score=87)
+        before = dict(repo)
+
+        with self.assertRaises(RuntimeError):
+            with repo:
+                repo["rec1"] = SampleRecord(id="rec1", name="Alice", score=0)
+                del repo["rec2"]
+                with repo:
+                    repo["rec3"] = SampleRecord(id="rec3", name="Eve", score=1)
+                self.assertEqual(len(repo), 2)
+                raise RuntimeError("abort")
+
+        self.assertEqual(dict(repo), before)
+
+        with repo:
+            del repo["rec2"]
+        self.assertEqual(list(repo), ["rec1"])
+
+    def test_query_where_uses_secondary_indexes(self) -> None:
+        """Test structured predicates answered from field indexes."""
+        from taew.domain.query import In, Range
+
+        repo = MutableSampleRecordRepository(_indexes=("score",))
+        repo["rec1"] = SampleRecord(id="rec1", name="Alice", score=95)
+        repo["rec2"] = SampleRecord(id="rec2", name="Bob", score=87)
+        repo["rec3"] = SampleRecord(id="rec3", name="Charlie", score=92)
+        repo["rec2"] = SampleRecord(id="rec2", name="Bob", score=91)
+
+        def names(**kwargs: object) -> list[str]:
+            return [r.name for r in repo.query(sort_key=lambda r: r.id, **kwargs)]  # type: ignore[arg-type]
+
+        self.assertEqual(
+            names(where={"score": Range(ge=90, lt=95)}), ["Bob", "Charlie"]
+        )
+        self.assertEqual(names(where={"score": In(87, 95)}), ["Alice"])
+        self.assertEqual(
+            names(where={"score": Range(ge=90)}, filter_fn=lambda r: r.name != "Bob"),
+            ["Alice", "Charlie"],
+        )
+        # Unindexed fields are checked on the candidates, or on every value
+        self.assertEqual(names(where={"name": "Bob"}), ["Bob"])
+
+        with self.assertRaises(RuntimeError):
+            with repo:
+                del repo["rec1"]
+                repo["rec3"] = SampleRecord(id="rec3", name="Charlie", score=10)
+                raise RuntimeError("abort")
+        self.assertEqual(names(where={"score": Range(ge=92)}), ["Alice", "Charlie"])
+
+    def test_bulk_operations(self) -> None:
+        """Test get_many/set_many/delete_many with indexes and rollback."""
+        repo = MutableSampleRecordRepository(_indexes=("score",))
+        repo.set_many(
+            {
+                "rec1": SampleRecord(id="rec1", name="Alice", score=95),
+                "rec2": SampleRecord(id="rec2", name="Bob", score=87),
+            }
+        )
+        self.assertEqual(
+            [r.name for r in repo.get_many(["rec2", "nope"]).values()], ["Bob"]
+        )
+        self.assertEqual([r.name for r in repo.query(where={"score": 87})], ["Bob"])
+
+        with self.assertRaises(RuntimeError):
+            with repo:
+                repo.delete_many(["rec1", "nope"])
+                repo.set_many([("rec3", SampleRecord(id="rec3", name="Eve", score=87))])
+                self.assertEqual(sorted(repo), ["rec2", "rec3"])
+                raise RuntimeError("abort")
+        self.assertEqual(sorted(repo), ["rec1", "rec2"])
+        self.assertEqual([r.name for r in repo.query(where={"score": 87})], ["Bob"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,172 @@
+import shutil
+import sqlite3
+import unittest
+from contextlib import closing
+from pathlib import Path
+from typing import Any, TypeAlias
+from dataclasses import dataclass
+
+from taew.domain.query import In, Range
+from taew.ports.for_storing_data import (
+    DataRepository as DataRepositoryProtocol,
+    MutableDataRepository as MutableDataRepositoryProtocol,
+)
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+
+_FOLDER = Path("/tmp/sqlite3-repo-sample")
+_DATABASE = _FOLDER / "data.sqlite"
+
+
+@dataclass(frozen=True)
+class Person:
+    name: str
+    city: str
+    age: int
+
+
+Repo: TypeAlias = DataRepositoryProtocol[str, Person]
+MutRepo: TypeAlias = MutableDataRepositoryProtocol[str, Person]
+
+
+class TestSqliteDataRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_mutable(self, indexes: tuple[str, ...] = ()) -> MutRepo:
+        from taew.adapters.python.sqlite3.for_storing_data.mutable_data_repository import (
+            MutableDataRepository,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        repo: MutableDataRepository[str, Person] = MutableDataRepository(
+            _database=_DATABASE,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _key_type=str,
+            _indexes=indexes,
+            _serialize=(Serialize(), SerializeProtocol),
+        )
+        self.addCleanup(repo.close)
+        return repo
+
+    def _get_readonly(self) -> Repo:
+        from taew.adapters.python.sqlite3.for_storing_data.data_repository import (
+            DataRepository,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        repo: DataRepository[str, Person] = DataRepository(
+            _database=_DATABASE,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _key_type=str,
+        )
+        self.addCleanup(repo.close)
+        return repo
+
+    def _fill(self, repo: MutRepo) -> None:
+        repo.set_many(
+            {
+                "ann": Person("ann", "Paris", 30),
+                "bob": Person("bob", "Rome", 17),
+                "cid": Person("cid", "Paris", 65),
+                "dan": Person("dan", "Oslo", 42),
+            }
+        )
+
+    def test_mapping_operations(self) -> None:
+        m = self._get_mutable()
+        self._fill(m)
+        m["eve"] = Person("eve", "Rome", 25)
+        del m["bob"]
+        with self.assertRaises(KeyError):
+            del m["bob"]
+        with self.assertRaises(KeyError):
+            m["bob"]
+
+        r = self._get_readonly()
+        self.assertEqual(len(r), 4)
+        self.assertEqual(sorted(r), ["ann", "cid", "dan", "eve"])
+        self.assertIn("eve", r)
+        self.assertNotIn("bob", r)
+        self.assertEqual(r["dan"], Person("dan", "Oslo", 42))
+        self.assertEqual(
+            r.get_many(["ann", "bob", "dan"]),
+            {"ann": Person("ann", "Paris", 30), "dan": Person("dan", "Oslo", 42)},
+        )
+
+    def test_transaction_commits_or_rolls_back(self) -> None:
+        m = self._get_mutable()
+        self._fill(m)
+        with self.assertRaises(RuntimeError):
+            with m:
+                m["ann"] = Person("ann", "Rome", 31)
+                with m:
+                    m.delete_many(["bob", "zed"])
+                self.assertNotIn("bob", m)
+                raise RuntimeError("abort")
+        self.assertEqual(m["ann"].age, 30)
+        self.assertEqual(len(m), 4)
+
+        with m:
+            del m["bob"]
+            # Not visible to other connections before the commit
+            self.assertEqual(len(self._get_readonly()), 4)
+        self.assertEqual(len(self._get_readonly()), 3)
+
+    def test_where_and_paging_are_pushed_to_sql(self) -> None:
+        m = self._get_mutable(indexes=("city", "age"))
+        self._fill(m)
+        statements: list[str] = []
+        m._connection.set_trace_callback(statements.append)  # type: ignore[attr-defined]
+
+        def names(**kwargs: Any) -> list[str]:
+            return [p.name for p in m.query(**kwargs)]
+
+        self.assertEqual(
+            sorted(names(where={"city": "Paris", "age": Range(lt=40)})), ["ann"]
+        )
+        self.assertIn('"field_city" IS', statements[-1])
+        self.assertEqual(sorted(names(where={"age": In(17, 42, None)})), ["bob", "dan"])
+        self.assertEqual(names(limit=2, offset=1), ["bob", "cid"])
+        self.assertIn("LIMIT", statements[-1])
+        self.assertEqual(
+            sorted(
+                names(where={"age": Range(ge=18)}, filter_fn=lambda p: p.city != "Oslo")
+            ),
+            ["ann", "cid"],
+        )
+        # Sorted by a Python key, and on an unindexed field
+        self.assertEqual(
+            names(where={"name": In("bob", "dan")}, sort_key=lambda p: -p.age),
+            ["dan", "bob"],
+        )
+        with self.assertRaises(ValueError):
+            m.query(limit=-1)
+
+    def test_indexes_added_to_existing_table(self) -> None:
+        self._fill(self._get_mutable())
+        m = self._get_mutable(indexes=("age",))
+        self.assertEqual([p.name for p in m.query(where={"age": 65})], ["cid"])
+        with closing(sqlite3.connect(_DATABASE)) as connection:
+            info = connection.execute('PRAGMA table_info("repository")')
+            columns = {row[1] for row in info}
+        self.assertIn("field_age", columns)
+
+    def test_invalid_identifiers_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self._get_mutable(indexes=("age; DROP TABLE repository",))
+
+
+if __name__ == "__main__":
+    unittest.main()
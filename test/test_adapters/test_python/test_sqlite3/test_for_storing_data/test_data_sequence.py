@@ -0,0 +1,119 @@
+import shutil
+import unittest
+from pathlib import Path
+from typing import TypeAlias
+from unittest.mock import patch
+
+from taew.ports.for_storing_data import (
+    DataSequence as DataSequenceProtocol,
+    MutableDataSequence as MutableDataSequenceProtocol,
+)
+from taew.ports.for_serializing_objects import Serialize as SerializeProtocol
+from taew.ports.for_serializing_objects import Deserialize as DeserializeProtocol
+
+_FOLDER = Path("/tmp/sqlite3-seq-sample")
+_DATABASE = _FOLDER / "data.sqlite"
+_MODULE = "taew.adapters.python.sqlite3.for_storing_data.mutable_data_sequence"
+
+DataSeq: TypeAlias = DataSequenceProtocol[str]
+MutableDataSeq: TypeAlias = MutableDataSequenceProtocol[str]
+
+
+class TestSqliteDataSequence(unittest.TestCase):
+    def setUp(self) -> None:
+        if _FOLDER.exists():
+            shutil.rmtree(_FOLDER)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_mutable(self) -> MutableDataSeq:
+        from taew.adapters.python.sqlite3.for_storing_data.mutable_data_sequence import (
+            MutableDataSequence,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.serialize import (
+            Serialize,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        seq: MutableDataSequence[str] = MutableDataSequence(
+            _database=_DATABASE,
+            _deserialize=(Deserialize(), DeserializeProtocol),
+            _serialize=(Serialize(), SerializeProtocol),
+        )
+        self.addCleanup(seq.close)
+        return seq
+
+    def _get_readonly(self) -> DataSeq:
+        from taew.adapters.python.sqlite3.for_storing_data.data_sequence import (
+            DataSequence,
+        )
+        from taew.adapters.python.pickle.for_serializing_objects.deserialize import (
+            Deserialize,
+        )
+
+        seq: DataSequence[str] = DataSequence(
+            _database=_DATABASE, _deserialize=(Deserialize(), DeserializeProtocol)
+        )
+        self.addCleanup(seq.close)
+        return seq
+
+    def test_sequence_operations(self) -> None:
+        m = self._get_mutable()
+        m.extend(["b", "d"])
+        m.insert(0, "a")
+        m.insert(2, "c")
+        m.insert(-100, "start")
+        m.append("e")
+        m[1] = "A"
+        del m[0]
+        self.assertEqual(list(m), ["A", "b", "c", "d", "e"])
+        self.assertEqual(m[-1], "e")
+        self.assertEqual(m[1:4], ["b", "c", "d"])
+        self.assertEqual(m[::-2], ["e", "c", "A"])
+        self.assertEqual(m[10:], [])
+        with self.assertRaises(IndexError):
+            m[5]
+        with self.assertRaises(TypeError):
+            m[0:1] = ["x"]
+
+        r = self._get_readonly()
+        self.assertEqual(len(r), 5)
+        self.assertEqual([r[i] for i in range(5)], ["A", "b", "c", "d", "e"])
+        self.assertEqual(list(r.query(filter_fn=lambda v: v > "b")), ["c", "d", "e"])
+
+    def test_inserts_take_free_positions_and_respace_when_full(self) -> None:
+        m = self._get_mutable()
+        m.extend(["first", "last"])
+        with patch(f"{_MODULE}.MutableDataSequence._respace", autospec=True) as respace:
+            for i in range(20):
+                m.insert(1, f"x{i}")
+        respace.assert_not_called()
+        # Halving the gap of 2**32 leaves room for 31 inserts in a row
+        for i in range(20, 40):
+            m.insert(1, f"x{i}")
+        expected = ["first", *(f"x{i}" for i in reversed(range(40))), "last"]
+        self.assertEqual(list(m), expected)
+        self.assertEqual(list(self._get_readonly()), expected)
+
+    def test_transaction_rolls_back_order(self) -> None:
+        m = self._get_mutable()
+        m.extend(["a", "b", "c"])
+        with self.assertRaises(RuntimeError):
+            with m:
+                m.insert(1, "x")
+                del m[0]
+                m[0] = "y"
+                raise RuntimeError("abort")
+        self.assertEqual(list(m), ["a", "b", "c"])
+        self.assertEqual(m[1:], ["b", "c"])
+
+        with m:
+            m.insert(1, "x")
+        self.assertEqual(list(self._get_readonly()), ["a", "x", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import shutil
+import unittest
+from pathlib import Path
+from typing import Any, cast
+from dataclasses import dataclass
+
+from taew.domain.configuration import PortConfigurationDict
+from taew.ports import for_storing_data as for_storing_port
+from taew.ports.for_storing_data import MutableDataRepository, MutableDataSequence
+from taew.adapters.python.pickle.for_serializing_objects.for_configuring_adapters import (
+    Configure as PickleConfigure,
+)
+from taew.adapters.python.sqlite3.for_storing_data import (
+    for_configuring_adapters as sqlite3_configuring,
+)
+
+_FOLDER = Path("/tmp/sqlite3-configure-sample")
+
+
+@dataclass(eq=False, frozen=True)
+class SqliteConfigure(sqlite3_configuring.Configure):
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_package", sqlite3_configuring.__package__)
+        object.__setattr__(self, "_file", sqlite3_configuring.__file__)
+
+
+class TestSqliteConfigure(unittest.TestCase):
+    def setUp(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(_FOLDER, ignore_errors=True)
+
+    def _get_configure(self, **kwargs: Any) -> SqliteConfigure:
+        return SqliteConfigure(
+            _database=_FOLDER / "data.sqlite",
+            _serialization=PickleConfigure(_ports="taew.ports", _root_marker="/taew"),
+            _ports="taew.ports",
+            _root_marker="/taew",
+            **kwargs,
+        )
+
+    def test_kwargs_and_nested_serialization_ports(self) -> None:
+        mapping = self._get_configure(_indexes=("age",))()
+
+        pc = cast(PortConfigurationDict, mapping[for_storing_port])
+        self.assertEqual(pc.adapter, "taew.adapters.python.sqlite3")
+        self.assertEqual(pc.kwargs["_indexes"], ("age",))
+        self.assertNotIn("_table", pc.kwargs)
+        self.assertTrue(pc.ports)
+
+    def test_binds_repository_and_sequence(self) -> None:
+        from taew.adapters.launch_time.for_binding_interfaces.bind import bind
+        from taew.adapters.python.inspect.for_browsing_code_tree.for_configuring_adapters import (
+            Configure as BrowseCodeTree,
+        )
+
+        ports = self._get_configure(_table="people")()
+        ports.update(BrowseCodeTree(_root_path=Path("./"))())
+        repo = bind(MutableDataRepository[str, int], ports)
+        self.addCleanup(repo.close)  # type: ignore[attr-defined]
+        repo["a"] = 1
+        self.assertEqual(dict(repo.items()), {"a": 1})
+
+        ports = self._get_configure()()
+        ports.update(BrowseCodeTree(_root_path=Path("./"))())
+        seq = bind(MutableDataSequence[int], ports)
+        self.addCleanup(seq.close)  # type: ignore[attr-defined]
+        seq.extend([1, 2])
+        seq.insert(1, 3)
+        self.assertEqual(list(seq), [1, 3, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from typing import cast
+
+from taew.domain.configuration import PortConfigurationDict
+from taew.ports import for_browsing_code_tree as for_browsing_port
+from taew.ports.for_configuring_adapters import Configure as ConfigureProtocol
+
+
+class TestSysModulesRootConfigure(unittest.TestCase):
+    def _get_configure(self) -> ConfigureProtocol:
+        from taew.adapters.python.sys.for_browsing_code_tree.for_configuring_adapters import (
+            Configure,
+        )
+
+        return Configure()
+
+    def test_builds_ports_mapping_with_kwargs(self) -> None:
+        mapping = self._get_configure()()
+
+        self.assertIn(for_browsing_port, mapping)
+        pc = cast(PortConfigurationDict, mapping[for_browsing_port])
+        self.assertEqual(pc.adapter, "taew.adapters.python.sys")
+        self.assertEqual(pc.kwargs, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
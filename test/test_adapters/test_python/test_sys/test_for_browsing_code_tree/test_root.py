@@ -0,0 +1,127 @@
+import sys
+import unittest
+from types import ModuleType
+from taew.ports.for_browsing_code_tree import (
+    Package as PackageProtocol,
+    Root as RootProtocol,
+    is_class,
+    is_function,
+    is_module,
+    is_package,
+)
+
+_PACKAGE_NAME = "in_memory_fixture_pkg"
+
+_TOOLS_SOURCE = '''"""Tools module.
+
+Longer description.
+"""
+
+
+def greet(name: str) -> str:
+    """Greet someone."""
+    return f"Hello, {name}"
+
+
+class Counter:
+    """Counts things."""
+'''
+
+
+def _module(name: str, source: str, package: bool = False) -> ModuleType:
+    module = ModuleType(name)
+    if package:
+        module.__path__ = []  # no finder can locate anything on it
+    exec(compile(source, f"<{name}>", "exec"), module.__dict__)
+    sys.modules[name] = module
+    return module
+
+
+class TestSysModulesRoot(unittest.TestCase):
+    def setUp(self) -> None:
+        _module(_PACKAGE_NAME, '"""Fixture."""\n__version__ = "1.2"\n', package=True)
+        _module(f"{_PACKAGE_NAME}.tools", _TOOLS_SOURCE)
+        _module(f"{_PACKAGE_NAME}.plain", "", package=True)
+        _module(f"{_PACKAGE_NAME}.plain.cmd", "def cmd(): pass\n")
+        _module(f"{_PACKAGE_NAME}.api", "def serve(): pass\n", package=True)
+
+    def tearDown(self) -> None:
+        for name in [n for n in sys.modules if n.startswith(_PACKAGE_NAME)]:
+            del sys.modules[name]
+
+    def _get_root(self) -> RootProtocol:
+        from taew.adapters.python.sys.for_browsing_code_tree.root import Root
+
+        return Root()
+
+    def _get_package(self) -> PackageProtocol:
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        return package
+
+    def test_lookup_without_source_files(self) -> None:
+        root = self._get_root()
+        self.assertTrue(_PACKAGE_NAME in root)
+        self.assertIn(_PACKAGE_NAME, dict(root.items()))
+        self.assertIsNone(root.get("missing_in_memory_module"))
+        with self.assertRaises(KeyError):
+            root["missing_in_memory_module"]
+
+    def test_package_metadata_from_module(self) -> None:
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        self.assertEqual(package.description, "Fixture.")
+        self.assertEqual(package.version, "1.2")
+        self.assertEqual(
+            sorted(name for name, _ in package.items()), ["api", "plain", "tools"]
+        )
+
+    def test_module_items(self) -> None:
+        tools = self._get_package()["tools"]
+        assert is_module(tools)
+        self.assertEqual(tools.description, "Tools module.\n\nLonger description.")
+        self.assertEqual(
+            sorted(name for name, _ in tools.items()), ["Counter", "greet"]
+        )
+        greet = tools["greet"]
+        assert is_function(greet)
+        self.assertEqual(greet("taew"), "Hello, taew")
+        self.assertTrue(is_class(tools["Counter"]))
+        self.assertFalse("_private" in tools)
+
+    def test_package_defining_members_exposes_them(self) -> None:
+        api = self._get_package()["api"]
+        assert is_package(api)
+        self.assertEqual([name for name, _ in api.items()], ["serve"])
+        self.assertTrue(is_function(api["serve"]))
+
+    def test_package_declaring_all_exposes_members(self) -> None:
+        # Re-exports only, which the source based Package also treats as
+        # the package module
+        _module(
+            f"{_PACKAGE_NAME}.facade",
+            f"from {_PACKAGE_NAME}.tools import greet\n__all__ = ['greet']\n",
+            package=True,
+        )
+        facade = self._get_package()["facade"]
+        assert is_package(facade)
+        self.assertEqual([name for name, _ in facade.items()], ["greet"])
+
+    def test_nested_package_and_name_prefix(self) -> None:
+        from taew.adapters.python.sys.for_browsing_code_tree.root import Root
+
+        root = Root(_PACKAGE_NAME)
+        plain = root["plain"]
+        assert is_package(plain)
+        self.assertTrue(is_module(plain["cmd"]))
+        self.assertEqual(
+            sorted(name for name, _ in root.items()), ["api", "plain", "tools"]
+        )
+
+    def test_change_root_keeps_modules(self) -> None:
+        root = self._get_root().change_root("/elsewhere")
+        self.assertTrue(_PACKAGE_NAME in root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import sys
+import shutil
+import zipfile
+import zipimport
+import tempfile
+import unittest
+from pathlib import Path
+from taew.ports.for_browsing_code_tree import (
+    Root as RootProtocol,
+    is_class,
+    is_function,
+    is_module,
+    is_package,
+)
+
+_PACKAGE_NAME = "zipapp_fixture_pkg"
+
+_MODULE_SOURCE = '''"""Tools module."""
+
+
+def greet(name: str) -> str:
+    """Greet someone."""
+    return f"Hello, {name}"
+
+
+class Counter:
+    """Counts things."""
+'''
+
+
+class TestZipRoot(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = Path(tempfile.mkdtemp())
+        self._archive = self._tmp / "app.pyz"
+        with zipfile.ZipFile(self._archive, "w") as archive:
+            archive.writestr(
+                f"{_PACKAGE_NAME}/__init__.py", '"""Fixture."""\n__version__ = "1.2"\n'
+            )
+            archive.writestr(f"{_PACKAGE_NAME}/tools.py", _MODULE_SOURCE)
+            archive.writestr(f"{_PACKAGE_NAME}/plain/cmd.py", "def cmd(): pass\n")
+            archive.writestr("__main__.py", "")
+            archive.writestr("README.txt", "not a module")
+
+    def tearDown(self) -> None:
+        if str(self._archive) in sys.path:
+            sys.path.remove(str(self._archive))
+        for name in [n for n in sys.modules if n.startswith(_PACKAGE_NAME)]:
+            del sys.modules[name]
+        shutil.rmtree(self._tmp)
+
+    def _get_root(self) -> RootProtocol:
+        from taew.adapters.python.zipfile.for_browsing_code_tree.root import Root
+
+        return Root(self._archive)
+
+    def test_layout_from_central_directory(self) -> None:
+        root = self._get_root()
+        self.assertEqual(
+            sorted(name for name, _ in root.items()), ["__main__", _PACKAGE_NAME]
+        )
+        self.assertTrue(_PACKAGE_NAME in root)
+        self.assertFalse("README" in root)
+        self.assertIsNone(root.get("missing"))
+        with self.assertRaises(KeyError):
+            root["missing"]
+
+    def test_package_metadata_parsed_from_archive(self) -> None:
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        self.assertEqual(package.description, "Fixture.")
+        self.assertEqual(package.version, "1.2")
+        self.assertNotIn(_PACKAGE_NAME, sys.modules)
+
+    def test_folder_package_lists_modules(self) -> None:
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        plain = package["plain"]
+        assert is_package(plain)
+        self.assertEqual([name for name, _ in plain.items()], ["cmd"])
+        self.assertTrue(is_module(plain["cmd"]))
+
+    def test_module_imported_by_zipimport(self) -> None:
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        tools = package["tools"]
+        assert is_module(tools)
+        self.assertEqual(tools.description, "Tools module.")
+        greet = tools["greet"]
+        assert is_function(greet)
+        self.assertEqual(greet("taew"), "Hello, taew")
+        self.assertTrue(is_class(tools["Counter"]))
+        module = sys.modules[f"{_PACKAGE_NAME}.tools"]
+        self.assertIsInstance(module.__loader__, zipimport.zipimporter)
+
+    def test_archive_first_on_sys_path(self) -> None:
+        sys.path.append(str(self._tmp))  # e.g. site-packages, checked later
+        self.addCleanup(sys.path.remove, str(self._tmp))
+        self._get_root()
+        self.assertEqual(sys.path[0], str(self._archive))
+
+    @unittest.skipUnless(Path("/proc/self/fd").is_dir(), "needs /proc")
+    def test_archive_not_kept_open(self) -> None:
+        def open_archives() -> int:
+            fds = Path("/proc/self/fd")
+            return sum(
+                1
+                for fd in fds.iterdir()
+                if os.path.realpath(fd) == os.path.realpath(self._archive)
+            )
+
+        package = self._get_root()[_PACKAGE_NAME]
+        assert is_package(package)
+        self.assertEqual(package.description, "Fixture.")
+        self.assertEqual(open_archives(), 0)
+
+    def test_change_root(self) -> None:
+        root = self._get_root().change_root(str(self._archive))
+        self.assertTrue(_PACKAGE_NAME in root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from benchmarks.tree import TreeShape, generate
+from benchmarks.suite import CASES, Result, run
+from benchmarks.results import compare, dumps, loads
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self) -> None:
+        self._root = Path(tempfile.mkdtemp()).resolve()
+        self._shape = TreeShape(2, 2, 2)
+        generate(self._root, self._shape)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._root)
+
+    def test_all_cases_run_on_synthetic_tree(self) -> None:
+        results = run(self._root, self._shape, CASES, repeat=1)
+        self.assertEqual([r.name for r in results], list(CASES))
+        self.assertTrue(all(r.best > 0 for r in results))
+
+    def test_results_round_trip_and_compare(self) -> None:
+        baseline = [Result("bind_deep", self._shape, 1.0, 1.0, (1.0,))]
+        current = [
+            Result("bind_deep", self._shape, 1.5, 1.5, (1.5,)),
+            Result("cli_help", self._shape, 1.0, 1.0, (1.0,)),
+        ]
+        self.assertEqual(loads(dumps(current)), current)
+        (comparison,) = compare(baseline, loads(dumps(current)))
+        self.assertEqual(comparison.ratio, 1.5)
+        self.assertTrue(comparison.is_regression(0.1))
+        self.assertFalse(comparison.is_regression(0.6))
+
+    def test_unsupported_version_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            loads('{"version": 0, "results": []}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from typing import Any, cast
 from taew.ports.for_storing_data import (
+    DataRepository as DataRepositoryProtocol,
+    DataSequence as DataSequenceProtocol,
     MutableDataRepository as MutableDataRepositoryProtocol,
     MutableDataSequence as MutableDataSequenceProtocol,
 )
@@ -204,6 +206,35 @@ class TestPortDefaultImplementations(unittest.TestCase):
         except ValueError as e:
             repo.__exit__(type(e), e, e.__traceback__)
 
+    def test_mutable_repository_bulk_defaults(self) -> None:
+        """Test get_many/set_many/delete_many default implementations."""
+
+        class TestRepository(MutableDataRepositoryProtocol[str, int]):
+            def __init__(self) -> None:
+                self._data: dict[str, int] = {}
+
+            def __getitem__(self, key: str) -> int:
+                return self._data[key]
+
+            def __setitem__(self, key: str, value: int) -> None:
+                self._data[key] = value
+
+            def __delitem__(self, key: str) -> None:
+                del self._data[key]
+
+            def __iter__(self):  # type: ignore
+                return iter(self._data)
+
+            def __len__(self) -> int:
+                return len(self._data)
+
+        repo = TestRepository()
+        repo.set_many({"a": 1, "b": 2})
+        repo.set_many([("c", 3)])
+        self.assertEqual(repo.get_many(["a", "c", "missing"]), {"a": 1, "c": 3})
+        repo.delete_many(["a", "missing"])
+        self.assertEqual(dict(repo), {"b": 2, "c": 3})
+
     def test_mutable_sequence_context_manager_defaults(self) -> None:
         """Test MutableDataSequence context manager default implementations."""
 
@@ -242,5 +273,80 @@ class TestPortDefaultImplementations(unittest.TestCase):
             seq.__exit__(type(e), e, e.__traceback__)
 
 
+class TestPortDefaultQueryPaging(unittest.TestCase):
+    """Test limit/offset handling of the default query implementations."""
+
+    def _get_repository(self, count: int) -> DataRepositoryProtocol[int, int]:
+        """Factory method to create a repository counting value reads."""
+
+        class CountingRepository(DataRepositoryProtocol[int, int]):
+            def __init__(self) -> None:
+                self.reads = 0
+
+            def __getitem__(self, key: int) -> int:
+                self.reads += 1
+                return key * 7 % count
+
+            def __iter__(self):  # type: ignore
+                return iter(range(count))
+
+            def __len__(self) -> int:
+                return count
+
+        return CountingRepository()
+
+    def test_unsorted_query_is_lazy(self) -> None:
+        """Test that unsorted results are read only as far as consumed."""
+        repo = self._get_repository(1000)
+        results = repo.query(filter_fn=lambda v: v % 2 == 0, offset=1, limit=3)
+        self.assertEqual(repo.reads, 0)  # type: ignore[attr-defined]
+        self.assertEqual(list(results), [14, 28, 42])
+        self.assertLess(repo.reads, 10)  # type: ignore[attr-defined]
+
+    def test_sorted_query_with_limit_matches_full_sort(self) -> None:
+        """Test that top-k paging returns the slices of a full stable sort."""
+        repo = self._get_repository(100)
+        values = sorted(repo.values(), key=lambda v: v % 10)
+        for reverse in (False, True):
+            expected = sorted(values, key=lambda v: v % 10, reverse=reverse)
+            for offset, limit in ((0, 5), (3, 10), (95, 10), (0, 0)):
+                with self.subTest(reverse=reverse, offset=offset, limit=limit):
+                    page = repo.query(
+                        where=None,
+                        sort_key=lambda v: v % 10,
+                        reverse=reverse,
+                        offset=offset,
+                        limit=limit,
+                    )
+                    self.assertEqual(list(page), expected[offset : offset + limit])
+
+    def test_negative_window_rejected(self) -> None:
+        """Test that negative limit or offset raise ValueError."""
+        repo = self._get_repository(3)
+        with self.assertRaises(ValueError):
+            repo.query(limit=-1)
+        with self.assertRaises(ValueError):
+            repo.query(offset=-1)
+
+    def test_sequence_query_pages(self) -> None:
+        """Test limit and offset on the DataSequence default query."""
+
+        class ListSequence(DataSequenceProtocol[int]):
+            def __getitem__(self, index: Any) -> Any:
+                return list(range(10))[index]
+
+            def __len__(self) -> int:
+                return 10
+
+        seq = ListSequence()
+        self.assertEqual(
+            list(seq.query(filter_fn=lambda v: v > 2, offset=2, limit=3)), [5, 6, 7]
+        )
+        self.assertEqual(
+            list(seq.query(filter_fn=lambda v: True, sort_key=lambda v: -v, limit=2)),
+            [9, 8],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+from typing import IO, Any
+from collections.abc import Iterable, Iterator
+from unittest.mock import patch
+
+from taew.domain.query import paginate
+from taew.utils.external_sort import ExternalSort
+from taew.adapters.python.pickle.for_serializing_objects.serialize import Serialize
+from taew.adapters.python.pickle.for_serializing_objects.deserialize import Deserialize
+
+
+def _get_sort(threshold: int) -> ExternalSort:
+    return ExternalSort(Serialize(), Deserialize(), threshold)
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(42)
+        self.values = [(rng.randrange(20), i) for i in range(500)]
+
+    def test_small_input_is_sorted_in_memory(self) -> None:
+        sort = _get_sort(1000)
+        with patch.object(ExternalSort, "_spill") as spill:
+            result = list(sort(self.values, lambda v: v[0], False))
+        spill.assert_not_called()
+        self.assertEqual(result, sorted(self.values, key=lambda v: v[0]))
+
+    def test_spilled_runs_merge_as_a_stable_sort(self) -> None:
+        sort = _get_sort(37)
+        for reverse in (False, True):
+            with self.subTest(reverse=reverse):
+                result = list(sort(self.values, lambda v: v[0], reverse))
+                expected = sorted(self.values, key=lambda v: v[0], reverse=reverse)
+                self.assertEqual(result, expected)
+
+    def test_many_runs_are_merged_in_passes(self) -> None:
+        sort = _get_sort(10)
+        with patch("taew.utils.external_sort._MAX_FAN_IN", 4):
+            with patch.object(ExternalSort, "_spill", wraps=sort._spill) as spill:
+                result = list(sort(self.values, lambda v: v[0], False))
+        self.assertEqual(result, sorted(self.values, key=lambda v: v[0]))
+        # 50 runs, merged into 13, then 4
+        self.assertEqual(spill.call_count, 50 + 13 + 4)
+
+    def test_failed_merge_pass_closes_run_files(self) -> None:
+        sort = _get_sort(10)
+        spilled: list[IO[bytes]] = []
+        merge, spill_ = sort._merge, sort._spill
+
+        def spill(values: Iterable[Any]) -> IO[bytes]:
+            spilled.append(spill_(values))
+            return spilled[-1]
+
+        def fail_second(*args: Any) -> Iterator[Any]:
+            if merges.call_count == 2:
+                raise OSError("merge failed")
+            return merge(*args)
+
+        with patch("taew.utils.external_sort._MAX_FAN_IN", 4):
+            with (
+                patch.object(ExternalSort, "_spill", side_effect=spill),
+                patch.object(ExternalSort, "_merge", side_effect=fail_second) as merges,
+            ):
+                with self.assertRaises(OSError):
+                    list(sort(self.values, lambda v: v[0], False))
+        self.assertEqual(len(spilled), 50 + 1)
+        self.assertTrue(all(f.closed for f in spilled))
+
+    def test_paginate_uses_sort_without_limit(self) -> None:
+        sort = _get_sort(37)
+        result = list(
+            paginate(self.values, sort_key=lambda v: v[0], offset=490, sort=sort)
+        )
+        self.assertEqual(result, sorted(self.values, key=lambda v: v[0])[490:])
+
+    def test_threshold_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            _get_sort(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from typing import NamedTuple
+from taew.domain.query import In, Range, matches
+from taew.utils.indexes import Indexes
+
+
+class Person(NamedTuple):
+    name: str
+    city: str
+    age: int
+
+
+_PEOPLE = {
+    "ann": Person("ann", "Paris", 30),
+    "bob": Person("bob", "Rome", 17),
+    "cid": Person("cid", "Paris", 65),
+    "dan": Person("dan", "Oslo", 42),
+}
+
+
+class TestMatches(unittest.TestCase):
+    def test_predicates(self) -> None:
+        ann = _PEOPLE["ann"]
+        self.assertTrue(matches(ann, {"city": "Paris", "age": Range(ge=30, lt=31)}))
+        self.assertFalse(matches(ann, {"age": Range(gt=30)}))
+        self.assertTrue(matches(ann, {"city": In("Rome", "Paris")}))
+        self.assertFalse(matches(ann, {"city": In("Rome")}))
+        self.assertTrue(matches({"city": "Paris"}, {"city": "Paris"}))
+
+
+class TestIndexes(unittest.TestCase):
+    def _get_indexes(self) -> Indexes:
+        indexes = Indexes(("city", "age"))
+        for key, person in _PEOPLE.items():
+            indexes.put(key, person)
+        return indexes
+
+    def test_equality_in_and_range(self) -> None:
+        indexes = self._get_indexes()
+        self.assertEqual(indexes.candidates({"city": "Paris"}), {"ann", "cid"})
+        self.assertEqual(
+            indexes.candidates({"city": In("Rome", "Oslo")}), {"bob", "dan"}
+        )
+        self.assertEqual(
+            indexes.candidates({"age": Range(ge=30, le=42)}), {"ann", "dan"}
+        )
+        self.assertEqual(indexes.candidates({"age": Range(gt=30, lt=65)}), {"dan"})
+        self.assertEqual(
+            indexes.candidates({"city": "Paris", "age": Range(lt=40)}), {"ann"}
+        )
+
+    def test_unindexed_fields_are_left_to_the_caller(self) -> None:
+        indexes = self._get_indexes()
+        self.assertIsNone(indexes.candidates({"name": "ann"}))
+        self.assertEqual(indexes.candidates({"name": "ann", "city": "Rome"}), {"bob"})
+
+    def test_put_replaces_and_discard_removes(self) -> None:
+        indexes = self._get_indexes()
+        indexes.candidates({"age": Range(ge=0)})  # builds the sorted view
+        indexes.put("ann", Person("ann", "Rome", 50))
+        indexes.discard("dan")
+        indexes.discard("missing")
+        self.assertEqual(indexes.candidates({"city": "Paris"}), {"cid"})
+        self.assertEqual(indexes.candidates({"city": "Oslo"}), set())
+        self.assertEqual(indexes.candidates({"age": Range(ge=40, lt=60)}), {"ann"})
+
+
+if __name__ == "__main__":
+    unittest.main()
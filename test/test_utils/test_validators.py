@@ -0,0 +1,58 @@
+import unittest
+from inspect import Parameter
+from typing import Any, Optional, Protocol, Union
+from taew.utils.validators import compile_validator
+from taew.domain.argument import VAR_KEYWORD, VAR_POSITIONAL
+
+
+class _Greeter(Protocol):
+    def greet(self) -> str: ...
+
+
+class TestCompileValidator(unittest.TestCase):
+    def test_plain_type(self) -> None:
+        is_valid = compile_validator(int)
+        self.assertTrue(is_valid(1))
+        self.assertFalse(is_valid("1"))
+
+    def test_permissive_annotations(self) -> None:
+        for annotation in (Any, Parameter.empty, _Greeter, list[int]):
+            with self.subTest(annotation=annotation):
+                self.assertTrue(compile_validator(annotation)(object()))
+
+    def test_optional_and_union(self) -> None:
+        for annotation in (Optional[int], int | None):
+            with self.subTest(annotation=annotation):
+                is_valid = compile_validator(annotation)
+                self.assertTrue(is_valid(None))
+                self.assertTrue(is_valid(1))
+                self.assertFalse(is_valid("1"))
+        is_valid = compile_validator(Union[int, str])
+        self.assertTrue(is_valid("1"))
+        self.assertFalse(is_valid(1.0))
+
+    def test_type_any(self) -> None:
+        is_valid = compile_validator(type[Any])
+        self.assertTrue(is_valid(int))
+        self.assertFalse(is_valid(1))
+
+    def test_var_positional(self) -> None:
+        is_valid = compile_validator(int, VAR_POSITIONAL)
+        self.assertTrue(is_valid((1, 2)))
+        self.assertFalse(is_valid((1, "2")))
+        self.assertFalse(is_valid([1, 2]))
+        self.assertTrue(compile_validator(Parameter.empty, VAR_POSITIONAL)((1, "2")))
+
+    def test_var_keyword(self) -> None:
+        is_valid = compile_validator(str, VAR_KEYWORD)
+        self.assertTrue(is_valid({"a": "1"}))
+        self.assertFalse(is_valid({"a": 1}))
+        self.assertFalse(is_valid(("a", "1")))
+
+    def test_cached(self) -> None:
+        self.assertIs(compile_validator(Optional[int]), compile_validator(int | None))
+        self.assertIsNot(compile_validator(int), compile_validator(int, VAR_POSITIONAL))
+
+
+if __name__ == "__main__":
+    unittest.main()